@@ -0,0 +1,2739 @@
+# -*- coding: utf-8 -*-
+# (c) Matthias Dellweg (ATIX AG) 2017
+
+# pylint: disable=raise-missing-from
+# pylint: disable=super-with-arguments
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import errno
+import glob
+import hashlib
+import json
+import os
+import operator
+import re
+import shutil
+import tempfile
+import time
+import traceback
+
+from contextlib import contextmanager
+
+from collections import defaultdict, deque
+from functools import wraps
+from itertools import islice
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib, env_fallback
+from ansible.module_utils._text import to_bytes, to_native
+from ansible.module_utils import six
+
+try:
+    from ansible_collections.theforeman.foreman.plugins.module_utils._version import LooseVersion
+except ImportError:
+    from plugins.module_utils._version import LooseVersion
+
+try:
+    try:
+        from ansible_collections.theforeman.foreman.plugins.module_utils import _apypie as apypie
+    except ImportError:
+        from plugins.module_utils import _apypie as apypie
+    import requests.exceptions
+    HAS_APYPIE = True
+    APYPIE_IMP_ERR = None
+    inflector = apypie.Inflector()
+except ImportError:
+    HAS_APYPIE = False
+    APYPIE_IMP_ERR = traceback.format_exc()
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    import yaml
+    HAS_PYYAML = True
+    PYYAML_IMP_ERR = None
+except ImportError:
+    HAS_PYYAML = False
+    PYYAML_IMP_ERR = traceback.format_exc()
+
+parameter_foreman_spec = dict(
+    id=dict(invisible=True),
+    name=dict(required=True),
+    value=dict(type='raw', required=True),
+    parameter_type=dict(default='string', choices=['string', 'boolean', 'integer', 'real', 'array', 'hash', 'yaml', 'json']),
+)
+
+parameter_ansible_spec = {k: v for (k, v) in parameter_foreman_spec.items() if k != 'id'}
+
+_PLUGIN_RESOURCES = {
+    'ansible': 'ansible_roles',
+    'discovery': 'discovery_rules',
+    'katello': 'subscriptions',
+    'openscap': 'scap_contents',
+    'remote_execution': 'remote_execution_features',
+    'scc_manager': 'scc_accounts',
+    'snapshot_management': 'snapshots',
+    'templates': 'templates',
+}
+
+ENTITY_KEYS = dict(
+    hostgroups='title',
+    locations='title',
+    operatingsystems='title',
+    # TODO: Organizations should be search by title (as foreman allows nested orgs) but that's not the case ATM.
+    #       Applying this will need to record a lot of tests that is out of scope for the moment.
+    # organizations='title',
+    scap_contents='title',
+    users='login',
+)
+
+PER_PAGE = 2 << 31
+
+# maximal number of task ids in one foreman_tasks search, to keep the request URL short
+TASK_SEARCH_BATCH_SIZE = 100
+
+# stored next to the cached apidoc, must not end in the apidoc cache extension (.json)
+STATUS_CACHE_FILE = 'status.cache'
+
+# files of the split apidoc cache and the lock of the apidoc cache directory
+APIDOC_SPLIT_CACHE_INDEX = 'index.json'
+APIDOC_SPLIT_CACHE_RESOURCES = 'resources'
+APIDOC_CACHE_LOCK_FILE = 'apidoc.lock'
+APIDOC_CACHE_LOCK_POLL_INTERVAL = 0.1
+
+
+class NoEntity(object):
+    pass
+
+
+def _exception2fail_json(msg='Generic failure: {0}'):
+    """
+    Decorator to convert Python exceptions into Ansible errors that can be reported to the user.
+    """
+
+    def decor(f):
+        @wraps(f)
+        def inner(self, *args, **kwargs):
+            try:
+                return f(self, *args, **kwargs)
+            except Exception as e:
+                err_msg = "{0}: {1}".format(e.__class__.__name__, to_native(e))
+                self.fail_from_exception(e, msg.format(err_msg))
+        return inner
+    return decor
+
+
+def _check_patch_needed(introduced_version=None, fixed_version=None, plugins=None):
+    """
+    Decorator to check whether a specific apidoc patch is required.
+
+    :param introduced_version: The version of Foreman the API bug was introduced.
+    :type introduced_version: str, optional
+    :param fixed_version: The version of Foreman the API bug was fixed.
+    :type fixed_version: str, optional
+    :param plugins: Which plugins are required for this patch.
+    :type plugins: list, optional
+    """
+
+    def decor(f):
+        @wraps(f)
+        def inner(self, *args, **kwargs):
+            if plugins is not None and not all(self.has_plugin(plugin) for plugin in plugins):
+                return
+
+            if fixed_version is not None and self.foreman_version >= LooseVersion(fixed_version):
+                return
+
+            if introduced_version is not None and self.foreman_version < LooseVersion(introduced_version):
+                return
+
+            return f(self, *args, **kwargs)
+        return inner
+    return decor
+
+
+class LazyApidocIndex(object):
+    """
+    Index of an apidoc stored in a split cache.
+
+    Only the list of resources is known upfront, the description of a resource is read
+    from its own cache file the first time the resource is accessed.
+
+    :param resources_dir: directory containing one JSON file per resource
+    :param resource_names: names of all resources of the apidoc
+    :param fallback: callable returning the description of a resource, used when its cache file can't be read
+    """
+
+    def __init__(self, resources_dir, resource_names, fallback=None):
+        self.resources_dir = resources_dir
+        self.fallback = fallback
+        self._resource_names = frozenset(resource_names)
+        self.loaded_resources = {}
+        self._methods = {}
+
+    def __contains__(self, name):
+        return name in self._resource_names
+
+    def __iter__(self):
+        return iter(self._resource_names)
+
+    def __len__(self):
+        return len(self._resource_names)
+
+    def keys(self):
+        """
+        Names of all resources of the apidoc.
+        """
+
+        return list(self._resource_names)
+
+    def __getitem__(self, name):
+        if name not in self._methods:
+            if name not in self._resource_names:
+                raise KeyError(name)
+            try:
+                with open(os.path.join(self.resources_dir, '{0}.json'.format(name)), 'r') as resource_file:
+                    resource = json.load(resource_file)
+            except (IOError, ValueError):
+                # the split cache was removed or replaced by another process
+                if self.fallback is None:
+                    raise
+                resource = self.fallback(name)
+            methods = {}
+            for method in resource['methods']:
+                methods.setdefault(method['name'], method)
+            self.loaded_resources[name] = resource
+            self._methods[name] = methods
+        return self._methods[name]
+
+
+class ForemanApiRoute(apypie.Route):
+    """
+    :class:`apypie.Route` computing the params in its path only once.
+    """
+
+    def __init__(self, path, method, description=""):
+        super(ForemanApiRoute, self).__init__(path, method, description)
+        self._params_in_path = [part[1:] for part in self.path.split('/') if part.startswith(':')]
+
+    @property
+    def params_in_path(self):
+        return self._params_in_path
+
+
+class ForemanApiAction(apypie.Action):
+    """
+    :class:`apypie.Action` looking itself up in the apidoc index of :class:`ForemanApi`
+    and reusing its pre-built routes and params.
+    """
+
+    @property
+    def apidoc(self):
+        return self.api.apidoc_index[self.resource][self.name]
+
+    @property
+    def routes(self):
+        return self.api.compiled_action(self.resource, self.name)['routes']
+
+    @property
+    def params(self):
+        return self.api.compiled_action(self.resource, self.name)['params']
+
+    def find_route(self, params=None):
+        param_keys = set(self.filter_empty_params(params).keys())
+        sorted_routes = self.api.compiled_action(self.resource, self.name)['sorted_routes']
+        for route in sorted_routes:
+            if set(route.params_in_path) <= param_keys:
+                return route
+        return sorted_routes[-1]
+
+
+class ForemanApiResource(apypie.Resource):
+    """
+    :class:`apypie.Resource` looking up its actions in the apidoc index of :class:`ForemanApi`.
+    """
+
+    @property
+    def actions(self):
+        return sorted(self.api.apidoc_index[self.name].keys())
+
+    def action(self, name):
+        if self.has_action(name):
+            return ForemanApiAction(name, self.name, self.api)
+        return super(ForemanApiResource, self).action(name)
+
+    def has_action(self, name):
+        return name in self.api.apidoc_index[self.name]
+
+
+class ForemanApi(apypie.Api):
+    """
+    :class:`apypie.Api` with an indexed apidoc, a split apidoc cache and a cache that can be shared
+    by parallel processes.
+
+    The apidoc is indexed by resource and action, and the :class:`apypie.Route` and :class:`apypie.Param`
+    objects of an action are only built once.
+    Next to the full cache file, the apidoc is stored as one file per resource, and only the resources
+    that are actually used are read from it.
+    Updates of the cache are done while holding a lock on the cache directory, and files are written atomically.
+
+    Accepts all parameters of :class:`apypie.Api`, and
+
+    :param apidoc_cache_lock_timeout: how long to wait for other processes updating the cache, in seconds. Defaults to `300`.
+    """
+
+    def __init__(self, **kwargs):
+        super(ForemanApi, self).__init__(**kwargs)
+        self._apidoc_cache_name_given = 'apidoc_cache_name' in kwargs
+        self.apidoc_cache_lock_timeout = kwargs.get('apidoc_cache_lock_timeout', 300)
+        self._cache_lock_depth = 0
+        self._apidoc_index = None
+        self._compiled_actions = {}
+        # called after validate_cache switched to the apidoc of a different server version
+        self.cache_changed_callback = None
+
+    @property
+    def apidoc(self):
+        if self._apidoc is None:
+            apidoc = self._load_apidoc()
+            if isinstance(self._apidoc_index, LazyApidocIndex):
+                # keep using the resources that were already loaded (and maybe modified) through the index
+                apidoc['docs']['resources'].update(self._apidoc_index.loaded_resources)
+            self._apidoc = apidoc
+        return self._apidoc
+
+    @property
+    def apidoc_index(self):
+        """
+        The apidoc indexed by resource and action name.
+
+        The index is built once from the full apidoc and references the same method
+        descriptions, so looking up an action does not require scanning the apidoc.
+        If a valid split cache is present, the full apidoc is not loaded at all and
+        only the resources that are actually accessed are read from the cache.
+
+        :returns: The index.
+        """
+
+        if self._apidoc_index is None and self._apidoc is None:
+            self._apidoc_index = self._load_split_cache()
+        if self._apidoc_index is None:
+            apidoc_index = {}
+            for resource_name, resource in self.apidoc['docs']['resources'].items():
+                methods = apidoc_index[resource_name] = {}
+                for method in resource['methods']:
+                    methods.setdefault(method['name'], method)
+            self._apidoc_index = apidoc_index
+        return self._apidoc_index
+
+    def compiled_action(self, resource_name, action_name):
+        """
+        The pre-built :class:`apypie.Route` and :class:`apypie.Param` objects of an action.
+
+        The objects are built on first access and reused for the lifetime of the loaded apidoc.
+
+        :param resource_name: name of the resource
+        :param action_name: name of the action
+
+        :returns: A dict with the ``routes``, ``sorted_routes`` and ``params`` of the action.
+        """
+
+        key = (resource_name, action_name)
+        if key not in self._compiled_actions:
+            method = self.apidoc_index[resource_name][action_name]
+            routes = [ForemanApiRoute(route['api_url'], route['http_method'], route['short_description']) for route in method['apis']]
+            self._compiled_actions[key] = {
+                'routes': routes,
+                'sorted_routes': sorted(routes, key=lambda route: [-1 * len(route.params_in_path), route.path]),
+                'params': [apypie.Param(**param) for param in method['params']],
+            }
+        return self._compiled_actions[key]
+
+    def reset_compiled_actions(self):
+        """
+        Drop the pre-built objects of all actions.
+
+        This needs to be called after the apidoc has been modified in place.
+        """
+
+        self._compiled_actions = {}
+
+    @property
+    def apidoc_split_cache_dir(self):
+        """
+        Full local path to the cached apidoc, split into one file per resource.
+        """
+
+        return '{0}.d'.format(self.apidoc_cache_file)
+
+    def _split_cache_dir_contents(self):
+        return glob.iglob(os.path.join(self.apidoc_cache_dir, '*{0}.d'.format(self.cache_extension)))
+
+    def validate_cache(self, cache_name=None):
+        if cache_name is not None and cache_name != self.apidoc_cache_name:
+            cache_name = os.path.basename(os.path.normpath(cache_name))
+            self._forget_apidoc()
+            # another process might already have retrieved the apidoc with the new name, keep it
+            with self._cache_lock():
+                self._remove_cache_files(keep=cache_name)
+            self.apidoc_cache_name = cache_name
+            if self.cache_changed_callback is not None:
+                self.cache_changed_callback()
+
+    def clean_cache(self):
+        self._forget_apidoc()
+        with self._cache_lock():
+            self._remove_cache_files()
+
+    def _forget_apidoc(self):
+        self._apidoc = None
+        self._apidoc_index = None
+        self.reset_compiled_actions()
+
+    def _remove_cache_files(self, keep=None):
+        kept_file = None
+        if keep is not None:
+            kept_file = os.path.join(self.apidoc_cache_dir, '{0}{1}'.format(keep, self.cache_extension))
+        for filename in self._cache_dir_contents():
+            if filename != kept_file:
+                try:
+                    os.unlink(filename)
+                except OSError as err:
+                    if err.errno != errno.ENOENT:
+                        raise
+        for dirname in self._split_cache_dir_contents():
+            if dirname != '{0}.d'.format(kept_file):
+                shutil.rmtree(dirname, ignore_errors=True)
+
+    def _ensure_cache_dir(self):
+        try:
+            os.makedirs(self.apidoc_cache_dir)
+        except OSError as err:
+            if err.errno != errno.EEXIST or not os.path.isdir(self.apidoc_cache_dir):
+                raise
+
+    @contextmanager
+    def _cache_lock(self):
+        """
+        Hold an exclusive lock on the cache directory, shared by all processes using the same directory.
+
+        The lock is reentrant within one :class:`ForemanApi` instance.
+        If the lock can't be acquired within `apidoc_cache_lock_timeout` seconds, or locking is not
+        supported on this platform, continue without it.
+        """
+
+        if self._cache_lock_depth:
+            self._cache_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._cache_lock_depth -= 1
+            return
+
+        lock_file = None
+        if fcntl is not None:
+            try:
+                self._ensure_cache_dir()
+                lock_file = open(os.path.join(self.apidoc_cache_dir, APIDOC_CACHE_LOCK_FILE), 'a')
+            except (IOError, OSError):
+                lock_file = None
+        if lock_file is not None:
+            deadline = time.time() + self.apidoc_cache_lock_timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except (IOError, OSError) as err:
+                    if err.errno not in (errno.EAGAIN, errno.EACCES) or time.time() >= deadline:
+                        lock_file.close()
+                        lock_file = None
+                        break
+                    time.sleep(APIDOC_CACHE_LOCK_POLL_INTERVAL)
+        self._cache_lock_depth = 1
+        try:
+            yield
+        finally:
+            self._cache_lock_depth = 0
+            if lock_file is not None:
+                # closing the file releases the lock
+                lock_file.close()
+
+    def _atomic_write(self, path, content):
+        """
+        Write a file by renaming a temporary file, so readers never see partially written content.
+        """
+
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'w') as tmp_file:
+                tmp_file.write(content)
+            getattr(os, 'replace', os.rename)(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    @property
+    def resources(self):
+        return sorted(self.apidoc_index.keys())
+
+    def has_resource(self, name):
+        """
+        Check whether the API has a given resource.
+
+        :param name: The name of the resource.
+        """
+
+        return name in self.apidoc_index
+
+    def resource(self, name):
+        if self.has_resource(name):
+            return ForemanApiResource(self, name)
+        return super(ForemanApi, self).resource(name)
+
+    def call(self, resource_name, action_name, params=None, headers=None, options=None, data=None, files=None):  # pylint: disable=too-many-arguments
+        if options is None:
+            options = {}
+        if params is None:
+            params = {}
+
+        action = ForemanApiResource(self, resource_name).action(action_name)
+        if not options.get('skip_validation', False):
+            action.validate(params, data, files)
+
+        return self._call_action(action, params, headers, data, files)
+
+    def _load_apidoc(self):
+        api_doc = super(ForemanApi, self)._load_apidoc()
+        if self._read_split_cache_index() is None:
+            with self._cache_lock():
+                if self._read_split_cache_index() is None:
+                    self._write_split_cache(api_doc)
+        return api_doc
+
+    def _cache_file_signature(self):
+        try:
+            stat = os.stat(self.apidoc_cache_file)
+        except OSError:
+            return None
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def _read_split_cache_index(self):
+        signature = self._cache_file_signature()
+        if signature is None:
+            return None
+        try:
+            with open(os.path.join(self.apidoc_split_cache_dir, APIDOC_SPLIT_CACHE_INDEX), 'r') as index_file:
+                index = json.load(index_file)
+        except (IOError, ValueError):
+            return None
+        if index.get('source') != signature:
+            return None
+        return index
+
+    def _load_split_cache(self):
+        index = self._read_split_cache_index()
+        if index is None:
+            return None
+        return LazyApidocIndex(os.path.join(self.apidoc_split_cache_dir, APIDOC_SPLIT_CACHE_RESOURCES), index['resources'],
+                               fallback=lambda name: self.apidoc['docs']['resources'][name])
+
+    def _write_split_cache(self, apidoc):
+        """
+        Store the apidoc as one compact file per resource, next to the full cache file.
+
+        The split cache is built in a temporary directory and moved into place once complete,
+        so other processes never see a partially written split cache.
+        The split cache is an optimization only, failing to write it is not an error.
+        Callers are expected to hold the cache lock.
+        """
+
+        signature = self._cache_file_signature()
+        if signature is None:
+            return
+        split_cache_dir = self.apidoc_split_cache_dir
+        resources = apidoc['docs']['resources']
+        tmp_dir = None
+        try:
+            tmp_dir = tempfile.mkdtemp(dir=self.apidoc_cache_dir, prefix='.')
+            resources_dir = os.path.join(tmp_dir, APIDOC_SPLIT_CACHE_RESOURCES)
+            os.makedirs(resources_dir)
+            for resource_name, resource in resources.items():
+                with open(os.path.join(resources_dir, '{0}.json'.format(resource_name)), 'w') as resource_file:
+                    resource_file.write(json.dumps(resource, separators=(',', ':')))
+            with open(os.path.join(tmp_dir, APIDOC_SPLIT_CACHE_INDEX), 'w') as index_file:
+                index_file.write(json.dumps({'source': signature, 'resources': sorted(resources.keys())}))
+            if os.path.exists(split_cache_dir):
+                # directories can't be replaced atomically, so move the old one out of the way first
+                old_dir = tempfile.mkdtemp(dir=self.apidoc_cache_dir, prefix='.')
+                os.rename(split_cache_dir, os.path.join(old_dir, 'old'))
+                shutil.rmtree(old_dir, ignore_errors=True)
+            os.rename(tmp_dir, split_cache_dir)
+        except (IOError, OSError):
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _retrieve_apidoc(self):
+        self._ensure_cache_dir()
+        with self._cache_lock():
+            # another process might have retrieved the apidoc while we were waiting for the lock,
+            # possibly storing it under the name the server told it
+            if not self._apidoc_cache_name_given and not os.path.exists(self.apidoc_cache_file):
+                self.apidoc_cache_name = self._find_cache_name(self.apidoc_cache_name)
+            try:
+                with open(self.apidoc_cache_file, 'r') as apidoc_file:
+                    return json.load(apidoc_file)
+            except (IOError, ValueError):
+                pass
+            response = self._download_apidoc()
+            self._atomic_write(self.apidoc_cache_file, json.dumps(response))
+            self._write_split_cache(response)
+        return response
+
+    def _download_apidoc(self):
+        response = None
+        if self.language:
+            response = self._retrieve_apidoc_call('/apidoc/v{0}.{1}.json'.format(self.api_version, self.language), safe=True)
+            language_family = self.language.split('_')[0]
+            if not response and language_family != self.language:
+                response = self._retrieve_apidoc_call('/apidoc/v{0}.{1}.json'.format(self.api_version, language_family), safe=True)
+        if not response:
+            try:
+                response = self._retrieve_apidoc_call('/apidoc/v{0}.json'.format(self.api_version))
+            except Exception as exc:
+                raise apypie.DocLoadingError("""Could not load data from {0}: {1}
+                  - is your server down?""".format(self.uri, exc))
+        if not response:
+            raise apypie.DocLoadingError("""Could not load data from {0}""".format(self.uri))
+        return response
+
+
+class KatelloMixin():
+    """
+    Katello Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with Katello entities.
+
+    This includes:
+
+    * add a required ``organization`` parameter to the module
+    * add Katello to the list of required plugins
+    """
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            organization=dict(type='entity', required=True),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        required_plugins = kwargs.pop('required_plugins', [])
+        required_plugins.append(('katello', ['*']))
+        super(KatelloMixin, self).__init__(foreman_spec=foreman_spec, required_plugins=required_plugins, **kwargs)
+
+
+class TaxonomyMixin(object):
+    """
+    Taxonomy Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with taxonomic entities.
+
+    This adds optional ``organizations`` and ``locations`` parameters to the module.
+    """
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            organizations=dict(type='entity_list'),
+            locations=dict(type='entity_list'),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        super(TaxonomyMixin, self).__init__(foreman_spec=foreman_spec, **kwargs)
+
+
+class ParametersMixinBase(object):
+    """
+    Base Class for the Parameters Mixins.
+
+    Provides a function to verify no duplicate parameters are set.
+    """
+
+    def validate_parameters(self):
+        parameters = self.foreman_params.get('parameters')
+        if parameters is not None:
+            parameter_names = [param['name'] for param in parameters]
+            duplicate_params = set([x for x in parameter_names if parameter_names.count(x) > 1])
+            if duplicate_params:
+                self.fail_json(msg="There are duplicate keys in 'parameters': {0}.".format(duplicate_params))
+
+
+class ParametersMixin(ParametersMixinBase):
+    """
+    Parameters Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with entities that support parameters.
+
+    This allows to submit parameters to Foreman in the same request as modifying the main entity, thus making the parameters
+    available to any action that might be triggered when the entity is saved.
+
+    By default, parametes are submited to the API using the ``<entity_name>_parameters_attributes`` key.
+    If you need to override this, set the ``PARAMETERS_FLAT_NAME`` attribute to the key that shall be used instead.
+
+    This adds optional ``parameters`` parameter to the module. It also enhances the ``run()`` method to properly handle the
+    provided parameters.
+    """
+
+    def __init__(self, **kwargs):
+        self.entity_name = kwargs.pop('entity_name', self.entity_name_from_class)
+        parameters_flat_name = getattr(self, "PARAMETERS_FLAT_NAME", None) or '{0}_parameters_attributes'.format(self.entity_name)
+        foreman_spec = dict(
+            parameters=dict(type='list', elements='dict', options=parameter_ansible_spec, flat_name=parameters_flat_name),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        super(ParametersMixin, self).__init__(foreman_spec=foreman_spec, **kwargs)
+
+        self.validate_parameters()
+
+    def run(self, **kwargs):
+        entity = self.lookup_entity('entity')
+        if not self.desired_absent:
+            if entity and 'parameters' in entity:
+                entity['parameters'] = parameters_list_to_str_list(entity['parameters'])
+            parameters = self.foreman_params.get('parameters')
+            if parameters is not None:
+                self.foreman_params['parameters'] = parameters_list_to_str_list(parameters)
+
+        return super(ParametersMixin, self).run(**kwargs)
+
+
+class NestedParametersMixin(ParametersMixinBase):
+    """
+    Nested Parameters Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with entities that support parameters,
+    but require them to be managed in separate API requests.
+
+    This adds optional ``parameters`` parameter to the module. It also enhances the ``run()`` method to properly handle the
+    provided parameters.
+    """
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            parameters=dict(type='nested_list', foreman_spec=parameter_foreman_spec),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        super(NestedParametersMixin, self).__init__(foreman_spec=foreman_spec, **kwargs)
+
+        self.validate_parameters()
+
+    def run(self, **kwargs):
+        new_entity = super(NestedParametersMixin, self).run(**kwargs)
+        if new_entity:
+            scope = {'{0}_id'.format(self.entity_name): new_entity['id']}
+            self.ensure_scoped_parameters(scope)
+        return new_entity
+
+    def ensure_scoped_parameters(self, scope):
+        parameters = self.foreman_params.get('parameters')
+        if parameters is not None:
+            entity = self.lookup_entity('entity')
+            if self.state == 'present' or (self.state == 'present_with_defaults' and entity is None):
+                if entity:
+                    current_parameters = {parameter['name']: parameter for parameter in self.list_resource('parameters', params=scope)}
+                else:
+                    current_parameters = {}
+                desired_parameters = {parameter['name']: parameter for parameter in parameters}
+
+                for name in desired_parameters:
+                    desired_parameter = desired_parameters[name]
+                    desired_parameter['value'] = parameter_value_to_str(desired_parameter['value'], desired_parameter['parameter_type'])
+                    current_parameter = current_parameters.pop(name, None)
+                    if current_parameter:
+                        if 'parameter_type' not in current_parameter:
+                            current_parameter['parameter_type'] = 'string'
+                        current_parameter['value'] = parameter_value_to_str(current_parameter['value'], current_parameter['parameter_type'])
+                    self.ensure_entity(
+                        'parameters', desired_parameter, current_parameter, state="present", foreman_spec=parameter_foreman_spec, params=scope)
+                for current_parameter in current_parameters.values():
+                    self.ensure_entity(
+                        'parameters', None, current_parameter, state="absent", foreman_spec=parameter_foreman_spec, params=scope)
+
+
+class HostMixin(ParametersMixin):
+    """
+    Host Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with host-related entities (Hosts, Hostgroups).
+
+    This adds many optional parameters that are specific to Hosts and Hostgroups to the module.
+    It also includes :class:`ParametersMixin`.
+    """
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            compute_resource=dict(type='entity'),
+            compute_profile=dict(type='entity'),
+            domain=dict(type='entity'),
+            subnet=dict(type='entity'),
+            subnet6=dict(type='entity', resource_type='subnets'),
+            root_pass=dict(no_log=True),
+            realm=dict(type='entity'),
+            architecture=dict(type='entity'),
+            operatingsystem=dict(type='entity'),
+            medium=dict(aliases=['media'], type='entity'),
+            ptable=dict(type='entity'),
+            pxe_loader=dict(choices=['PXELinux BIOS', 'PXELinux UEFI', 'Grub UEFI', 'Grub2 BIOS', 'Grub2 ELF',
+                                     'Grub2 UEFI', 'Grub2 UEFI SecureBoot', 'Grub2 UEFI HTTP', 'Grub2 UEFI HTTPS',
+                                     'Grub2 UEFI HTTPS SecureBoot', 'iPXE Embedded', 'iPXE UEFI HTTP', 'iPXE Chain BIOS', 'iPXE Chain UEFI', 'None']),
+            environment=dict(type='entity'),
+            puppetclasses=dict(type='entity_list', resolve=False),
+            config_groups=dict(type='entity_list'),
+            puppet_proxy=dict(type='entity', resource_type='smart_proxies'),
+            puppet_ca_proxy=dict(type='entity', resource_type='smart_proxies'),
+            openscap_proxy=dict(type='entity', resource_type='smart_proxies'),
+            content_source=dict(type='entity', scope=['organization'], resource_type='smart_proxies'),
+            lifecycle_environment=dict(type='entity', scope=['organization']),
+            kickstart_repository=dict(type='entity', scope=['organization'], optional_scope=['lifecycle_environment', 'content_view'],
+                                      resource_type='repositories'),
+            content_view=dict(type='entity', scope=['organization'], optional_scope=['lifecycle_environment']),
+            activation_keys=dict(no_log=False),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        required_plugins = kwargs.pop('required_plugins', []) + [
+            ('katello', ['activation_keys', 'content_source', 'lifecycle_environment', 'kickstart_repository', 'content_view']),
+            ('openscap', ['openscap_proxy']),
+        ]
+        mutually_exclusive = kwargs.pop('mutually_exclusive', []) + [['medium', 'kickstart_repository']]
+        super(HostMixin, self).__init__(foreman_spec=foreman_spec, required_plugins=required_plugins, mutually_exclusive=mutually_exclusive, **kwargs)
+
+    def run(self, **kwargs):
+        entity = self.lookup_entity('entity')
+
+        if not self.desired_absent:
+            if 'activation_keys' in self.foreman_params:
+                if 'parameters' not in self.foreman_params:
+                    parameters = [param for param in (entity or {}).get('parameters', []) if param['name'] != 'kt_activation_keys']
+                else:
+                    parameters = self.foreman_params['parameters']
+                ak_param = {'name': 'kt_activation_keys', 'parameter_type': 'string', 'value': self.foreman_params.pop('activation_keys')}
+                self.foreman_params['parameters'] = parameters + [ak_param]
+            elif 'parameters' in self.foreman_params and entity is not None:
+                current_ak_param = next((param for param in entity.get('parameters') if param['name'] == 'kt_activation_keys'), None)
+                desired_ak_param = next((param for param in self.foreman_params['parameters'] if param['name'] == 'kt_activation_keys'), None)
+                if current_ak_param and desired_ak_param is None:
+                    self.foreman_params['parameters'].append(current_ak_param)
+
+        self.validate_parameters()
+
+        return super(HostMixin, self).run(**kwargs)
+
+
+class ForemanAnsibleModule(AnsibleModule):
+    """ Baseclass for all foreman related Ansible modules.
+        It handles connection parameters and adds the concept of the `foreman_spec`.
+        This adds automatic entities resolution based on provided attributes/ sub entities options.
+
+        It adds the following options to foreman_spec 'entity' and 'entity_list' types:
+
+        * search_by (str): Field used to search the sub entity. Defaults to 'name' unless `parent` was set, in which case it defaults to `title`.
+        * search_operator (str): Operator used to search the sub entity. Defaults to '='. For fuzzy search use '~'.
+        * resource_type (str): Resource type used to build API resource PATH. Defaults to pluralized entity key.
+        * resolve (boolean): Defaults to 'True'. If set to false, the sub entity will not be resolved automatically
+        * ensure (boolean): Defaults to 'True'. If set to false, it will be removed before sending data to the foreman server.
+    """
+
+    def __init__(self, **kwargs):
+        # State recording for changed and diff reporting
+        self._changed = False
+        self._before = defaultdict(list)
+        self._after = defaultdict(list)
+        self._after_full = defaultdict(list)
+
+        self.foreman_spec, gen_args = _foreman_spec_helper(kwargs.pop('foreman_spec', {}))
+        argument_spec = dict(
+            server_url=dict(required=True, fallback=(env_fallback, ['FOREMAN_SERVER_URL', 'FOREMAN_SERVER', 'FOREMAN_URL'])),
+            username=dict(required=True, fallback=(env_fallback, ['FOREMAN_USERNAME', 'FOREMAN_USER'])),
+            password=dict(required=True, no_log=True, fallback=(env_fallback, ['FOREMAN_PASSWORD'])),
+            validate_certs=dict(type='bool', default=True, fallback=(env_fallback, ['FOREMAN_VALIDATE_CERTS'])),
+            status_cache_ttl=dict(type='int', default=0, fallback=(env_fallback, ['FOREMAN_STATUS_CACHE_TTL'])),
+            task_poll_min=dict(type='float', default=0.5, fallback=(env_fallback, ['FOREMAN_TASK_POLL_MIN'])),
+            task_poll_max=dict(type='float', default=30, fallback=(env_fallback, ['FOREMAN_TASK_POLL_MAX'])),
+            task_poll_backoff=dict(type='float', default=1.5, fallback=(env_fallback, ['FOREMAN_TASK_POLL_BACKOFF'])),
+        )
+        argument_spec.update(gen_args)
+        argument_spec.update(kwargs.pop('argument_spec', {}))
+        supports_check_mode = kwargs.pop('supports_check_mode', True)
+
+        self.required_plugins = kwargs.pop('required_plugins', [])
+
+        super(ForemanAnsibleModule, self).__init__(argument_spec=argument_spec, supports_check_mode=supports_check_mode, **kwargs)
+
+        aliases = {alias for arg in argument_spec.values() for alias in arg.get('aliases', [])}
+        self.foreman_params = _recursive_dict_without_none(self.params, aliases)
+
+        self.check_requirements()
+
+        self._foremanapi_server_url = self.foreman_params.pop('server_url')
+        self._foremanapi_username = self.foreman_params.pop('username')
+        self._foremanapi_password = self.foreman_params.pop('password')
+        self._foremanapi_validate_certs = self.foreman_params.pop('validate_certs')
+        self._status_cache_ttl = self.foreman_params.pop('status_cache_ttl')
+        self.task_poll_min = self.foreman_params.pop('task_poll_min')
+        self.task_poll_max = self.foreman_params.pop('task_poll_max')
+        self.task_poll_backoff = self.foreman_params.pop('task_poll_backoff')
+
+        if self._foremanapi_server_url.lower().startswith('http://'):
+            self.warn("You have configured a plain HTTP server URL. All communication will happen unencrypted.")
+        elif not self._foremanapi_server_url.lower().startswith('https://'):
+            self.fail_json(msg="The server URL needs to be either HTTPS or HTTP!")
+
+        if self.task_poll_min <= 0 or self.task_poll_max < self.task_poll_min:
+            self.fail_json(msg="task_poll_min needs to be positive and not bigger than task_poll_max!")
+        if self.task_poll_backoff < 1:
+            self.fail_json(msg="task_poll_backoff needs to be at least 1!")
+
+        self.task_timeout = 60
+        self.per_page = PER_PAGE
+
+        self._thin_default = False
+        self.state = 'undefined'
+
+    @contextmanager
+    def api_connection(self):
+        """
+        Execute a given code block after connecting to the API.
+
+        When the block has finished, call :func:`exit_json` to report that the module has finished to Ansible.
+        """
+
+        self.connect()
+        yield
+        self.exit_json()
+
+    @property
+    def changed(self):
+        return self._changed
+
+    def set_changed(self):
+        self._changed = True
+
+    def _patch_host_update(self):
+        _host_update = self.foremanapi.apidoc_index['hosts']['update']
+        for param in ['location_id', 'organization_id']:
+            _host_update_taxonomy_param = next((x for x in _host_update['params'] if x['name'] == param), None)
+            if _host_update_taxonomy_param is not None:
+                _host_update['params'].remove(_host_update_taxonomy_param)
+
+    @_check_patch_needed(fixed_version='2.2.0', plugins=['remote_execution'])
+    def _patch_subnet_rex_api(self):
+        """
+        This is a workaround for the broken subnet apidoc in foreman remote execution.
+        See https://projects.theforeman.org/issues/19086 and https://projects.theforeman.org/issues/30651
+        """
+
+        _subnet_rex_proxies_parameter = {
+            u'validations': [],
+            u'name': u'remote_execution_proxy_ids',
+            u'show': True,
+            u'description': u'\n<p>Remote Execution Proxy IDs</p>\n',
+            u'required': False,
+            u'allow_nil': True,
+            u'allow_blank': False,
+            u'full_name': u'subnet[remote_execution_proxy_ids]',
+            u'expected_type': u'array',
+            u'metadata': None,
+            u'validator': u'',
+        }
+        _subnet_methods = self.foremanapi.apidoc_index['subnets']
+
+        _subnet_create = _subnet_methods['create']
+        _subnet_create_params_subnet = next(x for x in _subnet_create['params'] if x['name'] == 'subnet')
+        _subnet_create_params_subnet['params'].append(_subnet_rex_proxies_parameter)
+
+        _subnet_update = _subnet_methods['update']
+        _subnet_update_params_subnet = next(x for x in _subnet_update['params'] if x['name'] == 'subnet')
+        _subnet_update_params_subnet['params'].append(_subnet_rex_proxies_parameter)
+
+    @_check_patch_needed(introduced_version='2.1.0', fixed_version='2.3.0')
+    def _patch_subnet_externalipam_group_api(self):
+        """
+        This is a workaround for the broken subnet apidoc for External IPAM.
+        See https://projects.theforeman.org/issues/30890
+        """
+
+        _subnet_externalipam_group_parameter = {
+            u'validations': [],
+            u'name': u'externalipam_group',
+            u'show': True,
+            u'description': u'\n<p>External IPAM group - only relevant when IPAM is set to external</p>\n',
+            u'required': False,
+            u'allow_nil': True,
+            u'allow_blank': False,
+            u'full_name': u'subnet[externalipam_group]',
+            u'expected_type': u'string',
+            u'metadata': None,
+            u'validator': u'',
+        }
+        _subnet_methods = self.foremanapi.apidoc_index['subnets']
+
+        _subnet_create = _subnet_methods['create']
+        _subnet_create_params_subnet = next(x for x in _subnet_create['params'] if x['name'] == 'subnet')
+        _subnet_create_params_subnet['params'].append(_subnet_externalipam_group_parameter)
+
+        _subnet_update = _subnet_methods['update']
+        _subnet_update_params_subnet = next(x for x in _subnet_update['params'] if x['name'] == 'subnet')
+        _subnet_update_params_subnet['params'].append(_subnet_externalipam_group_parameter)
+
+    @_check_patch_needed(plugins=['katello'])
+    def _patch_organization_update_api(self):
+        """
+        This is a workaround for the broken organization update apidoc in Katello.
+        See https://projects.theforeman.org/issues/27538
+        """
+
+        _organization_update = self.foremanapi.apidoc_index['organizations']['update']
+        _organization_update_params_organization = next(x for x in _organization_update['params'] if x['name'] == 'organization')
+        _organization_update_params_organization['required'] = False
+
+    @_check_patch_needed(plugins=['katello'])
+    def _patch_cv_filter_rule_api(self):
+        """
+        This is a workaround for missing params of CV Filter Rule update controller in Katello.
+        See https://projects.theforeman.org/issues/30908
+        """
+
+        _content_view_filter_rule_methods = self.foremanapi.apidoc_index['content_view_filter_rules']
+
+        _content_view_filter_rule_create = _content_view_filter_rule_methods['create']
+        _content_view_filter_rule_update = _content_view_filter_rule_methods['update']
+
+        for param_name in ['uuid', 'errata_ids', 'date_type', 'module_stream_ids']:
+            create_param = next((x for x in _content_view_filter_rule_create['params'] if x['name'] == param_name), None)
+            update_param = next((x for x in _content_view_filter_rule_update['params'] if x['name'] == param_name), None)
+            if create_param is not None and update_param is None:
+                _content_view_filter_rule_update['params'].append(create_param)
+
+    @_check_patch_needed(fixed_version='3.5.0', plugins=['katello'])
+    def _patch_ak_product_content_per_page(self):
+        """
+        This is a workaround for the API not exposing the per_page param on the product_content endpoint
+        See https://projects.theforeman.org/issues/35633
+        """
+
+        _per_page_param = {
+            "name": "per_page",
+            "full_name": "per_page",
+            "description": "\n<p>Number of results per page to return</p>\n",
+            "required": False,
+            "allow_nil": False,
+            "allow_blank": False,
+            "validator": "Must be a number.",
+            "expected_type": "numeric",
+            "metadata": None,
+            "show": True,
+            "validations": []
+        }
+
+        _ak_product_content = self.foremanapi.apidoc_index['activation_keys']['product_content']
+
+        if next((x for x in _ak_product_content['params'] if x['name'] == 'per_page'), None) is None:
+            _ak_product_content['params'].append(_per_page_param)
+
+    @_check_patch_needed(fixed_version='3.5.0', plugins=['katello'])
+    def _patch_organization_ignore_types_api(self):
+        """
+        This is a workaround for the missing ignore_types in the organization apidoc in Katello.
+        See https://projects.theforeman.org/issues/35687
+        """
+
+        _ignore_types_param = {
+            "name": "ignore_types",
+            "full_name": "organization[ignore_types]",
+            "description": "\n<p>List of resources types that will be automatically associated</p>\n",
+            "required": False,
+            "allow_nil": True,
+            "allow_blank": False,
+            "validator": "Must be an array of any type",
+            "expected_type": "array",
+            "metadata": None,
+            "show": True,
+            "validations": []
+        }
+
+        _organization_methods = self.foremanapi.apidoc_index['organizations']
+
+        _organization_create = _organization_methods['create']
+        _organization_update = _organization_methods['update']
+        if next((x for x in _organization_create['params'] if x['name'] == 'ignore_types'), None) is None:
+            _organization_create['params'].append(_ignore_types_param)
+            _organization_update['params'].append(_ignore_types_param)
+
+    @_check_patch_needed(fixed_version='3.8.0', plugins=['katello'])
+    def _patch_products_repositories_allow_nil_credential(self):
+        """
+        This is a workaround for the missing allow_nil: true in the Products and Repositories controllers
+        See https://projects.theforeman.org/issues/36497
+        """
+
+        for resource in ['products', 'repositories']:
+            methods = self.foremanapi.apidoc_index[resource]
+            for action in ['create', 'update']:
+                resource_action = methods[action]
+                for param in ['gpg_key_id', 'ssl_ca_cert_id', 'ssl_client_cert_id', 'ssl_client_key_id']:
+                    resource_param = next(x for x in resource_action['params'] if x['name'] == param)
+                    resource_param['allow_nil'] = True
+
+    def check_requirements(self):
+        if not HAS_APYPIE:
+            self.fail_json(msg=missing_required_lib("requests"), exception=APYPIE_IMP_ERR)
+
+    @_exception2fail_json(msg="Failed to connect to Foreman server: {0}")
+    def connect(self):
+        """
+        Connect to the Foreman API.
+
+        This will create a new :class:`ForemanApi` instance using the provided server information,
+        check that the API is actually reachable (by calling :func:`status`),
+        apply any required patches to the apidoc and ensure the server has all the plugins installed
+        that are required by the module.
+
+        If ``status_cache_ttl`` is set, a recent enough status response of the same server is
+        taken from the local status cache instead (see :func:`cached_status`).
+        """
+
+        self.foremanapi = ForemanApi(
+            uri=self._foremanapi_server_url,
+            username=to_bytes(self._foremanapi_username),
+            password=to_bytes(self._foremanapi_password),
+            api_version=2,
+            verify_ssl=self._foremanapi_validate_certs,
+        )
+
+        _status = self.cached_status()
+        self.foreman_version = LooseVersion(_status.get('version', '0.0.0'))
+        self.apply_apidoc_patches()
+        self.check_required_plugins()
+
+    def apply_apidoc_patches(self):
+        """
+        Apply patches to the local apidoc representation.
+        When adding another patch, consider that the endpoint in question may depend on a plugin to be available.
+        If possible, make the patch only execute on specific server/plugin versions.
+        """
+
+        self._patch_host_update()
+
+        self._patch_subnet_rex_api()
+        self._patch_subnet_externalipam_group_api()
+
+        # Katello
+        self._patch_organization_update_api()
+        self._patch_cv_filter_rule_api()
+        self._patch_ak_product_content_per_page()
+        self._patch_organization_ignore_types_api()
+        self._patch_products_repositories_allow_nil_credential()
+
+        # the patches modify the apidoc in place, so anything built from it before is outdated now
+        self.foremanapi.reset_compiled_actions()
+
+    @_exception2fail_json(msg="Failed to connect to Foreman server: {0}")
+    def status(self):
+        """
+        Call the ``status`` API endpoint to ensure the server is reachable.
+
+        :return: The full API response
+        :rtype: dict
+        """
+
+        return self.foremanapi.resource('home').call('status')
+
+    def cached_status(self):
+        """
+        Return the response of the ``status`` API endpoint, using the local status cache if possible.
+
+        Cached responses are keyed on the server URL and the name of the cached apidoc
+        (which is the ``Apipie-Checksum`` of the server once it has been validated)
+        and are used for at most ``status_cache_ttl`` seconds.
+
+        :return: The full API response
+        :rtype: dict
+        """
+
+        if self._status_cache_ttl <= 0:
+            return self.status()
+
+        cache_file = os.path.join(self.foremanapi.apidoc_cache_dir, STATUS_CACHE_FILE)
+        _status = _read_status_cache(cache_file, self._status_cache_key(), self._status_cache_ttl)
+        if _status is None:
+            _status = self.status()
+            # the status call validated the apidoc, so the cache key might have changed
+            _write_status_cache(cache_file, self._status_cache_key(), _status)
+        else:
+            # without the status call, the apidoc is only validated by the first real call
+            self.foremanapi.cache_changed_callback = self._refresh_cached_status
+        return _status
+
+    def _refresh_cached_status(self):
+        """
+        Query the status again after the apidoc of the server changed while a cached status was used.
+
+        The server was upgraded since the status was cached, so the cached status is outdated
+        and the apidoc patches have to be applied to the new apidoc.
+        """
+
+        self.foremanapi.cache_changed_callback = None
+        cache_file = os.path.join(self.foremanapi.apidoc_cache_dir, STATUS_CACHE_FILE)
+        try:
+            os.unlink(cache_file)
+        except OSError:
+            pass
+        _status = self.status()
+        _write_status_cache(cache_file, self._status_cache_key(), _status)
+        self.foreman_version = LooseVersion(_status.get('version', '0.0.0'))
+        self.apply_apidoc_patches()
+        self.check_required_plugins()
+
+    def _status_cache_key(self):
+        return {'server_url': self._foremanapi_server_url, 'apidoc': self.foremanapi.apidoc_cache_name}
+
+    def _resource(self, resource):
+        if not self.foremanapi.has_resource(resource):
+            raise Exception("The server doesn't know about {0}, is the right plugin installed?".format(resource))
+        return self.foremanapi.resource(resource)
+
+    def _resource_call(self, resource, *args, **kwargs):
+        return self._resource(resource).call(*args, **kwargs)
+
+    def _resource_prepare_params(self, resource, action, params):
+        api_action = self._resource(resource).action(action)
+        return api_action.prepare_params(params)
+
+    @_exception2fail_json(msg='Failed to show resource: {0}')
+    def show_resource(self, resource, resource_id, params=None):
+        """
+        Execute the ``show`` action on an entity.
+
+        :param resource: Plural name of the api resource to show
+        :type resource: str
+        :param resource_id: The ID of the entity to show
+        :type resource_id: int
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: Union[dict,None], optional
+        """
+
+        if params is None:
+            params = {}
+        else:
+            params = params.copy()
+
+        params['id'] = resource_id
+
+        params = self._resource_prepare_params(resource, 'show', params)
+
+        return self._resource_call(resource, 'show', params)
+
+    @_exception2fail_json(msg='Failed to list resource: {0}')
+    def list_resource(self, resource, search=None, params=None, per_page=None, parallel_pages=None, limit=None):
+        """
+        Execute the ``index`` action on an resource.
+
+        :param resource: Plural name of the api resource to show
+        :type resource: str
+        :param search: Search string as accepted by the API to limit the results
+        :type search: str, optional
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: Union[dict,None], optional
+        :param per_page: Number of results to fetch per request, defaults to :attr:`per_page`
+        :type per_page: int, optional
+        :param parallel_pages: Number of pages to fetch concurrently once the total number of results is known
+        :type parallel_pages: int, optional
+        :param limit: Maximal number of results to return, further pages are not fetched
+        :type limit: int, optional
+        """
+
+        results = []
+        for page in self._list_resource_pages(resource, search, params, per_page, parallel_pages):
+            if not isinstance(page['results'], list):
+                # some endpoints (i.e. puppetclasses) return their results grouped in a dict
+                return page['results']
+            results.extend(page['results'])
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def iter_resource(self, resource, search=None, params=None, per_page=None, parallel_pages=None):
+        """
+        Execute the ``index`` action on an resource and yield the results one by one.
+
+        Unlike :func:`list_resource`, the next page is only fetched once all results of the
+        previous one have been consumed, so callers that stop early don't fetch all results.
+
+        :param resource: Plural name of the api resource to show
+        :type resource: str
+        :param search: Search string as accepted by the API to limit the results
+        :type search: str, optional
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: Union[dict,None], optional
+        :param per_page: Number of results to fetch per request, defaults to :attr:`per_page`
+        :type per_page: int, optional
+        :param parallel_pages: Number of pages to fetch concurrently once the total number of results is known
+        :type parallel_pages: int, optional
+        """
+
+        pages = self._list_resource_pages(resource, search, params, per_page, parallel_pages)
+        while True:
+            try:
+                page = self._next_page(pages)
+            except StopIteration:
+                return
+            if not isinstance(page['results'], list):
+                # some endpoints (i.e. puppetclasses) return their results grouped in a dict,
+                # which is yielded as a whole, like list_resource returns it
+                yield page['results']
+                return
+            for result in page['results']:
+                yield result
+
+    @_exception2fail_json(msg='Failed to list resource: {0}')
+    def _next_page(self, pages):
+        return next(pages)
+
+    def _list_resource_pages(self, resource, search=None, params=None, per_page=None, parallel_pages=None):
+        if params is None:
+            params = {}
+        else:
+            params = params.copy()
+
+        if search is not None:
+            params['search'] = search
+        if per_page is None:
+            per_page = self.per_page
+        params['per_page'] = per_page
+
+        params = self._resource_prepare_params(resource, 'index', params)
+        # without paging support in the apidoc, all results are returned at once
+        index_params = [param.name for param in self._resource(resource).action('index').params]
+        paged = 'page' in index_params and 'per_page' in params
+
+        page_number = 1
+        fetched = 0
+        while True:
+            page = self._resource_call(resource, 'index', params)
+            yield page
+            results = page['results']
+            if not paged or not isinstance(results, list) or not results:
+                return
+            fetched += len(results)
+            subtotal = page.get('subtotal')
+            if isinstance(subtotal, int):
+                if fetched >= subtotal:
+                    return
+                if parallel_pages and parallel_pages > 1 and ThreadPoolExecutor is not None:
+                    # the number of pages is known now, fetch the remaining ones concurrently
+                    last_page = -(-subtotal // per_page)
+                    for page in self._fetch_pages(resource, params, range(page_number + 1, last_page + 1), parallel_pages):
+                        yield page
+                    return
+            elif len(results) < per_page:
+                return
+            page_number += 1
+            params['page'] = page_number
+
+    def _fetch_pages(self, resource, params, page_numbers, workers):
+        """
+        Fetch the given pages of the ``index`` action with a pool of `workers` threads and yield them in order.
+        At most `workers` pages are requested ahead of the one currently consumed.
+        """
+
+        def fetch(page_number):
+            page_params = params.copy()
+            page_params['page'] = page_number
+            return self._resource_call(resource, 'index', page_params)
+
+        pending = deque()
+        page_numbers = iter(page_numbers)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for page_number in islice(page_numbers, workers):
+                pending.append(executor.submit(fetch, page_number))
+            while pending:
+                page = pending.popleft().result()
+                for page_number in islice(page_numbers, 1):
+                    pending.append(executor.submit(fetch, page_number))
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def find_resource(self, resource, search, params=None, failsafe=False, thin=None):
+        list_params = {}
+        if params is not None:
+            list_params.update(params)
+        if thin is None:
+            thin = self._thin_default
+        list_params['thin'] = thin
+        results = self.list_resource(resource, search, list_params)
+        if len(results) == 1:
+            result = results[0]
+        elif failsafe:
+            result = None
+        else:
+            if len(results) > 1:
+                error_msg = "too many ({0})".format(len(results))
+            else:
+                error_msg = "no"
+            self.fail_json(msg="Found {0} results while searching for {1} with {2}".format(error_msg, resource, search))
+        if result and not thin:
+            result = self.show_resource(resource, result['id'], params=params)
+        return result
+
+    def find_resource_by(self, resource, search_field, value, **kwargs):
+        if not value:
+            return NoEntity
+        search = '{0}{1}"{2}"'.format(search_field, kwargs.pop('search_operator', '='), value)
+        return self.find_resource(resource, search, **kwargs)
+
+    def find_resource_by_name(self, resource, name, **kwargs):
+        return self.find_resource_by(resource, 'name', name, **kwargs)
+
+    def find_resource_by_title(self, resource, title, **kwargs):
+        return self.find_resource_by(resource, 'title', title, **kwargs)
+
+    def find_resource_by_id(self, resource, obj_id, **kwargs):
+        return self.find_resource_by(resource, 'id', obj_id, **kwargs)
+
+    def find_resources_by_name(self, resource, names, **kwargs):
+        return [self.find_resource_by_name(resource, name, **kwargs) for name in names]
+
+    def find_operatingsystem(self, name, failsafe=False, **kwargs):
+        result = self.find_resource_by_title('operatingsystems', name, failsafe=True, **kwargs)
+        if not result:
+            result = self.find_resource_by('operatingsystems', 'title', name, search_operator='~', failsafe=failsafe, **kwargs)
+        return result
+
+    def find_puppetclass(self, name, environment=None, params=None, failsafe=False, thin=None):
+        if thin is None:
+            thin = self._thin_default
+        if environment:
+            scope = {'environment_id': environment}
+        else:
+            scope = {}
+        if params is not None:
+            scope.update(params)
+        search = 'name="{0}"'.format(name)
+        results = self.list_resource('puppetclasses', search, params=scope)
+
+        # verify that only one puppet module is returned with only one puppet class inside
+        # as provided search results have to be like "results": { "ntp": [{"id": 1, "name": "ntp" ...}]}
+        # and get the puppet class id
+        if len(results) == 1 and len(list(results.values())[0]) == 1:
+            result = list(results.values())[0][0]
+            if thin:
+                return {'id': result['id']}
+            else:
+                return result
+
+        if failsafe:
+            return None
+        else:
+            self.fail_json(msg='No data found for name="%s"' % search)
+
+    def find_puppetclasses(self, names, **kwargs):
+        return [self.find_puppetclass(name, **kwargs) for name in names]
+
+    def find_cluster(self, name, compute_resource):
+        cluster = self.find_compute_resource_parts('clusters', name, compute_resource, None, ['ovirt', 'vmware'])
+
+        # workaround for https://projects.theforeman.org/issues/31874
+        if compute_resource['provider'].lower() == 'vmware':
+            path_or_name = cluster.get('full_path', cluster['name'])
+            cluster['_api_identifier'] = path_or_name
+        else:
+            cluster['_api_identifier'] = cluster['id']
+
+        return cluster
+
+    def find_network(self, name, compute_resource, cluster=None):
+        return self.find_compute_resource_parts('networks', name, compute_resource, cluster, ['ovirt', 'vmware', 'google', 'azurerm'])
+
+    def find_storage_domain(self, name, compute_resource, cluster=None):
+        return self.find_compute_resource_parts('storage_domains', name, compute_resource, cluster, ['ovirt', 'vmware'])
+
+    def find_storage_pod(self, name, compute_resource, cluster=None):
+        return self.find_compute_resource_parts('storage_pods', name, compute_resource, cluster, ['vmware'])
+
+    def find_compute_resource_parts(self, part_name, name, compute_resource, cluster=None, supported_crs=None):
+        if supported_crs is None:
+            supported_crs = []
+
+        if compute_resource['provider'].lower() not in supported_crs:
+            return {'id': name, 'name': name}
+
+        additional_params = {'id': compute_resource['id']}
+        if cluster is not None:
+            # apypie will quote the params for us, but we need to do it twice for the cluster_id
+            # see https://projects.theforeman.org/issues/35438
+            # and https://github.com/theforeman/hammer-cli-foreman/pull/604
+            # and https://github.com/theforeman/foreman/pull/9383
+            # and https://httpd.apache.org/docs/current/mod/core.html#allowencodedslashes
+            additional_params['cluster_id'] = six.moves.urllib.parse.quote(cluster['_api_identifier'], safe='')
+        api_name = 'available_{0}'.format(part_name)
+        available_parts = self.resource_action('compute_resources', api_name, params=additional_params,
+                                               ignore_check_mode=True, record_change=False)['results']
+        part = next((part for part in available_parts
+                     if str(part['name']) == str(name) or str(part['id']) == str(name) or part.get('full_path') == str(name)),
+                    None)
+        if part is None:
+            err_msg = "Could not find {0} '{1}' on compute resource '{2}'.".format(part_name, name, compute_resource.get('name'))
+            self.fail_json(msg=err_msg)
+        return part
+
+    def scope_for(self, key, scoped_resource=None):
+        # workaround for https://projects.theforeman.org/issues/31714
+        if scoped_resource in ['content_views', 'repositories'] and key == 'lifecycle_environment':
+            scope_key = 'environment'
+        else:
+            scope_key = key
+        return {'{0}_id'.format(scope_key): self.lookup_entity(key)['id']}
+
+    def set_entity(self, key, entity):
+        self.foreman_params[key] = entity
+
+    def lookup_entity(self, key, params=None):
+        if key not in self.foreman_params:
+            return None
+
+        entity_spec = self.foreman_spec[key]
+        if _is_resolved(entity_spec, self.foreman_params[key]):
+            # Already looked up or not an entity(_list) so nothing to do
+            return self.foreman_params[key]
+
+        result = self._lookup_entity(self.foreman_params[key], entity_spec, params)
+        self.set_entity(key, result)
+        return result
+
+    def _lookup_entity(self, identifier, entity_spec, params=None):
+        if identifier is NoEntity:
+            return NoEntity
+        resource_type = entity_spec['resource_type']
+        failsafe = entity_spec.get('failsafe', False)
+        thin = entity_spec.get('thin', True)
+        if params:
+            params = params.copy()
+        else:
+            params = {}
+        try:
+            for scope in entity_spec.get('scope', []):
+                params.update(self.scope_for(scope, resource_type))
+            for optional_scope in entity_spec.get('optional_scope', []):
+                if optional_scope in self.foreman_params:
+                    params.update(self.scope_for(optional_scope, resource_type))
+
+        except TypeError:
+            if failsafe:
+                if entity_spec.get('type') == 'entity':
+                    result = None
+                else:
+                    result = [None for value in identifier]
+            else:
+                self.fail_json(msg="Failed to lookup scope {0} while searching for {1}.".format(entity_spec['scope'], resource_type))
+        else:
+            # No exception happend => scope is in place
+            if resource_type == 'operatingsystems':
+                if entity_spec.get('type') == 'entity':
+                    result = self.find_operatingsystem(identifier, params=params, failsafe=failsafe, thin=thin)
+                else:
+                    result = [self.find_operatingsystem(value, params=params, failsafe=failsafe, thin=thin) for value in identifier]
+            elif resource_type == 'puppetclasses':
+                if entity_spec.get('type') == 'entity':
+                    result = self.find_puppetclass(identifier, params=params, failsafe=failsafe, thin=thin)
+                else:
+                    result = [self.find_puppetclass(value, params=params, failsafe=failsafe, thin=thin) for value in identifier]
+            else:
+                if entity_spec.get('type') == 'entity':
+                    result = self.find_resource_by(
+                        resource=resource_type,
+                        value=identifier,
+                        search_field=entity_spec.get('search_by', ENTITY_KEYS.get(resource_type, 'name')),
+                        search_operator=entity_spec.get('search_operator', '='),
+                        failsafe=failsafe, thin=thin, params=params,
+                    )
+                else:
+                    result = [self.find_resource_by(
+                        resource=resource_type,
+                        value=value,
+                        search_field=entity_spec.get('search_by', ENTITY_KEYS.get(resource_type, 'name')),
+                        search_operator=entity_spec.get('search_operator', '='),
+                        failsafe=failsafe, thin=thin, params=params,
+                    ) for value in identifier]
+        return result
+
+    def auto_lookup_entities(self):
+        self.auto_lookup_nested_entities()
+        return [
+            self.lookup_entity(key)
+            for key, entity_spec in self.foreman_spec.items()
+            if entity_spec.get('resolve', True) and entity_spec.get('type') in {'entity', 'entity_list'}
+        ]
+
+    def auto_lookup_nested_entities(self):
+        for key, entity_spec in self.foreman_spec.items():
+            if entity_spec.get('type') in {'nested_list'}:
+                for nested_key, nested_spec in entity_spec['foreman_spec'].items():
+                    for item in self.foreman_params.get(key, []):
+                        if (nested_key in item and nested_spec.get('resolve', True)
+                                and not _is_resolved(nested_spec, item[nested_key])):
+                            item[nested_key] = self._lookup_entity(item[nested_key], nested_spec)
+
+    def record_before(self, resource, entity):
+        if isinstance(entity, dict):
+            to_record = _recursive_dict_without_none(entity)
+        else:
+            to_record = entity
+        self._before[resource].append(to_record)
+
+    def record_after(self, resource, entity):
+        if isinstance(entity, dict):
+            to_record = _recursive_dict_without_none(entity)
+        else:
+            to_record = entity
+        self._after[resource].append(to_record)
+
+    def record_after_full(self, resource, entity):
+        self._after_full[resource].append(entity)
+
+    @_exception2fail_json(msg='Failed to ensure entity state: {0}')
+    def ensure_entity(self, resource, desired_entity, current_entity, params=None, state=None, foreman_spec=None):
+        """
+        Ensure that a given entity has a certain state
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param desired_entity: Desired properties of the entity
+        :type desired_entity: dict
+        :param current_entity: Current properties of the entity or None if nonexistent
+        :type current_entity: Union[dict,None]
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+        :param state: Desired state of the entity (optionally taken from the module)
+        :type state: str, optional
+        :param foreman_spec: Description of the entity structure (optionally taken from module)
+        :type foreman_spec: dict, optional
+
+        :return: The new current state of the entity
+        :rtype: Union[dict,None]
+        """
+        if state is None:
+            state = self.state
+        if foreman_spec is None:
+            foreman_spec = self.foreman_spec
+        else:
+            foreman_spec, _dummy = _foreman_spec_helper(foreman_spec)
+
+        updated_entity = None
+
+        self.record_before(resource, _flatten_entity(current_entity, foreman_spec))
+
+        if state == 'present_with_defaults':
+            if current_entity is None:
+                updated_entity = self._create_entity(resource, desired_entity, params, foreman_spec)
+        elif state == 'present':
+            if current_entity is None:
+                updated_entity = self._create_entity(resource, desired_entity, params, foreman_spec)
+            else:
+                updated_entity = self._update_entity(resource, desired_entity, current_entity, params, foreman_spec)
+        elif state == 'copied':
+            if current_entity is not None:
+                updated_entity = self._copy_entity(resource, desired_entity, current_entity, params)
+        elif state == 'reverted':
+            if current_entity is not None:
+                updated_entity = self._revert_entity(resource, current_entity, params)
+        elif state == 'new_snapshot':
+            updated_entity = self._create_entity(resource, desired_entity, params, foreman_spec)
+        elif state == 'absent':
+            if current_entity is not None:
+                updated_entity = self._delete_entity(resource, current_entity, params)
+        else:
+            self.fail_json(msg='Not a valid state: {0}'.format(state))
+
+        self.record_after(resource, _flatten_entity(updated_entity, foreman_spec))
+        self.record_after_full(resource, updated_entity)
+
+        return updated_entity
+
+    def _validate_supported_payload(self, resource, action, payload):
+        """
+        Check whether the payload only contains supported keys.
+        Emits a warning for keys that are not part of the apidoc.
+
+        :param resource: Plural name of the api resource to check
+        :type resource: str
+        :param action: Name of the action to check payload against
+        :type action: str
+        :param payload: API paylod to be checked
+        :type payload: dict
+
+        :return: The payload as it can be submitted to the API
+        :rtype: dict
+        """
+        filtered_payload = self._resource_prepare_params(resource, action, payload)
+        # On Python 2 dict.keys() is just a list, but we need a set here.
+        unsupported_parameters = set(payload.keys()) - set(_recursive_dict_keys(filtered_payload))
+        if unsupported_parameters:
+            warn_msg = "The following parameters are not supported by your server when performing {0} on {1}: {2}. They were ignored."
+            self.warn(warn_msg.format(action, resource, unsupported_parameters))
+        return filtered_payload
+
+    def _create_entity(self, resource, desired_entity, params, foreman_spec):
+        """
+        Create entity with given properties
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param desired_entity: Desired properties of the entity
+        :type desired_entity: dict
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+        :param foreman_spec: Description of the entity structure
+        :type foreman_spec: dict
+
+        :return: The new current state of the entity
+        :rtype: dict
+        """
+        payload = _flatten_entity(desired_entity, foreman_spec)
+        self._validate_supported_payload(resource, 'create', payload)
+        if not self.check_mode:
+            if params:
+                payload.update(params)
+            return self.resource_action(resource, 'create', payload)
+        else:
+            fake_entity = desired_entity.copy()
+            fake_entity['id'] = -1
+            self.set_changed()
+            return fake_entity
+
+    def _update_entity(self, resource, desired_entity, current_entity, params, foreman_spec):
+        """
+        Update a given entity with given properties if any diverge
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param desired_entity: Desired properties of the entity
+        :type desired_entity: dict
+        :param current_entity: Current properties of the entity
+        :type current_entity: dict
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+        :param foreman_spec: Description of the entity structure
+        :type foreman_spec: dict
+
+        :return: The new current state of the entity
+        :rtype: dict
+        """
+        payload = {}
+        desired_entity = _flatten_entity(desired_entity, foreman_spec)
+        current_flat_entity = _flatten_entity(current_entity, foreman_spec)
+        for key, value in desired_entity.items():
+            foreman_type = foreman_spec[key].get('type', 'str')
+            new_value = value
+            old_value = current_flat_entity.get(key)
+            # String comparison needs extra care in face of unicode
+            if foreman_type == 'str':
+                old_value = to_native(old_value)
+                new_value = to_native(new_value)
+            # ideally the type check would happen via foreman_spec.elements
+            # however this is not set for flattened entries and setting it
+            # confuses _flatten_entity
+            elif foreman_type == 'list' and value and isinstance(value[0], dict):
+                if 'name' in value[0]:
+                    sort_key = 'name'
+                else:
+                    sort_key = list(value[0].keys())[0]
+                new_value = sorted(new_value, key=operator.itemgetter(sort_key))
+                old_value = sorted(old_value, key=operator.itemgetter(sort_key))
+            if new_value != old_value:
+                payload[key] = value
+        if self._validate_supported_payload(resource, 'update', payload):
+            payload['id'] = current_flat_entity['id']
+            if not self.check_mode:
+                if params:
+                    payload.update(params)
+                return self.resource_action(resource, 'update', payload)
+            else:
+                # In check_mode we emulate the server updating the entity
+                fake_entity = current_flat_entity.copy()
+                fake_entity.update(payload)
+                self.set_changed()
+                return fake_entity
+        else:
+            # Nothing needs changing
+            return current_entity
+
+    def _copy_entity(self, resource, desired_entity, current_entity, params):
+        """
+        Copy a given entity
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param desired_entity: Desired properties of the entity
+        :type desired_entity: dict
+        :param current_entity: Current properties of the entity
+        :type current_entity: dict
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+
+        :return: The new current state of the entity
+        :rtype: dict
+        """
+        payload = {
+            'id': current_entity['id'],
+            'new_name': desired_entity['new_name'],
+        }
+        if params:
+            payload.update(params)
+        return self.resource_action(resource, 'copy', payload)
+
+    def _revert_entity(self, resource, current_entity, params):
+        """
+        Revert a given entity
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param current_entity: Current properties of the entity
+        :type current_entity: dict
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+
+        :return: The new current state of the entity
+        :rtype: dict
+        """
+        payload = {'id': current_entity['id']}
+        if params:
+            payload.update(params)
+        return self.resource_action(resource, 'revert', payload)
+
+    def _delete_entity(self, resource, current_entity, params):
+        """
+        Delete a given entity
+
+        :param resource: Plural name of the api resource to manipulate
+        :type resource: str
+        :param current_entity: Current properties of the entity
+        :type current_entity: dict
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: dict, optional
+
+        :return: The new current state of the entity
+        :rtype: Union[dict,None]
+        """
+        payload = {'id': current_entity['id']}
+        if params:
+            payload.update(params)
+        entity = self.resource_action(resource, 'destroy', payload)
+
+        # this is a workaround for https://projects.theforeman.org/issues/26937
+        if entity and isinstance(entity, dict) and 'error' in entity and 'message' in entity['error']:
+            self.fail_json(msg=entity['error']['message'])
+
+        return None
+
+    def resource_action(self, resource, action, params, options=None, data=None, files=None,
+                        ignore_check_mode=False, record_change=True, ignore_task_errors=False, wait_for_task=True):
+        resource_payload = self._resource_prepare_params(resource, action, params)
+        if options is None:
+            options = {}
+        try:
+            result = None
+            if ignore_check_mode or not self.check_mode:
+                result = self._resource_call(resource, action, resource_payload, options=options, data=data, files=files)
+                is_foreman_task = isinstance(result, dict) and 'action' in result and 'state' in result and 'started_at' in result
+                if is_foreman_task and wait_for_task:
+                    result = self.wait_for_task(result, ignore_errors=ignore_task_errors)
+        except Exception as e:
+            msg = 'Error while performing {0} on {1}: {2}'.format(
+                action, resource, to_native(e))
+            self.fail_from_exception(e, msg)
+        if record_change and not ignore_check_mode:
+            # If we were supposed to ignore check_mode we can assume this action was not a changing one.
+            self.set_changed()
+        return result
+
+    def wait_for_task(self, task, ignore_errors=False):
+        """
+        Wait for a task to finish, failing the module if it doesn't within :attr:`task_timeout` seconds.
+
+        The task is checked again after :attr:`task_poll_min` seconds, the delay between checks then
+        grows by :attr:`task_poll_backoff` up to :attr:`task_poll_max` seconds.
+        Once the task reports progress, the delay is shortened to the estimated remaining time.
+
+        :param task: The task as returned by the API
+        :type task: dict
+        :param ignore_errors: Don't fail the module if the task did not succeed
+        :type ignore_errors: bool, optional
+        :return: The finished task
+        :rtype: dict
+        """
+
+        deadline = time.time() + self.task_timeout
+        delay = self.task_poll_min
+        first_progress = None
+        while task['state'] not in ['paused', 'stopped']:
+            now = time.time()
+            if now >= deadline:
+                self.fail_json(msg="Timeout waiting for Task {0}".format(task['id']))
+
+            poll_delay = delay
+            progress = task.get('progress')
+            if isinstance(progress, (int, float)):
+                if first_progress is None:
+                    first_progress = (now, progress)
+                elif progress > first_progress[1]:
+                    remaining = (1 - progress) * (now - first_progress[0]) / (progress - first_progress[1])
+                    poll_delay = min(poll_delay, max(remaining, self.task_poll_min))
+            time.sleep(min(poll_delay, deadline - now))
+            delay = min(delay * self.task_poll_backoff, self.task_poll_max)
+
+            resource_payload = self._resource_prepare_params('foreman_tasks', 'show', {'id': task['id']})
+            task = self._resource_call('foreman_tasks', 'show', resource_payload)
+        if not ignore_errors and task['result'] != 'success':
+            self.fail_json(msg='Task {0}({1}) did not succeed. Task information: {2}'.format(task['action'], task['id'], task['humanized']['errors']))
+        return task
+
+    def wait_for_tasks(self, tasks, ignore_errors=False):
+        """
+        Wait for multiple tasks to finish, failing the module if they don't within :attr:`task_timeout` seconds.
+
+        The state of all pending tasks is checked with one ``foreman_tasks`` search per :data:`TASK_SEARCH_BATCH_SIZE` tasks,
+        with the same delays between checks as :func:`wait_for_task`.
+        Tasks without a known ``state`` are checked right away.
+
+        :param tasks: The tasks as returned by the API, at least their ``id``
+        :type tasks: list
+        :param ignore_errors: Don't fail the module if a task did not succeed
+        :type ignore_errors: bool, optional
+        :return: The finished tasks, in the same order as passed
+        :rtype: list
+        """
+
+        finished = {}
+        pending = []
+        for task in tasks:
+            if task.get('state') in ['paused', 'stopped']:
+                finished[task['id']] = task
+            elif task['id'] not in pending:
+                pending.append(task['id'])
+
+        deadline = time.time() + self.task_timeout
+        delay = self.task_poll_min
+        check_now = any('state' not in task for task in tasks)
+        while pending:
+            now = time.time()
+            if not check_now:
+                if now >= deadline:
+                    self.fail_json(msg="Timeout waiting for Tasks {0}".format(', '.join(pending)))
+                time.sleep(min(delay, deadline - now))
+                delay = min(delay * self.task_poll_backoff, self.task_poll_max)
+            check_now = False
+
+            found = {}
+            for start in range(0, len(pending), TASK_SEARCH_BATCH_SIZE):
+                search = 'id ^ ({0})'.format(','.join('"{0}"'.format(task_id) for task_id in pending[start:start + TASK_SEARCH_BATCH_SIZE]))
+                for task in self.list_resource('foreman_tasks', search):
+                    found[task['id']] = task
+            missing = [task_id for task_id in pending if task_id not in found]
+            if missing:
+                self.fail_json(msg="Could not find Tasks {0}".format(', '.join(missing)))
+            for task_id in pending:
+                if found[task_id]['state'] in ['paused', 'stopped']:
+                    finished[task_id] = found[task_id]
+            pending = [task_id for task_id in pending if task_id not in finished]
+
+        tasks = [finished[task['id']] for task in tasks]
+        failed = [task for task in tasks if task['result'] != 'success']
+        if not ignore_errors and failed:
+            self.fail_json(msg='Tasks did not succeed: {0}'.format('; '.join(
+                'Task {0}({1}) did not succeed. Task information: {2}'.format(task['action'], task['id'], task.get('humanized', {}).get('errors'))
+                for task in failed)), tasks=tasks)
+        return tasks
+
+    def fail_from_exception(self, exc, msg):
+        fail = {'msg': msg}
+        if isinstance(exc, requests.exceptions.HTTPError):
+            try:
+                response = exc.response.json()
+                if 'error' in response:
+                    fail['error'] = response['error']
+                else:
+                    fail['error'] = response
+            except Exception:
+                fail['error'] = exc.response.text
+        self.fail_json(**fail)
+
+    def exit_json(self, changed=False, **kwargs):
+        kwargs['changed'] = changed or self.changed
+        if 'diff' not in kwargs and (self._before or self._after):
+            kwargs['diff'] = {'before': self._before,
+                              'after': self._after}
+        if 'entity' not in kwargs and self._after_full:
+            kwargs['entity'] = self._after_full
+        super(ForemanAnsibleModule, self).exit_json(**kwargs)
+
+    def has_plugin(self, plugin_name):
+        try:
+            resource_name = _PLUGIN_RESOURCES[plugin_name]
+        except KeyError:
+            raise Exception("Unknown plugin: {0}".format(plugin_name))
+        return self.foremanapi.has_resource(resource_name)
+
+    def check_required_plugins(self):
+        missing_plugins = []
+        for (plugin, params) in self.required_plugins:
+            for param in params:
+                if (param in self.foreman_params or param == '*') and not self.has_plugin(plugin):
+                    if param == '*':
+                        param = 'the whole module'
+                    missing_plugins.append("{0} (for {1})".format(plugin, param))
+        if missing_plugins:
+            missing_msg = "The server is missing required plugins: {0}.".format(', '.join(missing_plugins))
+            self.fail_json(msg=missing_msg)
+
+
+class ForemanStatelessEntityAnsibleModule(ForemanAnsibleModule):
+    """ Base class for Foreman entities without a state. To use it, subclass it with the following convention:
+        To manage my_entity entity, create the following sub class::
+
+            class ForemanMyEntityModule(ForemanStatelessEntityAnsibleModule):
+                pass
+
+        and use that class to instantiate module::
+
+            module = ForemanMyEntityModule(
+                argument_spec=dict(
+                    [...]
+                ),
+                foreman_spec=dict(
+                    [...]
+                ),
+            )
+
+        It adds the following attributes:
+
+        * entity_key (str): field used to search current entity. Defaults to value provided by `ENTITY_KEYS` or 'name' if no value found.
+        * entity_name (str): name of the current entity.
+          By default deduce the entity name from the class name (eg: 'ForemanProvisioningTemplateModule' class will produce 'provisioning_template').
+        * entity_opts (dict): Dict of options for base entity. Same options can be provided for subentities described in foreman_spec.
+
+        The main entity is referenced with the key `entity` in the `foreman_spec`.
+    """
+
+    def __init__(self, **kwargs):
+        self.entity_key = kwargs.pop('entity_key', 'name')
+        self.entity_name = kwargs.pop('entity_name', self.entity_name_from_class)
+        entity_opts = kwargs.pop('entity_opts', {})
+
+        super(ForemanStatelessEntityAnsibleModule, self).__init__(**kwargs)
+
+        if 'resource_type' not in entity_opts:
+            entity_opts['resource_type'] = inflector.pluralize(self.entity_name)
+        if 'thin' not in entity_opts:
+            # Explicit None to trigger the _thin_default mechanism lazily
+            entity_opts['thin'] = None
+        if 'failsafe' not in entity_opts:
+            entity_opts['failsafe'] = True
+        if 'search_operator' not in entity_opts:
+            entity_opts['search_operator'] = '='
+        if 'search_by' not in entity_opts:
+            entity_opts['search_by'] = ENTITY_KEYS.get(entity_opts['resource_type'], 'name')
+
+        self.foreman_spec.update(_foreman_spec_helper(dict(
+            entity=dict(
+                type='entity',
+                flat_name='id',
+                ensure=False,
+                **entity_opts
+            ),
+        ))[0])
+
+        if 'parent' in self.foreman_spec and self.foreman_spec['parent'].get('type') == 'entity':
+            # ensure parent and entity are the same type
+            self.foreman_spec['parent']['resource_type'] = self.foreman_spec['entity']['resource_type']
+            if 'failsafe' not in self.foreman_spec['parent']:
+                self.foreman_spec['parent']['failsafe'] = True
+            current, parent = split_fqn(self.foreman_params[self.entity_key])
+            if isinstance(self.foreman_params.get('parent'), six.string_types):
+                if parent:
+                    self.fail_json(msg="Please specify the parent either separately, or as part of the title.")
+                parent = self.foreman_params['parent']
+            elif parent:
+                self.foreman_params['parent'] = parent
+            self.foreman_params[self.entity_key] = current
+            self.foreman_params['entity'] = build_fqn(current, parent)
+        else:
+            self.foreman_params['entity'] = self.foreman_params.get(self.entity_key)
+
+    @property
+    def entity_name_from_class(self):
+        """
+        The entity name derived from the class name.
+
+        The class name must follow the following name convention:
+
+        * It starts with ``Foreman`` or ``Katello``.
+        * It ends with ``Module``.
+
+        This will convert the class name ``ForemanMyEntityModule`` to the entity name ``my_entity``.
+
+        Examples:
+
+        * ``ForemanArchitectureModule`` => ``architecture``
+        * ``ForemanProvisioningTemplateModule`` => ``provisioning_template``
+        * ``KatelloProductMudule`` => ``product``
+        """
+        # Convert current class name from CamelCase to snake_case
+        class_name = re.sub(r'(?<=[a-z])[A-Z]|[A-Z](?=[^A-Z])', r'_\g<0>', self.__class__.__name__).lower().strip('_')
+        # Get entity name from snake case class name
+        return '_'.join(class_name.split('_')[1:-1])
+
+
+class ForemanInfoAnsibleModule(ForemanStatelessEntityAnsibleModule):
+    """
+    Base class for Foreman info modules that fetch information about entities
+    """
+    def __init__(self, **kwargs):
+        self._resources = []
+        foreman_spec = dict(
+            name=dict(),
+            search=dict(),
+            organization=dict(type='entity'),
+            location=dict(type='entity'),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        mutually_exclusive = kwargs.pop('mutually_exclusive', [])
+        if not foreman_spec['name'].get('invisible', False):
+            mutually_exclusive.extend([['name', 'search']])
+        super(ForemanInfoAnsibleModule, self).__init__(foreman_spec=foreman_spec, mutually_exclusive=mutually_exclusive, **kwargs)
+
+    def run(self, **kwargs):
+        """
+        lookup entities
+        """
+        self.auto_lookup_entities()
+
+        resource = self.foreman_spec['entity']['resource_type']
+
+        if 'name' in self.foreman_params:
+            self._info_result = {self.entity_name: self.lookup_entity('entity')}
+        else:
+            _flat_entity = _flatten_entity(self.foreman_params, self.foreman_spec)
+            self._info_result = {resource: self.list_resource(resource, self.foreman_params.get('search'), _flat_entity)}
+
+    def exit_json(self, **kwargs):
+        kwargs.update(self._info_result)
+        super(ForemanInfoAnsibleModule, self).exit_json(**kwargs)
+
+
+class ForemanEntityAnsibleModule(ForemanStatelessEntityAnsibleModule):
+    """ Base class for Foreman entities. To use it, subclass it with the following convention:
+        To manage my_entity entity, create the following sub class::
+
+            class ForemanMyEntityModule(ForemanEntityAnsibleModule):
+                pass
+
+        and use that class to instantiate module::
+
+            module = ForemanMyEntityModule(
+                argument_spec=dict(
+                    [...]
+                ),
+                foreman_spec=dict(
+                    [...]
+                ),
+            )
+
+        This adds a `state` parameter to the module and provides the `run` method for the most
+        common usecases.
+    """
+
+    def __init__(self, **kwargs):
+        argument_spec = dict(
+            state=dict(choices=['present', 'absent'], default='present'),
+        )
+        argument_spec.update(kwargs.pop('argument_spec', {}))
+        super(ForemanEntityAnsibleModule, self).__init__(argument_spec=argument_spec, **kwargs)
+
+        self.state = self.foreman_params.pop('state')
+        self.desired_absent = self.state == 'absent'
+        self._thin_default = self.desired_absent
+
+    def run(self, **kwargs):
+        """ lookup entities, ensure entity, remove sensitive data, manage parameters.
+        """
+        parent_name = self.foreman_params.get('parent')
+        if ('parent' in self.foreman_spec and self.foreman_spec['parent'].get('type') == 'entity'
+                and 'parent' in self.foreman_params and self.lookup_entity('parent') is None):
+            if self.desired_absent:
+                # Parent does not exist so just exit here
+                return None
+            else:
+                self.fail_json(msg="Couldn't find parent '{0}' for '{1}'.".format(parent_name, self.foreman_params['name']))
+        if not self.desired_absent:
+            self.auto_lookup_entities()
+        entity = self.lookup_entity('entity')
+
+        if not self.desired_absent:
+            updated_key = "updated_" + self.entity_key
+            if entity and updated_key in self.foreman_params:
+                self.foreman_params[self.entity_key] = self.foreman_params.pop(updated_key)
+
+        params = kwargs.get('params', {})
+        for scope in self.foreman_spec['entity'].get('scope', []):
+            params.update(self.scope_for(scope))
+        for optional_scope in self.foreman_spec['entity'].get('optional_scope', []):
+            if optional_scope in self.foreman_params:
+                params.update(self.scope_for(optional_scope))
+        new_entity = self.ensure_entity(self.foreman_spec['entity']['resource_type'], self.foreman_params, entity, params=params)
+        new_entity = self.remove_sensitive_fields(new_entity)
+
+        return new_entity
+
+    def remove_sensitive_fields(self, entity):
+        """ Set fields with 'no_log' option to None """
+        if entity:
+            for blacklisted_field in self.blacklisted_fields:
+                entity[blacklisted_field] = None
+        return entity
+
+    @property
+    def blacklisted_fields(self):
+        return [key for key, value in self.foreman_spec.items() if value.get('no_log', False)]
+
+
+class ForemanTaxonomicAnsibleModule(TaxonomyMixin, ForemanAnsibleModule):
+    """
+    Combine :class:`ForemanAnsibleModule` with the :class:`TaxonomyMixin` Mixin.
+    """
+
+    pass
+
+
+class ForemanTaxonomicEntityAnsibleModule(TaxonomyMixin, ForemanEntityAnsibleModule):
+    """
+    Combine :class:`ForemanEntityAnsibleModule` with the :class:`TaxonomyMixin` Mixin.
+    """
+
+    pass
+
+
+class ForemanScapDataStreamModule(ForemanTaxonomicEntityAnsibleModule):
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            original_filename=dict(type='str'),
+            scap_file=dict(type='path'),
+        )
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        super(ForemanScapDataStreamModule, self).__init__(foreman_spec=foreman_spec, **kwargs)
+
+    def run(self, **kwargs):
+        entity = self.lookup_entity('entity')
+
+        if not self.desired_absent:
+            if not entity and 'scap_file' not in self.foreman_params:
+                self.fail_json(msg="Content of scap_file not provided. XML containing SCAP content is required.")
+
+            if 'scap_file' in self.foreman_params and 'original_filename' not in self.foreman_params:
+                self.foreman_params['original_filename'] = os.path.basename(self.foreman_params['scap_file'])
+
+            if 'scap_file' in self.foreman_params:
+                with open(self.foreman_params['scap_file']) as input_file:
+                    self.foreman_params['scap_file'] = input_file.read()
+
+            if entity and 'scap_file' in self.foreman_params:
+                digest = hashlib.sha256(self.foreman_params['scap_file'].encode("utf-8")).hexdigest()
+                # workaround for https://projects.theforeman.org/issues/29409
+                digest_stripped = hashlib.sha256(self.foreman_params['scap_file'].strip().encode("utf-8")).hexdigest()
+                if entity['digest'] in [digest, digest_stripped]:
+                    self.foreman_params.pop('scap_file')
+
+        return super(ForemanScapDataStreamModule, self).run(**kwargs)
+
+
+class KatelloAnsibleModule(KatelloMixin, ForemanAnsibleModule):
+    """
+    Combine :class:`ForemanAnsibleModule` with the :class:`KatelloMixin` Mixin.
+    """
+
+    pass
+
+
+class KatelloScopedMixin(KatelloMixin):
+    """
+    Enhances :class:`KatelloMixin` with scoping by ``organization`` as required by Katello.
+    """
+
+    def __init__(self, **kwargs):
+        entity_opts = kwargs.pop('entity_opts', {})
+        if 'scope' not in entity_opts:
+            entity_opts['scope'] = ['organization']
+        elif 'organization' not in entity_opts['scope']:
+            entity_opts['scope'].append('organization')
+        super(KatelloScopedMixin, self).__init__(entity_opts=entity_opts, **kwargs)
+
+
+class KatelloInfoAnsibleModule(KatelloScopedMixin, ForemanInfoAnsibleModule):
+    """
+    Combine :class:`ForemanInfoAnsibleModule` with the :class:`KatelloScopedMixin` Mixin.
+    """
+
+    pass
+
+
+class KatelloEntityAnsibleModule(KatelloScopedMixin, ForemanEntityAnsibleModule):
+    """
+    Combine :class:`ForemanEntityAnsibleModule` with the :class:`KatelloScopedMixin` Mixin.
+    """
+
+    pass
+
+
+class KatelloContentExportBaseModule(KatelloAnsibleModule):
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            chunk_size_gb=dict(required=False, type='int'),
+            format=dict(required=False, type='str', choices=['syncable', 'importable']),
+            from_history_id=dict(required=False, type='int'),
+        )
+        argument_spec = dict(
+            incremental=dict(required=False, type='bool'),
+        )
+
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        argument_spec.update(kwargs.pop('argument_spec', {}))
+
+        self.export_action = kwargs.pop('export_action')
+
+        super(KatelloContentExportBaseModule, self).__init__(foreman_spec=foreman_spec, argument_spec=argument_spec, **kwargs)
+
+        # needs to happen after super().__init__()
+        self.task_timeout = 12 * 60 * 60
+
+    def run(self, **kwargs):
+        incremental = self.params['incremental']
+        endpoint = 'content_export_incrementals' if incremental else 'content_exports'
+
+        if self.params.get('from_history_id') and incremental is not True:
+            self.fail_json(msg='from_history_id is only valid for incremental exports')
+
+        if 'chunk_size_gb' in self.foreman_params and self.foreman_params['format'] == 'syncable':
+            self.fail_json(msg='chunk_size_gb is only valid for importable exports')
+
+        self.auto_lookup_entities()
+
+        payload = _flatten_entity(self.foreman_params, self.foreman_spec)
+        task = self.resource_action(endpoint, self.export_action, payload)
+
+        self.exit_json(task=task)
+
+
+class KatelloContentImportBaseModule(KatelloAnsibleModule):
+
+    def __init__(self, **kwargs):
+        foreman_spec = dict(
+            path=dict(required=True, type='str'),
+            metadata_file=dict(required=False, type='str'),
+            metadata=dict(required=False, type='dict')
+        )
+        argument_spec = {}
+        foreman_spec.update(kwargs.pop('foreman_spec', {}))
+        argument_spec.update(kwargs.pop('argument_spec', {}))
+
+        self.import_action = kwargs.pop('import_action')
+
+        super(KatelloContentImportBaseModule, self).__init__(foreman_spec=foreman_spec,
+                                                             required_one_of=[['metadata', 'metadata_file']],
+                                                             argument_spec=argument_spec, **kwargs)
+
+        # needs to happen after super().__init__()
+        self.task_timeout = 12 * 60 * 60
+
+    def run(self, **kwargs):
+        metadata_file = self.params.get('metadata_file')
+        self.auto_lookup_entities()
+        payload = _flatten_entity(self.foreman_params, self.foreman_spec)
+
+        if payload.get("metadata") is None and metadata_file:
+            payload["metadata"] = json.load(open(metadata_file))
+            payload.pop("metadata_file")
+
+        endpoint = 'content_imports'
+        task = self.resource_action(endpoint, self.import_action, payload)
+        self.exit_json(task=task)
+
+
+def _foreman_spec_helper(spec):
+    """Extend an entity spec by adding entries for all flat_names.
+    Extract Ansible compatible argument_spec on the way.
+    """
+    foreman_spec = {}
+    argument_spec = {}
+
+    _FILTER_SPEC_KEYS = {
+        'ensure',
+        'failsafe',
+        'flat_name',
+        'foreman_spec',
+        'invisible',
+        'optional_scope',
+        'resolve',
+        'resource_type',
+        'scope',
+        'search_by',
+        'search_operator',
+        'thin',
+        'type',
+    }
+    _VALUE_SPEC_KEYS = {
+        'ensure',
+        'type',
+    }
+    _ENTITY_SPEC_KEYS = {
+        'failsafe',
+        'optional_scope',
+        'resolve',
+        'resource_type',
+        'scope',
+        'search_by',
+        'search_operator',
+        'thin',
+    }
+
+    # _foreman_spec_helper() is called before we call check_requirements() in the __init__ of ForemanAnsibleModule
+    # and thus before the if HAS APYPIE check happens.
+    # We have to ensure that apypie is available before using it.
+    # There is two cases where we can call _foreman_spec_helper() without apypie available:
+    # * When the user calls the module but doesn't have the right Python libraries installed.
+    #   In this case nothing will works and the module will warn the user to install the required library.
+    # * When Ansible generates docs from the argument_spec. As the inflector is only used to build foreman_spec and not argument_spec,
+    #   This is not a problem.
+    #
+    # So in conclusion, we only have to verify that apypie is available before using it.
+    # Lazy evaluation helps there.
+    for key, value in spec.items():
+        foreman_value = {k: v for (k, v) in value.items() if k in _VALUE_SPEC_KEYS}
+        argument_value = {k: v for (k, v) in value.items() if k not in _FILTER_SPEC_KEYS}
+
+        foreman_type = value.get('type')
+        ansible_invisible = value.get('invisible', False)
+        flat_name = value.get('flat_name')
+
+        if foreman_type == 'entity':
+            if not flat_name:
+                flat_name = '{0}_id'.format(key)
+            foreman_value['resource_type'] = HAS_APYPIE and inflector.pluralize(key)
+            foreman_value.update({k: v for (k, v) in value.items() if k in _ENTITY_SPEC_KEYS})
+        elif foreman_type == 'entity_list':
+            argument_value['type'] = 'list'
+            argument_value['elements'] = value.get('elements', 'str')
+            if not flat_name:
+                flat_name = '{0}_ids'.format(HAS_APYPIE and inflector.singularize(key))
+            foreman_value['resource_type'] = key
+            foreman_value.update({k: v for (k, v) in value.items() if k in _ENTITY_SPEC_KEYS})
+        elif foreman_type == 'nested_list':
+            argument_value['type'] = 'list'
+            argument_value['elements'] = 'dict'
+            foreman_value['foreman_spec'], argument_value['options'] = _foreman_spec_helper(value['foreman_spec'])
+            foreman_value['ensure'] = value.get('ensure', False)
+        elif foreman_type:
+            argument_value['type'] = foreman_type
+
+        if flat_name:
+            foreman_value['flat_name'] = flat_name
+            foreman_spec[flat_name] = {}
+            # When translating to a flat name, the flattened entry should get the same "type"
+            # as Ansible expects so that comparison still works for non-strings
+            if argument_value.get('type') is not None:
+                foreman_spec[flat_name]['type'] = argument_value['type']
+
+        foreman_spec[key] = foreman_value
+
+        if not ansible_invisible:
+            argument_spec[key] = argument_value
+
+    return foreman_spec, argument_spec
+
+
+def _flatten_entity(entity, foreman_spec):
+    """Flatten entity according to spec"""
+    result = {}
+    if entity is None:
+        entity = {}
+    for key, value in entity.items():
+        if key in foreman_spec and foreman_spec[key].get('ensure', True) and value is not None:
+            spec = foreman_spec[key]
+            flat_name = spec.get('flat_name', key)
+            property_type = spec.get('type', 'str')
+            if property_type == 'entity':
+                if value is not NoEntity:
+                    result[flat_name] = value['id']
+                else:
+                    result[flat_name] = None
+            elif property_type == 'entity_list':
+                result[flat_name] = sorted(val['id'] for val in value)
+            elif property_type == 'nested_list':
+                result[flat_name] = [_flatten_entity(ent, foreman_spec[key]['foreman_spec']) for ent in value]
+            else:
+                result[flat_name] = value
+    return result
+
+
+def _recursive_dict_keys(a_dict):
+    """Find all keys of a nested dictionary"""
+    keys = set(a_dict.keys())
+    for _k, v in a_dict.items():
+        if isinstance(v, dict):
+            keys.update(_recursive_dict_keys(v))
+    return keys
+
+
+def _recursive_dict_without_none(a_dict, exclude=None):
+    """
+    Remove all entries with `None` value from a dict, recursively.
+    Also drops all entries with keys in `exclude` in the top level.
+    """
+    if exclude is None:
+        exclude = []
+
+    result = {}
+
+    for (k, v) in a_dict.items():
+        if v is not None and k not in exclude:
+            if isinstance(v, dict):
+                v = _recursive_dict_without_none(v)
+            elif isinstance(v, list) and v and isinstance(v[0], dict):
+                v = [_recursive_dict_without_none(element) for element in v]
+            result[k] = v
+
+    return result
+
+
+def _read_status_cache(cache_file, key, ttl):
+    """
+    Read a status response from the status cache.
+    Returns `None` if there is no usable entry for `key` that is younger than `ttl` seconds.
+    """
+    try:
+        with open(cache_file) as cache:
+            cached = json.load(cache)
+        age = time.time() - cached['timestamp']
+        if cached['key'] == key and 0 <= age < ttl and isinstance(cached['status'], dict):
+            return cached['status']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_status_cache(cache_file, key, status):
+    """
+    Store a status response in the status cache.
+    The file is replaced atomically, failures to write it are ignored.
+    """
+    cached = {'key': key, 'timestamp': time.time(), 'status': status}
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix='.status-')
+        try:
+            with os.fdopen(fd, 'w') as cache:
+                json.dump(cached, cache)
+            os.rename(tmp_name, cache_file)
+        except Exception:
+            os.unlink(tmp_name)
+            raise
+    except (IOError, OSError, TypeError, ValueError):
+        pass
+
+
+def _is_resolved(spec, what):
+    if spec.get('type') not in ('entity', 'entity_list'):
+        return True
+
+    if spec.get('type') == 'entity' and (what is None or isinstance(what, dict)):
+        return True
+
+    if spec.get('type') == 'entity_list' and isinstance(what, list) and what and (what[0] is None or isinstance(what[0], dict)):
+        return True
+
+    return False
+
+
+# Helper for (global, operatingsystem, ...) parameters
+def parameter_value_to_str(value, parameter_type):
+    """Helper to convert the value of parameters to string according to their parameter_type."""
+    if parameter_type in ['real', 'integer']:
+        parameter_string = str(value)
+    elif parameter_type in ['array', 'hash', 'yaml', 'json']:
+        parameter_string = json.dumps(value, sort_keys=True)
+    else:
+        parameter_string = value
+    return parameter_string
+
+
+# Helper for converting lists of parameters
+def parameters_list_to_str_list(parameters):
+    filtered_params = []
+    for param in parameters:
+        new_param = {k: v for (k, v) in param.items() if k in parameter_ansible_spec.keys()}
+        new_param['value'] = parameter_value_to_str(new_param['value'], new_param.get('parameter_type', 'string'))
+        filtered_params.append(new_param)
+    return filtered_params
+
+
+# Helper for templates
+def parse_template(template_content, module):
+    if not HAS_PYYAML:
+        module.fail_json(msg=missing_required_lib("PyYAML"), exception=PYYAML_IMP_ERR)
+
+    try:
+        template_dict = {}
+        data = re.search(
+            r'<%#([^%]*([^%]*%*[^>%])*%*)%>', template_content)
+        if data:
+            datalist = data.group(1)
+            if datalist[-1] == '-':
+                datalist = datalist[:-1]
+            template_dict = yaml.safe_load(datalist)
+        # No metadata, import template anyway
+        template_dict['template'] = template_content
+    except Exception as e:
+        module.fail_json(msg='Error while parsing template: ' + to_native(e))
+    return template_dict
+
+
+def parse_template_from_file(file_name, module):
+    try:
+        with open(file_name) as input_file:
+            template_content = input_file.read()
+            template_dict = parse_template(template_content, module)
+    except Exception as e:
+        module.fail_json(msg='Error while reading template file: ' + to_native(e))
+    return template_dict
+
+
+# Helper for titles
+def split_fqn(title):
+    """ Split fully qualified name (title) in name and parent title """
+    fqn = title.split('/')
+    if len(fqn) > 1:
+        name = fqn.pop()
+        return (name, '/'.join(fqn))
+    else:
+        return (title, None)
+
+
+def build_fqn(name, parent=None):
+    if parent:
+        return "%s/%s" % (parent, name)
+    else:
+        return name
+
+
+# Helper for puppetclasses
+def ensure_puppetclasses(module, entity_type, entity, expected_puppetclasses=None):
+    if expected_puppetclasses is not None:
+        puppetclasses_resource = '{0}_classes'.format(entity_type)
+        expected_puppetclasses = module.find_puppetclasses(expected_puppetclasses, environment=entity['environment_id'], thin=True)
+        current_puppetclasses = entity.get('puppetclasses', [])
+        current_puppetclass_ids = [pc['id'] for pc in current_puppetclasses]
+        previous_puppetclass_ids = current_puppetclass_ids[:]
+        for puppetclass in expected_puppetclasses:
+            if puppetclass['id'] in current_puppetclass_ids:
+                # Nothing to do, prevent removal
+                previous_puppetclass_ids.remove(puppetclass['id'])
+            else:
+                payload = {'{0}_id'.format(entity_type): entity['id'], 'puppetclass_id': puppetclass['id']}
+                module.ensure_entity(puppetclasses_resource, {}, None, params=payload, state='present', foreman_spec={})
+                # Add to entity for reporting
+                current_puppetclass_ids.append(puppetclass['id'])
+
+        for leftover_puppetclass in previous_puppetclass_ids:
+            payload = {'{0}_id'.format(entity_type): entity['id']}
+            module.ensure_entity(
+                puppetclasses_resource, {}, {'id': leftover_puppetclass},
+                params=payload, state='absent', foreman_spec={},
+            )
+            current_puppetclass_ids.remove(leftover_puppetclass)
+        entity['puppetclass_ids'] = current_puppetclass_ids
+
+
+# Helper constants
+OS_LIST = ['AIX',
+           'Altlinux',
+           'Archlinux',
+           'Coreos',
+           'Debian',
+           'Fcos',
+           'Freebsd',
+           'Gentoo',
+           'Junos',
+           'NXOS',
+           'Rancheros',
+           'Redhat',
+           'Rhcos',
+           'Solaris',
+           'Suse',
+           'VRP',
+           'Windows',
+           'Xenserver',
+           ]
+
+TEMPLATE_KIND_LIST = [
+    'Bootdisk',
+    'cloud-init',
+    'finish',
+    'host_init_config',
+    'iPXE',
+    'job_template',
+    'kexec',
+    'POAP',
+    'provision',
+    'PXEGrub',
+    'PXEGrub2',
+    'PXELinux',
+    'registration',
+    'script',
+    'user_data',
+    'ZTP',
+]
+
+# interface specs
+interfaces_spec = dict(
+    id=dict(invisible=True),
+    mac=dict(),
+    ip=dict(),
+    ip6=dict(),
+    type=dict(choices=['interface', 'bmc', 'bond', 'bridge']),
+    name=dict(),
+    subnet=dict(type='entity'),
+    subnet6=dict(type='entity', resource_type='subnets'),
+    domain=dict(type='entity'),
+    identifier=dict(),
+    managed=dict(type='bool'),
+    primary=dict(type='bool'),
+    provision=dict(type='bool'),
+    execution=dict(type='bool'),
+    username=dict(),
+    password=dict(no_log=True),
+    provider=dict(choices=['IPMI', 'Redfish', 'SSH']),
+    virtual=dict(type='bool'),
+    tag=dict(),
+    mtu=dict(type='int'),
+    attached_to=dict(),
+    mode=dict(choices=[
+        'balance-rr',
+        'active-backup',
+        'balance-xor',
+        'broadcast',
+        '802.3ad',
+        'balance-tlb',
+        'balance-alb',
+    ]),
+    attached_devices=dict(type='list', elements='str'),
+    bond_options=dict(),
+    compute_attributes=dict(type='dict'),
+)
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# (c) 2016, Eric D Helms <ericdhelms@gmail.com>
+# (c) 2019, Matthias M Dellweg <dellweg@atix.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: repository_sync
+version_added: 1.0.0
+short_description: Sync a Repository or Product
+description:
+  - Sync a repository or product
+author:
+  - "Eric D Helms (@ehelms)"
+  - "Matthias M Dellweg (@mdellweg) ATIX AG"
+options:
+  product:
+    description: Product to which the I(repository) lives in
+    required: true
+    type: str
+  repository:
+    description: |
+      Name of the repository to sync
+      If omitted, all repositories in I(product) are synched.
+    type: str
+  wait:
+    description:
+      - Wait for the sync task to finish.
+      - When set to C(false), the started task is returned right away and can be waited for
+        later, for example with M(theforeman.foreman.wait_for_task).
+    type: bool
+    default: true
+    version_added: 4.3.0
+extends_documentation_fragment:
+  - theforeman.foreman.foreman
+  - theforeman.foreman.foreman.organization
+...
+'''
+
+EXAMPLES = '''
+- name: "Sync repository"
+  theforeman.foreman.repository_sync:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    repository: "My repository"
+    product: "My Product"
+    organization: "Default Organization"
+
+- name: "Start the sync of multiple products"
+  theforeman.foreman.repository_sync:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    product: "{{ item }}"
+    organization: "Default Organization"
+    wait: false
+  loop:
+    - "My Product"
+    - "My other Product"
+  register: syncs
+
+- name: "Wait for all syncs to finish"
+  theforeman.foreman.wait_for_task:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    tasks: "{{ syncs.results | map(attribute='task') | map(attribute='id') | list }}"
+    timeout: 43200
+'''
+
+RETURN = '''
+task:
+  description: The sync task, finished unless I(wait=false)
+  returned: success
+  type: dict
+'''
+
+from ansible_collections.theforeman.foreman.plugins.module_utils.foreman_helper import KatelloAnsibleModule
+
+
+def main():
+    module = KatelloAnsibleModule(
+        foreman_spec=dict(
+            product=dict(type='entity', scope=['organization'], required=True),
+            repository=dict(type='entity', scope=['product']),
+        ),
+        argument_spec=dict(
+            wait=dict(type='bool', default=True),
+        ),
+    )
+
+    module.task_timeout = 12 * 60 * 60
+
+    with module.api_connection():
+        product = module.lookup_entity('product')
+        repository = module.lookup_entity('repository')
+        wait = module.params['wait']
+        if repository:
+            task = module.resource_action('repositories', 'sync', {'id': repository['id']}, wait_for_task=wait)
+        else:
+            task = module.resource_action('products', 'sync', {'id': product['id']}, wait_for_task=wait)
+
+        module.exit_json(task=task)
+
+
+if __name__ == '__main__':
+    main()
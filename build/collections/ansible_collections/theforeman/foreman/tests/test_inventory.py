@@ -0,0 +1,763 @@
+import os
+import threading
+
+import pytest
+import yaml
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+from plugins.inventory import foreman as foreman_inventory
+
+
+URL = 'https://foreman.example.test'
+
+OPTION_DEFAULTS = dict((name, option.get('default')) for name, option in yaml.safe_load(foreman_inventory.DOCUMENTATION)['options'].items())
+# options of the constructed and inventory_cache doc fragments
+OPTION_DEFAULTS.update(compose={}, groups={}, keyed_groups=[], strict=False, use_extra_vars=False, leading_separator=True, cache=False)
+
+HOSTS = [{'id': i, 'name': 'host{0}.example.com'.format(i), 'hostgroup_title': 'base/web{0}'.format(i % 3),
+          'updated_at': '2024-01-0{0}T00:00:00Z'.format(1 + i % 5), 'organization_name': 'ACME'} for i in range(1, 11)]
+
+
+class FakeResponse(object):
+    def __init__(self, data=None, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __bool__(self):
+        return self.status_code < 400
+
+    __nonzero__ = __bool__
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception('HTTP {0}'.format(self.status_code))
+
+    def json(self):
+        return self.data
+
+
+class FakeSession(object):
+    """
+    Session answering the requests of the inventory plugin from a list of hosts, recording the requests made.
+    """
+
+    def __init__(self, hosts=None):
+        self.hosts = [dict(host) for host in (HOSTS if hosts is None else hosts)]
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, verify=None):
+        params = dict(params or {})
+        with self.lock:
+            self.calls.append((url[len(URL):], params))
+        parts = url[len(URL):].strip('/').split('/')
+        if parts == ['api', 'v2', 'hosts']:
+            return self.paged(self.list_hosts(params), params)
+        if parts == ['api', 'v2', 'fact_values']:
+            facts = dict((host['name'], self.facts(host)) for host in self.hosts)
+            return self.paged_facts(facts, params)
+        host = next((host for host in self.hosts if str(host['id']) == parts[3]), None)
+        if host is None:
+            return FakeResponse(status_code=404)
+        if parts[4:] == ['facts']:
+            return self.paged_facts({host['name']: self.facts(host)}, params)
+        return FakeResponse(dict(host, all_parameters=[{'name': 'param{0}'.format(host['id']), 'value': host['id']}],
+                                 host_collections=[{'name': 'Collection {0}'.format(host['id'] % 2)}]))
+
+    def list_hosts(self, params):
+        hosts = self.hosts
+        search = params.get('search') or ''
+        if 'updated_at >= ' in search:
+            hosts = [host for host in hosts if host['updated_at'] >= search.split('updated_at >= "')[1].split('"')[0]]
+        if 'id ^ ' in search:
+            ids = search.split('id ^ (')[1].split(')')[0].split(',')
+            hosts = [host for host in hosts if str(host['id']) in ids]
+        if params.get('thin'):
+            hosts = [{'id': host['id'], 'name': host['name']} for host in hosts]
+        return hosts
+
+    @staticmethod
+    def facts(host):
+        return {'fact_id': host['id'], 'fact_name': host['name'], 'other_fact': 'x'}
+
+    @staticmethod
+    def paged(results, params):
+        page, per_page = params.get('page', 1), params['per_page']
+        return FakeResponse({'subtotal': len(results), 'total': len(results), 'results': results[(page - 1) * per_page:page * per_page]})
+
+    @staticmethod
+    def paged_facts(facts, params):
+        # one fact value per result, like /api/v2/fact_values does
+        values = [(name, fact, value) for name, host_facts in sorted(facts.items()) for fact, value in sorted(host_facts.items())]
+        search = params.get('search') or ''
+        if 'fact ^ ' in search:
+            names = search.split('fact ^ (')[1].split(')')[0].replace('"', '').split(',')
+            values = [value for value in values if value[1] in names]
+        page, per_page = params.get('page', 1), params['per_page']
+        results = {}
+        for name, fact, value in values[(page - 1) * per_page:page * per_page]:
+            results.setdefault(name, {})[fact] = value
+        return FakeResponse({'results': results})
+
+
+def make_plugin(session=None, **options):
+    plugin = foreman_inventory.InventoryModule()
+    options = dict(OPTION_DEFAULTS, url=URL, user='admin', password='changeme', **options)
+    plugin.get_option = options.get
+    plugin.foreman_url = URL
+    plugin.inventory = InventoryData()
+    plugin.templar = Templar(loader=DataLoader())
+    plugin._cache = {}
+    plugin.cache_key = 'test'
+    plugin.use_cache = False
+    plugin.session = session or FakeSession()
+    return plugin
+
+
+class FakeDisplay(object):
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+
+def make_url_cache(path, namespace='test admin', max_age=3600):
+    return foreman_inventory._UrlCache(path, namespace, max_age, FakeDisplay())
+
+
+def dump_inventory(inventory):
+    hosts = dict((name, host.get_vars()) for name, host in inventory.hosts.items())
+    groups = dict((name, (sorted(host.name for host in group.hosts), sorted(child.name for child in group.child_groups)))
+                  for name, group in inventory.groups.items())
+    return hosts, groups
+
+
+@pytest.mark.parametrize('bulk_facts', [False, True])
+def test_host_api_prefetch_matches_sequential(bulk_facts):
+    options = dict(want_params=True, want_hostcollections=True, want_facts=True, bulk_facts=bulk_facts)
+    sequential = make_plugin(max_workers=1, **options)
+    sequential._populate_host_api()
+    concurrent = make_plugin(max_workers=4, **options)
+    concurrent._populate_host_api()
+
+    assert dump_inventory(concurrent.inventory) == dump_inventory(sequential.inventory)
+    assert sorted(map(repr, concurrent.session.calls)) == sorted(map(repr, sequential.session.calls))
+    hostvars = sequential.inventory.get_host('host1.example.com').get_vars()
+    assert hostvars['param1'] == 1
+    assert hostvars['foreman_facts'] == FakeSession.facts(HOSTS[0])
+    assert 'foreman_hostcollection_collection1' in sequential.inventory.groups
+
+
+class MissingDetailsSession(FakeSession):
+    """
+    FakeSession answering the requests for the details of host2 with 404, as when it is deleted during the run.
+    """
+
+    def get(self, url, params=None, verify=None):
+        if url == '%s/api/v2/hosts/2' % URL:
+            return FakeResponse(status_code=404)
+        return super(MissingDetailsSession, self).get(url, params, verify)
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_missing_host_details(max_workers):
+    plugin = make_plugin(MissingDetailsSession(), want_params=True, max_workers=max_workers)
+    plugin._populate_host_api()
+    assert 'param1' in plugin.inventory.get_host('host1.example.com').get_vars()
+    assert 'param2' not in plugin.inventory.get_host('host2.example.com').get_vars()
+
+    plugin = make_plugin(MissingDetailsSession(), want_params=True, want_hostcollections=True, max_workers=max_workers)
+    with pytest.raises(Exception, match='HTTP 404'):
+        plugin._populate_host_api()
+
+
+class ChangingSession(FakeSession):
+    """
+    FakeSession whose hosts change right after the first page of hosts was returned.
+    """
+
+    def __init__(self, change):
+        super(ChangingSession, self).__init__()
+        self.change = change
+
+    def list_hosts(self, params):
+        hosts = list(super(ChangingSession, self).list_hosts(params))
+        if self.change is not None:
+            self.change(self.hosts)
+            self.change = None
+        return hosts
+
+
+def add_hosts(hosts):
+    hosts.extend(dict(HOSTS[0], id=i, name='host{0}.example.com'.format(i)) for i in range(11, 17))
+
+
+def delete_host(hosts):
+    del hosts[1]
+
+
+@pytest.mark.parametrize('change', [None, add_hosts, delete_host])
+def test_parallel_pages(change):
+    listings = []
+    for parallel_pages in (1, 3):
+        # 4 hosts per page, the last one of the 10 hosts being short
+        plugin = make_plugin(ChangingSession(change), batch_size=4, parallel_pages=parallel_pages)
+        listings.append([host['id'] for host in plugin._get_hosts()])
+
+    assert listings[1] == listings[0]
+    if change is add_hosts:
+        assert listings[0] == list(range(1, 17))
+    elif change is None:
+        assert listings[0] == list(range(1, 11))
+
+
+def run_incremental(session, cache, **options):
+    plugin = make_plugin(session, incremental=True, want_params=True, **options)
+    plugin._cache = cache
+    plugin.use_cache = bool(cache)
+    plugin._populate_host_api()
+    return plugin
+
+
+def test_incremental_merges_snapshot():
+    session = FakeSession()
+    first = run_incremental(session, {})
+    snapshot = first._cache['test'][foreman_inventory.INCREMENTAL_SNAPSHOT_KEY]
+    assert snapshot['updated_at'] == '2024-01-05T00:00:00Z'
+    assert len(snapshot['hosts']) == len(HOSTS)
+
+    # host2 changed, host3 got deleted and host11, older than the snapshot, started to match the filters
+    session.hosts[1].update(updated_at='2024-02-01T00:00:00Z', hostgroup_title='base/db')
+    del session.hosts[2]
+    session.hosts.append({'id': 11, 'name': 'host11.example.com', 'hostgroup_title': 'base/web2', 'updated_at': '2023-12-01T00:00:00Z'})
+    session.calls = []
+    second = run_incremental(session, first._cache)
+
+    host_searches = [params.get('search') for url, params in session.calls if url == '/api/v2/hosts']
+    assert host_searches == ['updated_at >= "2024-01-05T00:00:00Z"', None, 'id ^ (11)']
+    assert sorted(second.inventory.hosts) == sorted(host['name'] for host in session.hosts)
+    assert second.inventory.get_host('host2.example.com').get_vars()['foreman_updated_at'] == '2024-02-01T00:00:00Z'
+    assert 'host2.example.com' in [host.name for host in second.inventory.groups['foreman_base_db'].hosts]
+    assert second.inventory.get_host('host11.example.com').get_vars()['param11'] == 11
+    snapshot = second._cache['test'][foreman_inventory.INCREMENTAL_SNAPSHOT_KEY]
+    assert snapshot['updated_at'] == '2024-02-01T00:00:00Z'
+    assert sorted(host['id'] for host in snapshot['hosts']) == sorted(host['id'] for host in session.hosts)
+    # only the details of changed and new hosts are fetched again, including the ones updated at the time of the snapshot
+    detail_urls = sorted(url for url, params in session.calls if url != '/api/v2/hosts')
+    assert detail_urls == ['/api/v2/hosts/11', '/api/v2/hosts/2', '/api/v2/hosts/4', '/api/v2/hosts/9']
+
+
+def test_incremental_invalidates_url_cache(tmpdir):
+    session = FakeSession()
+    first = run_incremental(session, {})
+    url_cache = make_url_cache(str(tmpdir))
+    details = dict((hid, '%s/api/v2/hosts/%s' % (URL, hid)) for hid in (1, 2, 3))
+    for url in details.values():
+        url_cache.store(foreman_inventory._url_cache_key(url), {'cached': True})
+
+    session.hosts[1]['updated_at'] = '2024-02-01T00:00:00Z'
+    del session.hosts[2]
+    second = make_plugin(session, incremental=True)
+    second._cache = first._cache
+    second.use_cache = True
+    second.url_cache = url_cache
+    second._get_hosts()
+
+    assert url_cache.load(foreman_inventory._url_cache_key(details[1]))[1] == {'cached': True}
+    assert url_cache.load(foreman_inventory._url_cache_key(details[2])) is None
+    assert url_cache.load(foreman_inventory._url_cache_key(details[3])) is None
+
+
+@pytest.mark.parametrize('report,expected', [
+    ('[]', []),
+    (' \n[ \t]\r\n', []),
+    ('[{"name": "a"},null, \n {"name": "b", "facts": {"x": [1, 2]}} ]', [{'name': 'a'}, None, {'name': 'b', 'facts': {'x': [1, 2]}}]),
+    ([{'name': 'a'}, None], [{'name': 'a'}, None]),
+])
+def test_iter_report_hosts(report, expected):
+    assert list(foreman_inventory._iter_report_hosts(report)) == expected
+
+
+def test_iter_report_hosts_copies_legacy_hosts():
+    report = [{'name': 'a', 'facts': {}}]
+    for host in foreman_inventory._iter_report_hosts(report):
+        host.pop('facts')
+    assert report == [{'name': 'a', 'facts': {}}]
+
+
+@pytest.mark.parametrize('report', ['', '{"name": "a"}', '[{"name": "a"} {"name": "b"}]', '[{"name": "a"}, {"name":', '[{"name": "a"}'])
+def test_iter_report_hosts_malformed(report):
+    with pytest.raises((ValueError, foreman_inventory.AnsibleError)):
+        foreman_inventory._validate_report(report)
+
+
+def test_malformed_report_falls_back_to_host_api(monkeypatch):
+    plugin = make_plugin()
+    plugin.want_hostcollections = False
+    # the first host can be decoded, the report is broken later on
+    monkeypatch.setattr(plugin, '_post_request', lambda: '[{"name": "host1.example.com", "hostgroup_title": "report"}, {"name": ')
+    warnings = []
+    monkeypatch.setattr(plugin.display, 'warning', warnings.append)
+    plugin._populate_report_api()
+
+    assert len(warnings) == 1 and 'falling back to Hosts API' in warnings[0]
+    assert sorted(plugin.inventory.hosts) == sorted(host['name'] for host in HOSTS)
+    assert 'foreman_report' not in plugin.inventory.groups
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.jitters = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def uniform(self, a, b):
+        # always wait as long as the jitter allows
+        self.jitters.append((a, b))
+        return b
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(foreman_inventory, 'time', clock.time)
+    monkeypatch.setattr(foreman_inventory, 'sleep', clock.sleep)
+    monkeypatch.setattr(foreman_inventory.random, 'uniform', clock.uniform)
+    return clock
+
+
+class ReportSession(object):
+    """
+    Session scheduling inventory reports, answering the polls with the given responses and repeating the last one.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, json=None):
+        self.posts += 1
+        return FakeResponse({'data_url': 'ansible/api/v2/ansible_inventories/%d' % self.posts})
+
+    def get(self, url, params=None, verify=None):
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+
+REPORT = '[{"name": "host1.example.com"}]'
+
+
+@pytest.mark.parametrize('value,expected', [('12', 12), ('0.5', 0.5), ('-3', 0), ('Thu, 01 Jan 1970 00:17:00 GMT', 20), ('soon', None), ('', None)])
+def test_retry_after(clock, value, expected):
+    assert foreman_inventory._retry_after(FakeResponse(status_code=503, headers={'Retry-After': value})) == expected
+
+
+def test_retry_after_missing():
+    assert foreman_inventory._retry_after(FakeResponse(status_code=204)) is None
+
+
+def test_poll_backoff(clock):
+    plugin = make_plugin(ReportSession(*[FakeResponse(status_code=204)] * 5 + [FakeResponse(REPORT)]),
+                         poll_interval=2, poll_backoff=2, max_poll_interval=10)
+    assert plugin._post_request() == REPORT
+    assert clock.sleeps == pytest.approx([2.4, 4.8, 9.6, 12, 12])
+    jitter = foreman_inventory.POLL_JITTER
+    assert clock.jitters == [(1 - jitter, 1 + jitter)] * 5
+
+
+def test_poll_retry_after(clock):
+    plugin = make_plugin(ReportSession(FakeResponse(status_code=204, headers={'Retry-After': '7'}),
+                                       FakeResponse(status_code=429, headers={'Retry-After': '3'}),
+                                       FakeResponse(status_code=503, headers={'Retry-After': 'Thu, 01 Jan 1970 00:16:55 GMT'}),
+                                       FakeResponse(status_code=204),
+                                       FakeResponse(REPORT)),
+                         poll_interval=2)
+    assert plugin._post_request() == REPORT
+    # the server asked delays neither get jitter nor increase the next delay
+    assert clock.sleeps == pytest.approx([7, 3, 5, 2.4])
+    assert len(clock.jitters) == 1
+
+
+def test_poll_error_without_retry_after(clock):
+    plugin = make_plugin(ReportSession(FakeResponse(status_code=204), FakeResponse(status_code=503)))
+    with pytest.raises(Exception, match='Error receiving inventory report'):
+        plugin._post_request()
+    assert len(clock.sleeps) == 1
+
+
+def test_poll_timeout(clock):
+    plugin = make_plugin(ReportSession(FakeResponse(status_code=204)), poll_interval=4, poll_backoff=1, max_timeout=10)
+    with pytest.raises(Exception, match='Timeout receiving inventory report'):
+        plugin._post_request()
+    # the last poll happens right at the deadline
+    assert clock.sleeps == pytest.approx([4.8, 4.8, 0.4])
+
+
+def test_report_reuse_ttl(clock):
+    session = ReportSession(FakeResponse(REPORT))
+    first = make_plugin(session)
+    assert first._post_request() == REPORT
+
+    # the cache is being refreshed, but the report is recent enough to be reused
+    clock.now += 30
+    second = make_plugin(session, report_reuse_ttl=60)
+    second._cache = first._cache
+    assert second._post_request() == REPORT
+    assert session.posts == 1
+
+    clock.now += 31
+    third = make_plugin(session, report_reuse_ttl=60)
+    third._cache = first._cache
+    assert third._post_request() == REPORT
+    assert session.posts == 2
+
+    # reports for other input values are never reused
+    other = make_plugin(session, report_reuse_ttl=60, want_facts=True)
+    other._cache = first._cache
+    other._post_request()
+    assert session.posts == 3
+
+
+def test_report_reuse_ttl_url_cache(clock, tmpdir):
+    session = ReportSession(FakeResponse(REPORT))
+    url_cache = make_url_cache(str(tmpdir))
+    for elapsed, expected_posts in ((0, 1), (30, 1), (61, 2)):
+        clock.now += elapsed
+        plugin = make_plugin(session, report_reuse_ttl=60)
+        plugin.url_cache = url_cache
+        plugin.use_url_cache = False
+        assert plugin._post_request() == REPORT
+        assert session.posts == expected_posts
+
+
+def test_url_cache_round_trip(clock, tmpdir):
+    url_cache = make_url_cache(str(tmpdir.join('cache')))
+    assert url_cache.load('key') is None
+    url_cache.store('key', {'results': [1, 'two', None]})
+    assert url_cache.load('key') == (1000.0, {'results': [1, 'two', None]})
+    # no temporary files are left behind
+    assert len(tmpdir.join('cache').listdir()) == 1
+
+    url_cache.invalidate('key')
+    assert url_cache.load('key') is None
+    url_cache.invalidate('key')
+
+
+def test_url_cache_mismatch(tmpdir):
+    url_cache = make_url_cache(str(tmpdir))
+    url_cache.store('key', 'data')
+    assert make_url_cache(str(tmpdir), 'test other').load('key') is None
+    assert url_cache.load('other') is None
+
+    # entries stored for another key (e.g. a hash collision) are not used either
+    os.rename(url_cache._entry_file('key'), url_cache._entry_file('other'))
+    assert url_cache.load('other') is None
+
+    # neither are broken entries
+    with open(url_cache._entry_file('key'), 'w') as entry_file:
+        entry_file.write('garbage')
+    assert url_cache.load('key') is None
+
+
+@pytest.mark.parametrize('path,kind', [
+    ('/api/v2/hosts', 'hosts'),
+    ('/api/v2/hosts/1', 'host'),
+    ('/api/v2/hosts/host1.example.com/facts', 'facts'),
+    ('/ansible/api/v2/ansible_inventories/schedule', 'report'),
+    ('/api/v2/fact_values', 'other'),
+    ('/api/v2/status', 'other'),
+])
+def test_url_cache_ttl(path, kind):
+    ttls = {'hosts': 1, 'host': 2, 'facts': 3, 'report': 4, 'other': 5}
+    assert make_plugin(url_cache_ttl=ttls)._url_cache_ttl(URL + path) == ttls[kind]
+    # kinds which are not configured keep their default
+    assert make_plugin(url_cache_ttl={})._url_cache_ttl(URL + path) == foreman_inventory.URL_CACHE_DEFAULT_TTL[kind]
+
+
+def test_url_cache_expiry(clock, tmpdir):
+    session = FakeSession()
+    url_cache = make_url_cache(str(tmpdir))
+
+    def get_host(use_url_cache):
+        plugin = make_plugin(session, url_cache_ttl={'host': 60})
+        plugin.url_cache = url_cache
+        plugin.use_url_cache = use_url_cache
+        plugin._get_host_data_by_id(1)
+        return len(session.calls)
+
+    assert get_host(True) == 1
+    clock.now += 59
+    assert get_host(True) == 1
+    # refreshing the cache fetches the entry again
+    assert get_host(False) == 2
+    clock.now += 60
+    assert get_host(True) == 3
+
+
+@pytest.mark.parametrize('patterns,expected', [
+    (None, None),
+    ([], None),
+    (['fact_id'], 'fact ^ ("fact_id")'),
+    (['fact_id', 'other_fact'], 'fact ^ ("fact_id","other_fact")'),
+    (['fact_*'], None),
+    (['fact_id', 'other_fac?'], None),
+    (['[fo]act_id'], None),
+])
+def test_facts_search(patterns, expected):
+    assert foreman_inventory._facts_search(patterns) == expected
+
+
+@pytest.mark.parametrize('patterns,expected', [
+    (None, ['FACT_ID', 'fact_id', 'fact_name', 'other_fact']),
+    (['fact_*'], ['fact_id', 'fact_name']),
+    (['other_fac?', 'FACT_ID'], ['FACT_ID', 'other_fact']),
+    (['missing'], []),
+])
+def test_filter_facts(patterns, expected):
+    facts = {'fact_id': 1, 'fact_name': 'a', 'other_fact': 'x', 'FACT_ID': 2}
+    assert sorted(make_plugin(facts_filter=patterns)._filter_facts(facts)) == expected
+
+
+@pytest.mark.parametrize('patterns,fetched,populated', [
+    (None, ['fact_id', 'fact_name', 'other_fact'], ['fact_id', 'fact_name', 'other_fact']),
+    (['fact_id', 'other_fact'], ['fact_id', 'other_fact'], ['fact_id', 'other_fact']),
+    (['fact_*'], ['fact_id', 'fact_name', 'other_fact'], ['fact_id', 'fact_name']),
+])
+def test_get_all_facts(monkeypatch, patterns, fetched, populated):
+    # small pages, so that the facts of most hosts are split across pages
+    monkeypatch.setattr(foreman_inventory, 'FACT_VALUES_PER_PAGE', 4)
+    plugin = make_plugin(facts_filter=patterns, want_facts=True, bulk_facts=True)
+    facts = plugin._get_all_facts()
+
+    assert sorted(facts) == sorted(host['name'] for host in HOSTS)
+    for host in HOSTS:
+        assert facts[host['name']] == dict((name, value) for name, value in FakeSession.facts(host).items() if name in fetched)
+    fact_requests = [params for url, params in plugin.session.calls if url == '/api/v2/fact_values']
+    assert len(fact_requests) > 2
+    assert all(params.get('search') == foreman_inventory._facts_search(patterns) for params in fact_requests)
+
+    # wildcard patterns are applied when populating the inventory
+    plugin._populate_host_api()
+    assert sorted(plugin.inventory.get_host('host1.example.com').get_vars()['foreman_facts']) == populated
+
+
+CONSTRUCTED_HOSTS = [dict(HOSTS[i], **values) for i, values in enumerate([
+    {'comment': 'plain', 'build': True, 'owner_id': 3, 'domain_name': None, 'tags': ['web', 'prod'],
+     'facet': {'os': {'name': 'EL', 'version': 9, 'tags': []}}, 'description': 'web server'},
+    {'comment': 'True', 'build': False, 'owner_id': 0, 'domain_name': 'example.com', 'tags': [],
+     'facet': {'os': {'name': 'Debian', 'version': None, 'tags': ['x']}}, 'description': '{{ foreman_comment }} server'},
+    {'comment': '[1, 2]', 'build': None, 'owner_id': None, 'domain_name': '', 'tags': ['db', 1],
+     'facet': {'os': None}, 'description': {'text': '{{ foreman_owner_id }}'}},
+    {'comment': '{"a": 1}', 'build': 'False', 'owner_id': 2.5, 'domain_name': '0', 'tags': None,
+     'facet': {}, 'description': ''},
+])]
+
+
+def build_constructed(**options):
+    """Return the inventory built with and without optimize_constructed, or the error building it"""
+
+    results = []
+    for optimize in (False, True):
+        plugin = make_plugin(FakeSession(CONSTRUCTED_HOSTS), optimize_constructed=optimize, **options)
+        try:
+            plugin._populate_host_api()
+        except Exception as exc:
+            results.append((type(exc), str(exc)))
+        else:
+            results.append(dump_inventory(plugin.inventory))
+    return results
+
+
+@pytest.mark.parametrize('use_extra_vars', [False, True])
+def test_optimize_constructed(use_extra_vars):
+    unoptimized, optimized = build_constructed(
+        use_extra_vars=use_extra_vars,
+        compose={
+            'comment': 'foreman_comment', 'owner': 'foreman_owner_id', 'build': 'foreman_build', 'domain': 'foreman_domain_name',
+            'tags': 'foreman_tags', 'first_tag': 'foreman_tags[0]', 'os': 'foreman_facet.os', 'os_name': 'foreman_facet.os.name',
+            'os_version': "foreman_facet['os']['version']", 'os_tags': 'foreman_facet["os"].tags', 'description': 'foreman_description',
+            'missing': 'foreman_missing', 'defaulted': 'foreman_missing | default("x")', 'literal': 'True', 'number': '42',
+        },
+        groups={
+            'built': 'foreman_build', 'commented': 'foreman_comment', 'owned': 'foreman_owner_id', 'tagged': 'foreman_tags',
+            'with_domain': 'foreman_domain_name', 'el': 'foreman_facet.os.name == "EL"', 'described': 'foreman_description',
+            'nested': 'foreman_facet.os.version',
+        },
+        keyed_groups=[
+            {'key': 'foreman_tags', 'prefix': 'tag'},
+            {'key': 'foreman_facet.os.name', 'prefix': 'os'},
+            {'key': 'foreman_owner_id | string', 'prefix': 'owner'},
+            {'key': 'foreman_tags', 'separator': '', 'parent_group': 'tags'},
+            {'key': 'foreman_description', 'prefix': 'description'},
+        ],
+    )
+
+    assert optimized == unoptimized
+    hosts, groups = optimized
+    # nested values are turned into strings
+    assert hosts['host1.example.com']['os_version'] == '9'
+    assert hosts['host2.example.com']['description'] == 'True server'
+    assert sorted(groups['el'][0]) == ['host1.example.com']
+
+
+# keys whose values are not strings, lists or dicts for some hosts fail the same way as well
+@pytest.mark.parametrize('key', ['foreman_comment', 'foreman_owner_id', 'foreman_build', 'foreman_domain_name', 'foreman_facet.os', 'foreman_facet.os.version'])
+@pytest.mark.parametrize('strict', [False, True])
+def test_optimize_constructed_keyed_groups(key, strict):
+    unoptimized, optimized = build_constructed(strict=strict, keyed_groups=[{'key': key, 'prefix': 'key'}])
+    assert optimized == unoptimized
+
+
+def test_url_cache_write_failures(tmpdir):
+    # a file where the cache directory should be
+    tmpdir.join('cache').write('')
+    url_cache = make_url_cache(str(tmpdir.join('cache')))
+    url_cache.store('key', 'data')
+    url_cache.invalidate('key')
+    assert url_cache.load('key') is None
+    assert len(url_cache.display.warnings) == 2
+    assert 'Could not write to the url cache' in url_cache.display.warnings[0]
+
+    # the data fetched is used nonetheless
+    plugin = make_plugin(url_cache_dir=str(tmpdir.join('cache')))
+    plugin.url_cache = url_cache
+    plugin.use_url_cache = True
+    assert plugin._get_host_data_by_id(1)['name'] == 'host1.example.com'
+
+
+def test_url_cache_prune(tmpdir):
+    url_cache = make_url_cache(str(tmpdir), max_age=60)
+    url_cache.store('old', 'data')
+    os.utime(url_cache._entry_file('old'), (1, 1))
+    tmpdir.join('.entry-leftover').write('')
+    os.utime(str(tmpdir.join('.entry-leftover')), (1, 1))
+    tmpdir.join('unrelated').write('')
+    os.utime(str(tmpdir.join('unrelated')), (1, 1))
+    url_cache.store('recent', 'data')
+    # expired entries are removed by the first store of a run only
+    make_url_cache(str(tmpdir), max_age=60).store('new', 'data')
+
+    assert url_cache.load('old') is None
+    assert url_cache.load('recent')[1] == 'data'
+    assert sorted(path.basename for path in tmpdir.listdir()) == sorted(
+        [os.path.basename(url_cache._entry_file(key)) for key in ('recent', 'new')] + ['unrelated'])
+
+
+def test_host_fields():
+    hosts = [dict(host, comment='unwanted') for host in HOSTS]
+    plugin = make_plugin(FakeSession(hosts), host_fields=['organization_name', 'id'])
+    plugin._populate_host_api()
+    hostvars = plugin.inventory.get_host('host2.example.com').get_vars()
+    # the fields needed to build the inventory are used, but only the listed ones are host variables
+    assert 'foreman_base_web2' in hostvars['group_names']
+    assert hostvars['foreman_organization_name'] == 'ACME'
+    assert hostvars['foreman_id'] == 2
+    assert 'foreman_updated_at' not in hostvars
+    assert 'foreman_comment' not in hostvars
+    # the other fields are dropped from the cached listing, but all of them are still transferred
+    cached_hosts = [value for key, value in plugin._cache['test'].items() if key.startswith('%s/api/v2/hosts#' % URL)][0]
+    assert [sorted(host) for host in cached_hosts] == [sorted(HOSTS[0])] * len(HOSTS)
+    plugin_all_fields = make_plugin(FakeSession(hosts))
+    plugin_all_fields._populate_host_api()
+    assert plugin.session.calls == plugin_all_fields.session.calls
+
+
+def test_host_fields_legacy_hostvars():
+    plugin = make_plugin(host_fields=['organization_name'], legacy_hostvars=True)
+    plugin._populate_host_api()
+    assert plugin.inventory.get_host('host2.example.com').get_vars()['foreman'] == {'organization_name': 'ACME'}
+
+    plugin = make_plugin(legacy_hostvars=True)
+    plugin._populate_host_api()
+    assert plugin.inventory.get_host('host2.example.com').get_vars()['foreman'] == HOSTS[1]
+
+
+def test_bulk_facts_with_host_filters():
+    plugin = make_plugin(want_facts=True, bulk_facts=True, host_filters='organization = ACME')
+    plugin._populate_host_api()
+    # the facts of the hosts of the inventory are fetched instead of the ones of all hosts
+    urls = set(url for url, params in plugin.session.calls)
+    assert '/api/v2/fact_values' not in urls
+    assert '/api/v2/hosts/1/facts' in urls
+    assert plugin.inventory.get_host('host1.example.com').get_vars()['foreman_facts'] == FakeSession.facts(HOSTS[0])
+
+
+@pytest.mark.parametrize('bulk_facts', [False, True])
+def test_cached_facts_of_other_search(bulk_facts):
+    first = make_plugin(want_facts=True, bulk_facts=bulk_facts, facts_filter=['fact_id'])
+    first._populate_host_api()
+    assert first.inventory.get_host('host1.example.com').get_vars()['foreman_facts'] == {'fact_id': 1}
+
+    second = make_plugin(want_facts=True, bulk_facts=bulk_facts, facts_filter=['fact_id', 'other_fact'])
+    second._cache = first._cache
+    second.use_cache = True
+    second._populate_host_api()
+    assert second.inventory.get_host('host1.example.com').get_vars()['foreman_facts'] == {'fact_id': 1, 'other_fact': 'x'}
+    # the host listing is still taken from the cache
+    assert '/api/v2/hosts' not in [url for url, params in second.session.calls]
+
+
+class UnmemoizedGroupsInventory(foreman_inventory.InventoryModule):
+    """
+    Inventory plugin adding the groups as before they were memoized.
+    """
+
+    def _add_group(self, name):
+        return self.inventory.add_group(foreman_inventory.to_safe_group_name(name))
+
+    def _add_group_chain(self, path):
+        parent_name = None
+        group_label_parts = []
+        for part in path.split('/'):
+            group_label_parts.append(part.lower().replace(" ", ""))
+            gname = foreman_inventory.to_safe_group_name('%s%s' % (self.get_option('group_prefix'), '/'.join(group_label_parts)))
+            result_gname = self.inventory.add_group(gname)
+            if parent_name:
+                self.inventory.add_child(parent_name, result_gname)
+            parent_name = result_gname
+        return result_gname
+
+
+GROUP_HOSTS = [dict(HOSTS[i], hostgroup_title=title, organization_name=organization) for i, (title, organization) in enumerate([
+    ('Base/Web Servers/Prod', 'base'),
+    ('Base/Web Servers', 'db'),
+    ('Base/Web Servers/Prod', 'Base'),
+    ('Base', 'base_webservers'),
+    ('db/Web Servers', 'db-1'),
+    ('base/db-1', 'other'),
+])]
+
+
+def test_memoized_groups():
+    # keyed_groups create groups named like the ones of host groups, before and after them
+    options = dict(keyed_groups=[{'key': 'foreman_organization_name', 'prefix': 'foreman'},
+                                 {'key': 'foreman_organization_name', 'prefix': 'org', 'parent_group': 'foreman_base'}])
+    memoized = make_plugin(FakeSession(GROUP_HOSTS), **options)
+    memoized._populate_host_api()
+    unmemoized = make_plugin(FakeSession(GROUP_HOSTS), **options)
+    unmemoized.__class__ = UnmemoizedGroupsInventory
+    unmemoized._populate_host_api()
+
+    assert dump_inventory(memoized.inventory) == dump_inventory(unmemoized.inventory)
+    hosts, groups = dump_inventory(memoized.inventory)
+    # host1 is added by keyed_groups, host4 by its host group
+    assert groups['foreman_base'] == (['host1.example.com', 'host4.example.com'],
+                                      ['foreman_base_db_1', 'foreman_base_webservers', 'org_Base', 'org_base', 'org_base_webservers', 'org_db',
+                                       'org_db_1', 'org_other'])
+    # host2 is added by its host group, host4 by keyed_groups
+    assert groups['foreman_base_webservers'] == (['host2.example.com', 'host4.example.com'], ['foreman_base_webservers_prod'])
+    assert groups['foreman_base_webservers_prod'] == (['host1.example.com', 'host3.example.com'], [])
+    assert groups['foreman_db'] == (['host2.example.com'], ['foreman_db_webservers'])
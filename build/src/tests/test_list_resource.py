@@ -0,0 +1,89 @@
+import json
+
+import py.path
+import pytest
+
+from plugins.module_utils.foreman_helper import ForemanAnsibleModule, ForemanApi, PER_PAGE
+
+
+APIDOC_FIXTURE = py.path.local(__file__).realpath() / '..' / 'fixtures' / 'apidoc' / 'domain.json'
+
+DOMAINS = [{'id': i, 'name': 'domain{0}.example.com'.format(i)} for i in range(1, 8)]
+
+
+@pytest.fixture
+def module(tmpdir):
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=tmpdir.strpath)
+    with open(APIDOC_FIXTURE.strpath) as apidoc_file:
+        api._apidoc = json.load(apidoc_file)
+
+    module = ForemanAnsibleModule.__new__(ForemanAnsibleModule)
+    module.foremanapi = api
+    module.per_page = PER_PAGE
+    module.calls = []
+
+    def resource_call(resource, action, params):
+        module.calls.append(params.copy())
+        per_page = params['per_page']
+        start = (params.get('page', 1) - 1) * per_page
+        return {'total': len(DOMAINS), 'subtotal': len(DOMAINS), 'page': params.get('page', 1), 'per_page': per_page,
+                'results': DOMAINS[start:start + per_page]}
+
+    module._resource_call = resource_call
+    return module
+
+
+def test_list_resource_single_page(module):
+    assert module.list_resource('domains') == DOMAINS
+    assert module.calls == [{'per_page': PER_PAGE}]
+
+
+def test_list_resource_pages(module):
+    assert module.list_resource('domains', search='name ~ example', per_page=3) == DOMAINS
+    assert module.calls == [
+        {'search': 'name ~ example', 'per_page': 3},
+        {'search': 'name ~ example', 'per_page': 3, 'page': 2},
+        {'search': 'name ~ example', 'per_page': 3, 'page': 3},
+    ]
+
+
+def test_list_resource_exact_pages(module):
+    assert module.list_resource('domains', per_page=7) == DOMAINS
+    assert len(module.calls) == 1
+
+
+def test_iter_resource_stops_early(module):
+    results = module.iter_resource('domains', per_page=2)
+    assert [next(results) for _ in range(3)] == DOMAINS[:3]
+    assert len(module.calls) == 2
+
+
+def test_list_resource_parallel_pages(module):
+    assert module.list_resource('domains', per_page=2, parallel_pages=3) == DOMAINS
+    assert sorted(call.get('page', 1) for call in module.calls) == [1, 2, 3, 4]
+
+
+def test_iter_resource_parallel_pages_stops_early(module):
+    results = module.iter_resource('domains', per_page=1, parallel_pages=2)
+    assert [next(results) for _ in range(2)] == DOMAINS[:2]
+    results.close()
+    assert len(module.calls) <= 4
+
+
+def test_list_resource_limit(module):
+    assert module.list_resource('domains', per_page=2, limit=3) == DOMAINS[:3]
+    assert len(module.calls) == 2
+
+
+def test_grouped_results(module):
+    grouped = {'module1': [{'id': 1, 'name': 'module1::class1'}], 'module2': [{'id': 2, 'name': 'module2::class1'}]}
+
+    def resource_call(resource, action, params):
+        module.calls.append(params.copy())
+        return {'total': 2, 'subtotal': 2, 'page': 1, 'per_page': params['per_page'], 'results': grouped}
+    module._resource_call = resource_call
+
+    assert module.list_resource('domains') == grouped
+    assert list(module.iter_resource('domains')) == [grouped]
+    assert module.list_resource('domains', per_page=1, limit=1) == grouped
+    assert len(module.calls) == 3
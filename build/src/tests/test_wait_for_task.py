@@ -0,0 +1,118 @@
+import pytest
+
+from plugins.module_utils import foreman_helper
+from plugins.module_utils.foreman_helper import ForemanAnsibleModule
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ModuleFailed(Exception):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(foreman_helper.time, 'time', clock.time)
+    monkeypatch.setattr(foreman_helper.time, 'sleep', clock.sleep)
+    return clock
+
+
+def make_module(states):
+    module = ForemanAnsibleModule.__new__(ForemanAnsibleModule)
+    module.task_timeout = 60
+    module.task_poll_min = 0.5
+    module.task_poll_max = 4
+    module.task_poll_backoff = 2
+    states = iter(states)
+
+    def fail_json(msg, **kwargs):
+        raise ModuleFailed(msg)
+
+    module.fail_json = fail_json
+    module._resource_prepare_params = lambda resource, action, params: params
+    module._resource_call = lambda resource, action, params: dict(next(states), id=params['id'], result='success')
+    return module
+
+
+def test_wait_for_task_backoff(clock):
+    module = make_module([{'state': 'running'}] * 5 + [{'state': 'stopped'}])
+    task = module.wait_for_task({'id': 1, 'state': 'running'})
+    assert task['state'] == 'stopped'
+    assert clock.sleeps == [0.5, 1, 2, 4, 4, 4]
+
+
+def test_wait_for_task_progress(clock):
+    module = make_module([{'state': 'running', 'progress': 0.5}, {'state': 'running', 'progress': 0.9}, {'state': 'stopped'}])
+    module.task_poll_min = 2
+    module.task_poll_max = 30
+    module.wait_for_task({'id': 1, 'state': 'running', 'progress': 0.1})
+    # 0.4 progress in 2 seconds, so 0.5 remaining take 2.5 seconds, the last 0.1 take 0.5 seconds (but at least task_poll_min)
+    assert clock.sleeps == [2, 2.5, 2]
+
+
+def test_wait_for_task_timeout(clock):
+    module = make_module([{'state': 'running'}] * 100)
+    module.task_timeout = 10
+    with pytest.raises(ModuleFailed, match='Timeout waiting for Task 1'):
+        module.wait_for_task({'id': 1, 'state': 'running'})
+    assert sum(clock.sleeps) == 10
+
+
+def make_bulk_module(states):
+    module = make_module([])
+    module.searches = []
+    states = iter(states)
+
+    def list_resource(resource, search):
+        module.searches.append(search)
+        return [dict(id=task_id, state=state, result='success') for task_id, state in next(states).items()]
+
+    module.list_resource = list_resource
+    return module
+
+
+def test_wait_for_tasks(clock):
+    module = make_bulk_module([
+        {'a': 'running', 'b': 'stopped'},
+        {'a': 'stopped'},
+    ])
+    tasks = module.wait_for_tasks([{'id': 'a'}, {'id': 'b'}, {'id': 'c', 'state': 'stopped', 'result': 'success'}])
+    assert [task['id'] for task in tasks] == ['a', 'b', 'c']
+    assert module.searches == ['id ^ ("a","b")', 'id ^ ("a")']
+    assert clock.sleeps == [0.5]
+
+
+def test_wait_for_tasks_failed(clock):
+    module = make_bulk_module([{'a': 'stopped'}])
+    module.list_resource = lambda resource, search: [{'id': 'a', 'state': 'stopped', 'result': 'error', 'action': 'Sync', 'humanized': {'errors': ['boom']}}]
+    with pytest.raises(ModuleFailed, match=r"Task Sync\(a\) did not succeed"):
+        module.wait_for_tasks([{'id': 'a'}])
+
+
+def test_wait_for_tasks_missing(clock):
+    module = make_bulk_module([{'a': 'running'}])
+    with pytest.raises(ModuleFailed, match='Could not find Tasks b'):
+        module.wait_for_tasks([{'id': 'a'}, {'id': 'b'}])
+
+
+def test_resource_action_without_waiting(clock):
+    module = make_module([])
+    module.check_mode = False
+    module._changed = False
+    started_task = {'id': 'a', 'action': 'Sync', 'state': 'planned', 'started_at': None}
+    module._resource_call = lambda resource, action, params, **kwargs: started_task
+    assert module.resource_action('repositories', 'sync', {'id': 1}, wait_for_task=False) is started_task
+    assert clock.sleeps == []
+    assert module.changed
@@ -96,6 +96,58 @@ DOCUMENTATION = '''
         ini:
           - section: callback_foreman
             key: dir_store
+      dir_store_bulk:
+        description:
+          - Toggle to store all reports and facts of a run in a single file in I(dir_store),
+            instead of one file per host and type.
+          - The file is named C(foreman-callback-TIMESTAMP-PID-PART.ndjson) and holds one JSON object per line,
+            with the C(type) (C(report) or C(facts)), C(report_type), C(host) and C(data) of each report or facts,
+            so they can be sent to Foreman later.
+          - The file is written as C(foreman-callback-TIMESTAMP-PID-PART.ndjson.part) and renamed once it is complete.
+        type: boolean
+        env:
+          - name: FOREMAN_CALLBACK_DIR_STORE_BULK
+        default: false
+        ini:
+          - section: callback_foreman
+            key: dir_store_bulk
+        version_added: 4.3.0
+      dir_store_compress:
+        description:
+          - Toggle to gzip compress the files written when I(dir_store_bulk) is set, their name then ends in C(.ndjson.gz).
+        type: boolean
+        env:
+          - name: FOREMAN_CALLBACK_DIR_STORE_COMPRESS
+        default: false
+        ini:
+          - section: callback_foreman
+            key: dir_store_compress
+        version_added: 4.3.0
+      dir_store_max_size:
+        description:
+          - Number of bytes of JSON after which a new file is started when I(dir_store_bulk) is set.
+          - Set to C(0) to write a single file per run.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_DIR_STORE_MAX_SIZE
+        default: 104857600
+        ini:
+          - section: callback_foreman
+            key: dir_store_max_size
+        version_added: 4.3.0
+      dir_store_sync_records:
+        description:
+          - Number of reports and facts written when I(dir_store_bulk) is set after which the file is synced to disk.
+          - The file is always synced when it is complete.
+          - Set to C(0) to only sync complete files.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_DIR_STORE_SYNC_RECORDS
+        default: 100
+        ini:
+          - section: callback_foreman
+            key: dir_store_sync_records
+        version_added: 4.3.0
       disable_callback:
         description:
           - Toggle to make the callback plugin disable itself even if it is loaded.
@@ -103,26 +155,205 @@ DOCUMENTATION = '''
         env:
           - name: FOREMAN_CALLBACK_DISABLE
         default: 0
+      spool_dir:
+        description:
+          - When set, the results of the tasks are spooled to a journal file in the given directory until they are reported,
+            instead of keeping them in memory.
+          - The journal is removed once the reports have been sent.
+          - The value must be a valid directory.
+          - When set to blank (default) the results are kept in memory.
+        env:
+          - name: FOREMAN_CALLBACK_SPOOL_DIR
+        default: ''
+        ini:
+          - section: callback_foreman
+            key: spool_dir
+        version_added: 4.3.0
+      flush_per_play:
+        description:
+          - Toggle to send the reports of each play, and the facts gathered during it, when the next play starts,
+            instead of only at the end of the playbook.
+          - Each host then gets a report for each part of the playbook.
+          - When I(dir_store) is set, only the last report of each host is kept.
+        type: boolean
+        env:
+          - name: FOREMAN_CALLBACK_FLUSH_PER_PLAY
+        default: false
+        ini:
+          - section: callback_foreman
+            key: flush_per_play
+        version_added: 4.3.0
+      flush_tasks:
+        description:
+          - Send the reports and facts collected so far every time this number of tasks was started.
+          - Set to C(0) to not send them based on the number of tasks.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_FLUSH_TASKS
+        default: 0
+        ini:
+          - section: callback_foreman
+            key: flush_tasks
+        version_added: 4.3.0
+      flush_interval:
+        description:
+          - Send the reports and facts collected so far when at least this number of seconds passed since they were last sent.
+          - Set to C(0) to not send them periodically.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_FLUSH_INTERVAL
+        default: 0
+        ini:
+          - section: callback_foreman
+            key: flush_interval
+        version_added: 4.3.0
+      fact_digest_dir:
+        description:
+          - When set, a digest of the facts last sent to Foreman for each host is kept in the given directory,
+            and the facts of a host are only sent again if they changed since then.
+          - The value must be a valid directory.
+          - If the digests can't be stored, a warning is shown and the facts are sent again on the next run.
+          - When set to blank (default) the facts are always sent.
+        env:
+          - name: FOREMAN_CALLBACK_FACT_DIGEST_DIR
+        default: ''
+        ini:
+          - section: callback_foreman
+            key: fact_digest_dir
+        version_added: 4.3.0
+      fact_digest_ignore:
+        description:
+          - Facts that are ignored when checking whether the facts of a host changed, as they change on every run.
+          - Changes to only these facts are not sent to Foreman.
+        type: list
+        elements: str
+        env:
+          - name: FOREMAN_CALLBACK_FACT_DIGEST_IGNORE
+        default: [ansible_date_time, ansible_uptime_seconds, ansible_memfree_mb, ansible_memory_mb, ansible_swapfree_mb, ansible_loadavg]
+        ini:
+          - section: callback_foreman
+            key: fact_digest_ignore
+        version_added: 4.3.0
+      fact_digest_max_age:
+        description:
+          - Number of seconds after which the facts of a host are sent again, even if they did not change.
+          - Set to C(0) to never send unchanged facts again.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_FACT_DIGEST_MAX_AGE
+        default: 604800
+        ini:
+          - section: callback_foreman
+            key: fact_digest_max_age
+        version_added: 4.3.0
+      pretty_json:
+        description:
+          - Toggle to indent the JSON of reports and facts and sort its keys, for readability.
+          - By default the JSON is compact, which is cheaper to produce and smaller.
+        type: boolean
+        env:
+          - name: FOREMAN_CALLBACK_PRETTY_JSON
+        default: false
+        ini:
+          - section: callback_foreman
+            key: pretty_json
+        version_added: 4.3.0
+      max_workers:
+        description:
+          - Number of reports and facts sent to Foreman concurrently, at least 1.
+          - By default they are sent one after the other.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_MAX_WORKERS
+        default: 1
+        ini:
+          - section: callback_foreman
+            key: max_workers
+        version_added: 4.3.0
+      compress:
+        description:
+          - Toggle to send reports and facts gzip compressed.
+          - The Foreman server or Smart Proxy must accept gzip encoded request bodies.
+        type: boolean
+        env:
+          - name: FOREMAN_CALLBACK_COMPRESS
+        default: false
+        ini:
+          - section: callback_foreman
+            key: compress
+        version_added: 4.3.0
+      retries:
+        description:
+          - Number of times sending a report or facts is retried after a connection error, a timeout
+            or a response with status 429, 502, 503 or 504.
+        type: int
+        env:
+          - name: FOREMAN_CALLBACK_RETRIES
+        default: 0
+        ini:
+          - section: callback_foreman
+            key: retries
+        version_added: 4.3.0
+      retry_backoff:
+        description:
+          - Number of seconds to wait before the first retry, the wait is doubled for every further retry.
+        type: float
+        env:
+          - name: FOREMAN_CALLBACK_RETRY_BACKOFF
+        default: 1
+        ini:
+          - section: callback_foreman
+            key: retry_backoff
+        version_added: 4.3.0
 '''
 
+import errno
+import gzip
+import hashlib
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from collections import defaultdict
+from contextlib import contextmanager
+from functools import partial
 import json
 import time
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common.json import AnsibleJSONEncoder
 from ansible.module_utils.parsing.convert_bool import boolean as to_bool
+from ansible.parsing.ajson import AnsibleJSONDecoder
 from ansible.plugins.callback import CallbackBase
 
 
+# responses after which sending data is retried
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# file in the fact_digest_dir keeping the digests of the facts sent
+FACT_DIGESTS_FILE = 'foreman-fact-digests.json'
+
+# lock file in the fact_digest_dir serializing the updates of the digests by concurrent runs
+FACT_DIGESTS_LOCK_FILE = 'foreman-fact-digests.lock'
+FACT_DIGESTS_LOCK_TIMEOUT = 10
+FACT_DIGESTS_LOCK_POLL_INTERVAL = 0.1
+
+# the counters of the summary of a host, as in AggregateStats
+SUMMARY_KEYS = ('ok', 'failures', 'unreachable', 'changed', 'skipped', 'rescued', 'ignored')
+
+
 def build_log_foreman(data_list):
     """
     Transform the internal log structure to one accepted by Foreman's
@@ -182,6 +413,237 @@ class AnsibleNoVaultJSONEncoder(AnsibleJSONEncoder):
         return value
 
 
+def drop_nones(d):
+    """Recursively drop Nones or empty dicts/arrays in dict d and return a new dict"""
+    dd = {}
+    for k, v in d.items():
+        if isinstance(v, dict) and v:
+            dd[k] = drop_nones(v)
+        elif isinstance(v, list) and len(v) == 1 and v[0] == {}:
+            pass
+        elif isinstance(v, (list, set, tuple)) and v:
+            dd[k] = type(v)(drop_nones(vv) if isinstance(vv, dict) else vv
+                            for vv in v)
+        elif not isinstance(v, (dict, list, set, tuple)) and v is not None:
+            dd[k] = v
+    return dd
+
+
+class ResultJournalEncoder(AnsibleNoVaultJSONEncoder):
+    """
+    AnsibleNoVaultJSONEncoder keeping vault values encrypted instead of redacting them,
+    so that results read back from the journal are reported exactly like the results kept in memory.
+    """
+
+    def default(self, o):
+        if getattr(o, '__ENCRYPTED__', False):
+            return AnsibleJSONEncoder.default(self, o)
+        return super(ResultJournalEncoder, self).default(o)
+
+
+class ResultJournal(object):
+    """
+    Append-only journal file keeping the results of the hosts on disk until they are reported.
+    Only the position of each result in the journal is kept in memory.
+    """
+
+    def __init__(self, directory):
+        fd, self.path = tempfile.mkstemp(prefix='foreman-callback-', suffix='.journal', dir=directory)
+        self.journal = os.fdopen(fd, 'w+b')
+        self.size = 0
+        self.positions = defaultdict(list)
+
+    def append(self, host, value):
+        data = to_bytes(json.dumps(value, separators=(',', ':'), cls=ResultJournalEncoder)) + b'\n'
+        self.journal.seek(self.size)
+        self.journal.write(data)
+        self.positions[host].append((self.size, len(data)))
+        self.size += len(data)
+
+    def pop(self, host):
+        """
+        Return the results of the host and forget about them.
+        """
+        values = []
+        for position, length in self.positions.pop(host, []):
+            self.journal.seek(position)
+            values.append(json.loads(to_text(self.journal.read(length)), cls=AnsibleJSONDecoder))
+        return values
+
+    def close(self):
+        self.journal.close()
+        os.unlink(self.path)
+
+
+class BulkStore(object):
+    """
+    Store writing the reports and facts of a run as newline-delimited JSON into files in `directory`,
+    starting a new file after `max_size` bytes and syncing it to disk every `sync_records` records.
+    """
+
+    def __init__(self, directory, compress=False, max_size=0, sync_records=0):
+        self.prefix = os.path.join(directory, 'foreman-callback-{0}-{1}'.format(datetime.now().strftime('%Y%m%d%H%M%S'), os.getpid()))
+        self.suffix = '.ndjson.gz' if compress else '.ndjson'
+        self.compress = compress
+        self.max_size = max_size
+        self.sync_records = sync_records
+        self.part = 0
+        self.path = None
+        self.file = None
+        self.stream = None
+        self.size = 0
+        self.unsynced = 0
+
+    def _open(self):
+        self.part += 1
+        self.path = '{0}-{1:04d}{2}'.format(self.prefix, self.part, self.suffix)
+        self.file = open(self.path + '.part', 'wb')
+        if self.compress:
+            self.stream = gzip.GzipFile(fileobj=self.file, mode='wb')
+        else:
+            self.stream = self.file
+        self.size = 0
+        self.unsynced = 0
+
+    def write(self, data_type, report_type, host, data):
+        record = {'type': data_type, 'report_type': report_type, 'host': host, 'data': data}
+        line = to_bytes(json.dumps(record, separators=(',', ':'), cls=AnsibleNoVaultJSONEncoder)) + b'\n'
+        if self.file is None:
+            self._open()
+        self.stream.write(line)
+        self.size += len(line)
+        self.unsynced += 1
+        if self.max_size and self.size >= self.max_size:
+            self.close()
+        elif self.sync_records and self.unsynced >= self.sync_records:
+            self.sync()
+
+    def sync(self):
+        if self.compress:
+            self.stream.flush()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+
+    def close(self):
+        """
+        Complete the current file, the next record starts a new one.
+        """
+        if self.file is None:
+            return
+        if self.compress:
+            self.stream.close()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.rename(self.path + '.part', self.path)
+        self.file = self.stream = None
+
+
+class FactDigests(object):
+    """
+    Digests of the facts last sent to a Foreman server for each host, stored in a file in `directory`.
+    """
+
+    def __init__(self, directory, foreman_url, ignore, max_age):
+        self.path = os.path.join(directory, FACT_DIGESTS_FILE)
+        self.foreman_url = foreman_url
+        self.ignore = frozenset(ignore or [])
+        self.max_age = max_age
+        self.digests = self._load()
+        self.sent_digests = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as digests_file:
+                digests = json.load(digests_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(digests, dict) or not isinstance(digests.get(self.foreman_url), dict):
+            return {}
+        return digests[self.foreman_url]
+
+    def digest(self, facts):
+        relevant_facts = dict((name, value) for name, value in facts.items() if name not in self.ignore)
+        data = json.dumps(relevant_facts, sort_keys=True, separators=(',', ':'), cls=AnsibleNoVaultJSONEncoder)
+        return hashlib.sha256(to_bytes(data)).hexdigest()
+
+    def is_current(self, host, digest):
+        """
+        Return whether the facts with the digest were already sent for the host, recently enough.
+        """
+        entry = self.sent_digests.get(host, self.digests.get(host))
+        if not isinstance(entry, dict) or entry.get('digest') != digest:
+            return False
+        return not self.max_age or time.time() - entry.get('sent_at', 0) < self.max_age
+
+    def sent(self, host, digest):
+        # called by the senders, possibly concurrently
+        self.sent_digests[host] = {'digest': digest, 'sent_at': time.time()}
+
+    @contextmanager
+    def _lock(self):
+        """
+        Hold an exclusive lock on the digests file, shared by all runs using the same directory.
+        If the lock can't be acquired within FACT_DIGESTS_LOCK_TIMEOUT seconds, or locking is not
+        supported on this platform, continue without it.
+        """
+        lock_file = None
+        if fcntl is not None:
+            try:
+                lock_file = open(os.path.join(os.path.dirname(self.path), FACT_DIGESTS_LOCK_FILE), 'a')
+            except (IOError, OSError):
+                lock_file = None
+        if lock_file is not None:
+            deadline = time.time() + FACT_DIGESTS_LOCK_TIMEOUT
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except (IOError, OSError) as err:
+                    if err.errno not in (errno.EAGAIN, errno.EACCES) or time.time() >= deadline:
+                        lock_file.close()
+                        lock_file = None
+                        break
+                    time.sleep(FACT_DIGESTS_LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            if lock_file is not None:
+                # closing the file releases the lock
+                lock_file.close()
+
+    def save(self):
+        """
+        Store the digests of the facts sent, keeping the ones stored by other runs in the meantime.
+        """
+        if not self.sent_digests:
+            return
+        with self._lock():
+            try:
+                with open(self.path) as digests_file:
+                    all_digests = json.load(digests_file)
+                if not isinstance(all_digests, dict):
+                    all_digests = {}
+            except (IOError, OSError, ValueError):
+                all_digests = {}
+            digests = all_digests.get(self.foreman_url)
+            if not isinstance(digests, dict):
+                digests = all_digests[self.foreman_url] = {}
+            digests.update(self.sent_digests)
+
+            fd, tmp_path = tempfile.mkstemp(prefix='.foreman-fact-digests-', dir=os.path.dirname(self.path))
+            try:
+                with os.fdopen(fd, 'w') as digests_file:
+                    json.dump(all_digests, digests_file)
+                os.rename(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        self.digests.update(self.sent_digests)
+        self.sent_digests = {}
+
+
 class CallbackModule(CallbackBase):
     CALLBACK_VERSION = 2.0
     CALLBACK_TYPE = 'notification'
@@ -193,6 +655,18 @@ class CallbackModule(CallbackBase):
         self.items = defaultdict(list)
         self.facts = defaultdict(dict)
         self.start_time = get_time()
+        self.check_mode = False
+        self.executor = None
+        self.journal = None
+        self.fact_digests = None
+        self.bulk_store = None
+        self.dump_json = partial(json.dumps, separators=(',', ':'), cls=AnsibleNoVaultJSONEncoder)
+        # the summaries of the results not reported yet and of the ones already reported
+        self.pending_summaries = defaultdict(lambda: dict.fromkeys(SUMMARY_KEYS, 0))
+        self.reported_summaries = defaultdict(lambda: dict.fromkeys(SUMMARY_KEYS, 0))
+        self.unsent_facts = set()
+        self.last_flush = self.start_time
+        self.tasks_since_flush = 0
 
     def set_options(self, task_keys=None, var_options=None, direct=None):
 
@@ -207,11 +681,35 @@ class CallbackModule(CallbackBase):
         ssl_cert = self.get_option('client_cert')
         ssl_key = self.get_option('client_key')
         self.dir_store = self.get_option('dir_store')
+        if self.dir_store and self.get_option('dir_store_bulk'):
+            self.bulk_store = BulkStore(self.dir_store, self.get_option('dir_store_compress'),
+                                        self.get_option('dir_store_max_size'), self.get_option('dir_store_sync_records'))
+        self.spool_dir = self.get_option('spool_dir')
+        self.flush_per_play = self.get_option('flush_per_play')
+        self.flush_tasks = self.get_option('flush_tasks')
+        self.flush_interval = self.get_option('flush_interval')
+        if self.get_option('pretty_json'):
+            self.dump_json = partial(json.dumps, indent=2, sort_keys=True, cls=AnsibleNoVaultJSONEncoder)
+        if self.get_option('fact_digest_dir'):
+            self.fact_digests = FactDigests(self.get_option('fact_digest_dir'), self.foreman_url,
+                                            self.get_option('fact_digest_ignore'), self.get_option('fact_digest_max_age'))
+        self.max_workers = self.get_option('max_workers')
+        if self.max_workers < 1:
+            self._display.warning(u'max_workers must be at least 1, not {0}. Sending the reports and facts one after the other.'.format(self.max_workers))
+            self.max_workers = 1
+        self.compress = self.get_option('compress')
+        self.retries = self.get_option('retries')
+        self.retry_backoff = self.get_option('retry_backoff')
 
         if not HAS_REQUESTS:
             self._disable_plugin(u'The `requests` python module is not installed')
 
         self.session = requests.Session()
+        if self.max_workers > DEFAULT_POOLSIZE:
+            # keep one connection per concurrent request
+            adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
         if self.foreman_url.startswith('https://'):
             if not os.path.exists(ssl_cert):
                 self._disable_plugin(u'FOREMAN_SSL_CERT %s not found.' % ssl_cert)
@@ -243,7 +741,7 @@ class CallbackModule(CallbackBase):
 
         return verify
 
-    def _send_data(self, data_type, report_type, host, data):
+    def _send_data(self, data_type, report_type, host, data, on_sent=None):
         if data_type == 'facts':
             url = self.foreman_url + '/api/v2/hosts/facts'
         elif data_type == 'report' and report_type == 'foreman':
@@ -253,21 +751,73 @@ class CallbackModule(CallbackBase):
         else:
             self._display.warning(u'Unknown report_type: {rt}'.format(rt=report_type))
 
-        json_data = json.dumps(data, indent=2, sort_keys=True, cls=AnsibleNoVaultJSONEncoder)
-
-        if len(self.dir_store) > 0:
+        if self.bulk_store is not None:
+            self.bulk_store.write(data_type, report_type, host, data)
+            if on_sent is not None:
+                on_sent()
+        elif len(self.dir_store) > 0:
+            json_data = self.dump_json(data)
             filename = u'{host}-{dt}.json'.format(host=to_text(host), dt=data_type)
             filename = os.path.join(self.dir_store, filename)
             with open(filename, 'w') as f:
                 f.write(json_data)
+            if on_sent is not None:
+                on_sent()
         else:
+            # the data is serialized right away, as it may still change after this
+            json_data = self.dump_json(data)
+            if self.max_workers > 1 or self.executor is not None:
+                self.get_executor().submit(self._post_data, url, host, json_data, on_sent)
+            else:
+                self._post_data(url, host, json_data, on_sent)
+
+    def get_executor(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def _post_data(self, url, host, json_data, on_sent=None):
+        """
+        Post the JSON data to Foreman, retrying after connection errors, timeouts and overload responses.
+        Failures are reported as warnings, `on_sent` is called after the data was sent successfully.
+        """
+        headers = {'content-type': 'application/json'}
+        data = json_data.encode('utf-8')
+        if self.compress:
+            data = gzip.compress(data)
+            headers['content-encoding'] = 'gzip'
+
+        delay = self.retry_backoff
+        for attempt in range(self.retries + 1):
+            retry = attempt < self.retries
             try:
-                headers = {'content-type': 'application/json'}
-                response = self.session.post(url=url, data=json_data, headers=headers)
-                response.raise_for_status()
+                response = self.session.post(url=url, data=data, headers=headers)
+                if not (retry and response.status_code in RETRY_STATUS_CODES):
+                    response.raise_for_status()
+                    if on_sent is not None:
+                        on_sent()
+                    return
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                if not retry:
+                    self._warn_send_failed(host, err)
+                    return
             except requests.exceptions.RequestException as err:
-                self._display.warning(u'Sending data to Foreman at {url} failed for {host}: {err}'.format(
-                    host=to_text(host), err=to_text(err), url=to_text(self.foreman_url)))
+                self._warn_send_failed(host, err)
+                return
+            time.sleep(delay)
+            delay *= 2
+
+    def _warn_send_failed(self, host, err):
+        self._display.warning(u'Sending data to Foreman at {url} failed for {host}: {err}'.format(
+            host=to_text(host), err=to_text(err), url=to_text(self.foreman_url)))
+
+    def wait_for_sends(self):
+        """
+        Wait until all data handed to the concurrent senders has been sent.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
 
     def send_facts(self):
         """
@@ -280,6 +830,14 @@ class CallbackModule(CallbackBase):
             return
 
         for host, facts in self.facts.items():
+            if host not in self.unsent_facts:
+                continue
+            on_sent = None
+            if self.fact_digests is not None:
+                digest = self.fact_digests.digest(facts)
+                if self.fact_digests.is_current(host, digest):
+                    continue
+                on_sent = partial(self.fact_digests.sent, host, digest)
             facts = {
                 "name": host,
                 "facts": {
@@ -289,15 +847,16 @@ class CallbackModule(CallbackBase):
                 },
             }
 
-            self._send_data('facts', 'foreman', host, facts)
+            self._send_data('facts', 'foreman', host, facts, on_sent)
+        self.unsent_facts.clear()
 
-    def send_reports_proxy_host_report(self, stats):
+    def send_reports_proxy_host_report(self, summaries):
         """
         Send reports to Foreman Smart Proxy running Host Reports
         plugin. The format is native Ansible report without any
         changes.
         """
-        for host in stats.processed.keys():
+        for host, summary in summaries.items():
             report = {
                 "host": host,
                 "reported_at": get_now(),
@@ -306,22 +865,20 @@ class CallbackModule(CallbackBase):
                         "total": int(get_time() - self.start_time)
                     }
                 },
-                "summary": stats.summarize(host),
-                "results": self.items[host],
+                "summary": summary,
+                "results": self.pop_results(host),
                 "check_mode": self.check_mode,
             }
 
             self._send_data('report', 'proxy', host, report)
-            self.items[host] = []
 
-    def send_reports_foreman(self, stats):
+    def send_reports_foreman(self, summaries):
         """
         Send reports to Foreman to be parsed by its config report
         importer. The data is in a format that Foreman can handle
         without writing another report importer.
         """
-        for host in stats.processed.keys():
-            total = stats.summarize(host)
+        for host, total in summaries.items():
             report = {
                 "config_report": {
                     "host": host,
@@ -336,7 +893,7 @@ class CallbackModule(CallbackBase):
                         "failed": total['failures'] + total['unreachable'],
                         "skipped": total['skipped'],
                     },
-                    "logs": list(build_log_foreman(self.items[host])),
+                    "logs": list(build_log_foreman(self.pop_results(host))),
                     "reporter": "ansible",
                     "check_mode": self.check_mode,
                 }
@@ -346,30 +903,79 @@ class CallbackModule(CallbackBase):
                 report['config_report']['status']['applied'] = 0
 
             self._send_data('report', 'foreman', host, report)
-            self.items[host] = []
 
-    def send_reports(self, stats):
+    def send_reports(self, summaries):
+        """
+        Send a report for each host in summaries, with the results not reported yet.
+        """
+        for host, summary in summaries.items():
+            reported = self.reported_summaries[host]
+            for key in SUMMARY_KEYS:
+                reported[key] += summary.get(key, 0)
+            self.pending_summaries.pop(host, None)
+
         if self.report_type == "foreman":
-            self.send_reports_foreman(stats)
+            self.send_reports_foreman(summaries)
         elif self.report_type == "proxy":
-            self.send_reports_proxy_host_report(stats)
+            self.send_reports_proxy_host_report(summaries)
         else:
             self._display.warning(u'Unknown foreman endpoint type: {type}'.format(type=self.report_type))
 
-    def drop_nones(self, d):
-        """Recursively drop Nones or empty dicts/arrays in dict d and return a new dict"""
-        dd = {}
-        for k, v in d.items():
-            if isinstance(v, dict) and v:
-                dd[k] = self.drop_nones(v)
-            elif isinstance(v, list) and len(v) == 1 and v[0] == {}:
-                pass
-            elif isinstance(v, (list, set, tuple)) and v:
-                dd[k] = type(v)(self.drop_nones(vv) if isinstance(vv, dict) else vv
-                                for vv in v)
-            elif not isinstance(v, (dict, list, set, tuple)) and v is not None:
-                dd[k] = v
-        return dd
+    def final_summaries(self, stats):
+        """
+        Return the summaries of the play stats, without what was already sent by previous flushes.
+        """
+        summaries = {}
+        for host in stats.processed.keys():
+            summary = stats.summarize(host)
+            if host in self.reported_summaries:
+                reported = self.reported_summaries[host]
+                for key in SUMMARY_KEYS:
+                    if key in summary:
+                        summary[key] = max(summary[key] - reported[key], 0)
+                if not any(summary.values()) and not self.has_results(host):
+                    # everything was reported already
+                    continue
+            summaries[host] = summary
+        return summaries
+
+    def flush(self):
+        """
+        Send the facts and reports collected since the last flush, in the background.
+        """
+        self.last_flush = get_time()
+        self.tasks_since_flush = 0
+        if not self.pending_summaries and not self.unsent_facts:
+            return
+        if not self.dir_store:
+            self.get_executor()
+        self.send_facts()
+        self.send_reports(dict((host, dict(summary)) for host, summary in self.pending_summaries.items()))
+        if self.journal is not None and not self.journal.positions:
+            # start over with an empty journal
+            self.close_journal()
+
+    def flush_if_due(self):
+        if self.flush_interval and get_time() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def count_result(self, host, result, failed=False, ignore_errors=False, unreachable=False, skipped=False):
+        """
+        Count the result for the summary of the next partial report, like AggregateStats does.
+        """
+        summary = self.pending_summaries[host]
+        if skipped:
+            summary['skipped'] += 1
+        elif unreachable:
+            summary['unreachable'] += 1
+        elif failed and not ignore_errors:
+            summary['failures'] += 1
+        else:
+            summary['ok'] += 1
+            if failed:
+                summary['ignored'] += 1
+            if result._result.get('changed', False):
+                summary['changed'] += 1
 
     def append_result(self, result, failed=False):
         result_info = result._result
@@ -380,19 +986,53 @@ class CallbackModule(CallbackBase):
         value['task'] = task_info
         value['failed'] = failed
         if self.report_type == "proxy":
-            value = self.drop_nones(value)
+            value = drop_nones(value)
         host = result._host.get_name()
-        self.items[host].append(value)
+        self.store_result(host, value)
         self.check_mode = result._task.check_mode
         if 'ansible_facts' in result_info:
             self.facts[host].update(result_info['ansible_facts'])
+            self.unsent_facts.add(host)
+
+    def store_result(self, host, value):
+        if self.spool_dir:
+            if self.journal is None:
+                self.journal = ResultJournal(self.spool_dir)
+            self.journal.append(host, value)
+        else:
+            self.items[host].append(value)
+
+    def has_results(self, host):
+        if self.journal is not None:
+            return bool(self.journal.positions.get(host))
+        return bool(self.items.get(host))
+
+    def pop_results(self, host):
+        """
+        Return the results stored for the host and forget about them.
+        """
+        if self.journal is not None:
+            return self.journal.pop(host)
+        return self.items.pop(host, [])
+
+    def close_journal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
 
     # Ansible callback API
     def v2_runner_on_failed(self, result, ignore_errors=False):
         self.append_result(result, True)
+        self.count_result(result._host.get_name(), result, failed=True, ignore_errors=ignore_errors)
+        self.flush_if_due()
 
     def v2_runner_on_unreachable(self, result):
         self.append_result(result, True)
+        self.count_result(result._host.get_name(), result, unreachable=True)
+        self.flush_if_due()
+
+    def v2_runner_on_skipped(self, result):
+        self.count_result(result._host.get_name(), result, skipped=True)
 
     def v2_runner_on_async_ok(self, result):
         self.append_result(result)
@@ -400,9 +1040,37 @@ class CallbackModule(CallbackBase):
     def v2_runner_on_async_failed(self, result):
         self.append_result(result, True)
 
+    def v2_playbook_on_play_start(self, play):
+        if self.flush_per_play:
+            self.flush()
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self.tasks_since_flush += 1
+        if self.flush_tasks and self.tasks_since_flush > self.flush_tasks:
+            self.flush()
+            self.tasks_since_flush = 1
+        else:
+            self.flush_if_due()
+
     def v2_playbook_on_stats(self, stats):
-        self.send_facts()
-        self.send_reports(stats)
+        try:
+            self.send_facts()
+            self.send_reports(self.final_summaries(stats))
+            self.wait_for_sends()
+            if self.bulk_store is not None:
+                self.bulk_store.close()
+        finally:
+            # the journal is a temporary file, even if reporting failed
+            self.close_journal()
+        if self.fact_digests is not None:
+            try:
+                self.fact_digests.save()
+            except (IOError, OSError) as err:
+                # the digests only avoid sending unchanged facts again
+                self._display.warning(u'Could not store the digests of the facts sent in {0}: {1}'.format(
+                    os.path.dirname(self.fact_digests.path), to_text(err)))
 
     def v2_runner_on_ok(self, result):
         self.append_result(result)
+        self.count_result(result._host.get_name(), result)
+        self.flush_if_due()
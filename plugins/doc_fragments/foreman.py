@@ -49,6 +49,35 @@ options:
       - If the value is not specified in the task, the value of environment variable C(FOREMAN_VALIDATE_CERTS) will be used instead.
     default: true
     type: bool
+  status_cache_ttl:
+    description:
+      - Number of seconds the response of the server status API may be cached locally and reused by later module runs.
+      - The cache is stored next to the cached apidoc and is invalidated when the API documentation of the server changes.
+      - Set to C(0) to query the server status on every module run.
+      - If the value is not specified in the task, the value of environment variable C(FOREMAN_STATUS_CACHE_TTL) will be used instead.
+    default: 0
+    type: int
+  task_poll_min:
+    description:
+      - Number of seconds to wait before checking the state of a running task for the first time.
+      - The time between checks grows by I(task_poll_backoff) up to I(task_poll_max) seconds,
+        and is shortened when the progress of the task suggests it will finish earlier.
+      - If the value is not specified in the task, the value of environment variable C(FOREMAN_TASK_POLL_MIN) will be used instead.
+    default: 0.5
+    type: float
+  task_poll_max:
+    description:
+      - Maximal number of seconds to wait between two checks of the state of a running task.
+      - If the value is not specified in the task, the value of environment variable C(FOREMAN_TASK_POLL_MAX) will be used instead.
+    default: 30
+    type: float
+  task_poll_backoff:
+    description:
+      - Factor by which the time between two checks of the state of a running task grows.
+      - Set to C(1) to check the state every I(task_poll_min) seconds.
+      - If the value is not specified in the task, the value of environment variable C(FOREMAN_TASK_POLL_BACKOFF) will be used instead.
+    default: 1.5
+    type: float
 attributes:
   check_mode:
     description: Can run in check_mode and return changed status prediction without modifying the entity
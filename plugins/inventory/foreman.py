@@ -67,6 +67,24 @@ DOCUMENTATION = '''
         description: Toggle, if True the plugin will retrieve host facts from the server
         type: boolean
         default: false
+      facts_filter:
+        description:
+          - List of shell-style wildcard patterns, only facts whose name matches one of them are imported.
+          - If none of the patterns contain wildcards, the facts are filtered by the Foreman server already.
+          - All facts are imported if not set.
+        type: list
+        elements: str
+        version_added: 4.3.0
+      bulk_facts:
+        description:
+          - Toggle, if true the facts of all hosts are fetched together using the fact_values API, in large batches,
+            instead of one request per host.
+          - The facts of all hosts known to Foreman are fetched, so this is most useful when the inventory contains most of the hosts.
+            When I(host_filters) is set, the facts are fetched host by host anyway.
+          - Only applies to inventories using the Host API and when I(want_facts) is enabled.
+        type: boolean
+        default: false
+        version_added: 4.3.0
       want_params:
         description: Toggle, if true the inventory will retrieve 'all_parameters' information as host vars
         type: boolean
@@ -84,10 +102,71 @@ DOCUMENTATION = '''
       host_filters:
         description: This can be used to restrict the list of returned host
         type: string
+      host_fields:
+        description:
+          - List of fields of the host listing to keep and import as host variables. All fields are kept if not set.
+          - The fields are selected as soon as each batch of hosts has been retrieved, so the others are neither kept in memory nor cached.
+            Foreman still returns all fields, this does not reduce the amount of data transferred.
+          - The fields C(id), C(name), C(hostgroup_title), C(hostgroup_name) and C(updated_at) are always kept, as they are needed to build the inventory,
+            but only imported as host variables when listed.
+          - Fields used in I(hostnames), I(compose), I(groups) or I(keyed_groups) need to be listed as well.
+          - Only applies to inventories using the Host API.
+        type: list
+        elements: str
+        version_added: 4.3.0
       batch_size:
         description: Number of hosts per batch that will be retrieved from the Foreman API per individual call
         type: int
         default: 250
+      parallel_pages:
+        description:
+          - Number of batches that will be retrieved from the Foreman API concurrently when listing hosts using the Host API.
+          - The first batch is always retrieved alone, to learn the total number of hosts.
+          - Set to C(1) to retrieve the batches one after another.
+        type: int
+        default: 1
+        version_added: 4.3.0
+      incremental:
+        description:
+          - Toggle, if true the hosts fetched by the previous run are kept in the inventory cache and only hosts
+            that have been updated since then are fetched again, together with a cheap list of all host ids to detect deleted hosts.
+          - Requires the inventory cache to be enabled, a full refresh happens whenever the cache is empty, expired or being refreshed.
+          - Only applies to inventories using the Host API.
+        type: boolean
+        default: false
+        version_added: 4.3.0
+      url_cache_dir:
+        description:
+          - Directory to cache the responses of the Foreman API in, instead of using the inventory cache.
+          - Each response is stored compressed in its own file, and is valid for the time set in I(url_cache_ttl) for its kind.
+          - Responses are still stored, but not used, when the inventory is being refreshed.
+          - Responses older than the longest of the I(url_cache_ttl) and I(report_reuse_ttl) times are removed from the directory
+            when it is first written to, so directories shared by inventories with different times should be avoided.
+          - Failing to write to the directory is a warning, not an error.
+        type: path
+        version_added: 4.3.0
+      url_cache_ttl:
+        description:
+          - Number of seconds the responses stored in I(url_cache_dir) are valid for, by kind of response.
+          - C(hosts) for the host listing, C(host) for host details (including parameters and host collections),
+            C(facts) for host facts, C(report) for Reports API reports and C(other) for everything else.
+          - Kinds that are not set use their default.
+        type: dict
+        default:
+          hosts: 300
+          host: 300
+          facts: 3600
+          report: 300
+          other: 300
+        version_added: 4.3.0
+      max_workers:
+        description:
+          - Number of concurrent requests used to retrieve the parameters, facts and host collections
+            of the hosts from the Foreman API when using the Host API.
+          - Set to C(1) to retrieve them one host after another.
+        type: int
+        default: 1
+        version_added: 4.3.0
       use_reports_api:
         description: Use Reports API.
         type: boolean
@@ -104,13 +183,37 @@ DOCUMENTATION = '''
           - Only for backward compatibility.
         type: dict
       poll_interval:
-        description: The polling interval between 2 calls to the report_data endpoint while polling.
+        description:
+          - The polling interval between 2 calls to the report_data endpoint while polling.
+          - This is the initial interval, it grows by I(poll_backoff) after each call.
         type: int
         default: 10
       max_timeout:
         description: Timeout before falling back to old host API when using report_data endpoint while polling.
         type: int
         default: 600
+      poll_backoff:
+        description:
+          - Factor by which the polling interval grows after each call to the report_data endpoint, up to I(max_poll_interval).
+          - Each interval is randomly varied by up to 20%, a C(Retry-After) header sent by the server takes precedence.
+          - Set to C(1) to keep polling every I(poll_interval) seconds.
+        type: float
+        default: 1.5
+        version_added: 4.3.0
+      max_poll_interval:
+        description: The maximal polling interval between 2 calls to the report_data endpoint while polling.
+        type: int
+        default: 60
+        version_added: 4.3.0
+      report_reuse_ttl:
+        description:
+          - Number of seconds a report stored in the inventory cache is reused instead of scheduling a new one,
+            if it was generated for the same options, even if the cache is being refreshed.
+          - Requires the inventory cache to be enabled, with a persistent cache plugin to share reports between runs.
+          - Set to C(0) to always schedule a new report when the cache is not used.
+        type: int
+        default: 0
+        version_added: 4.3.0
       want_organization:
         description:
           - Toggle, if true the inventory will fetch organization the host belongs to and create groupings for the same.
@@ -172,6 +275,16 @@ DOCUMENTATION = '''
         type: list
         elements: str
         default: ['name']
+      optimize_constructed:
+        description:
+          - Toggle, if true the expressions of I(hostnames), I(compose), I(groups) and I(keyed_groups) are parsed once,
+            and the ones only referring to a variable, like C(foreman.hostgroup_name) or C(foreman_params['role']),
+            are evaluated without templating them for every host.
+          - All other expressions, and variables whose values contain templates, are still templated.
+          - Ignored if I(use_extra_vars) is enabled.
+        type: boolean
+        default: false
+        version_added: 4.3.0
 '''
 
 EXAMPLES = '''
@@ -190,26 +303,281 @@ password: changeme
 hostnames:
   - name.split('.')[0]
 '''
-import copy
+import errno
+import gzip
+import hashlib
 import json
-from ansible_collections.theforeman.foreman.plugins.module_utils._version import LooseVersion
-from time import sleep
+import os
+import random
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import mktime_tz, parsedate_tz
+from fnmatch import fnmatchcase
+try:
+    from ansible_collections.theforeman.foreman.plugins.module_utils._version import LooseVersion
+except ImportError:
+    from plugins.module_utils._version import LooseVersion
+from time import sleep, time
 from ansible.errors import AnsibleError
 from ansible.module_utils._text import to_bytes, to_native, to_text
-from ansible.module_utils.common._collections_compat import MutableMapping
+from ansible.module_utils.six import string_types
+from ansible.module_utils.common._collections_compat import Mapping, MutableMapping
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, to_safe_group_name, Constructable
+from ansible.utils.vars import combine_vars
 
 # 3rd party imports
 try:
     import requests
     if LooseVersion(requests.__version__) < LooseVersion('1.1.0'):
         raise ImportError
+    from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
     from requests.auth import HTTPBasicAuth
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
 
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_report_hosts(report):
+    """
+    Yield the hosts of an inventory report one by one.
+
+    The report is decoded host by host from its JSON representation, so the decoded hosts never have to be held in memory
+    all at once, and can be modified without touching the (cached) report.
+    Already decoded reports (from older inventory caches) are copied host by host instead.
+    """
+
+    if not isinstance(report, string_types):
+        return (dict(host) if host else host for host in report)
+
+    decoder = json.JSONDecoder()
+    index = _JSON_WHITESPACE.match(report, 0).end()
+    if report[index:index + 1] != '[':
+        raise ValueError("The inventory report is not a list of hosts")
+    index = _JSON_WHITESPACE.match(report, index + 1).end()
+
+    def hosts(index):
+        if report[index:index + 1] == ']':
+            return
+        while True:
+            host, index = decoder.raw_decode(report, index)
+            yield host
+            index = _JSON_WHITESPACE.match(report, index).end()
+            if report[index:index + 1] == ']':
+                return
+            if report[index:index + 1] != ',':
+                raise AnsibleError("Could not decode the inventory report at position %d" % index)
+            index = _JSON_WHITESPACE.match(report, index + 1).end()
+
+    return hosts(index)
+
+
+def _validate_report(report):
+    """
+    Raise the error decoding the inventory report, if it cannot be decoded completely.
+
+    The hosts are decoded and dropped one by one, so the decoded report is not held in memory here either.
+    """
+
+    if isinstance(report, string_types):
+        for dummy in _iter_report_hosts(report):
+            pass
+
+
+# relative deviation of the delay between two polls of the inventory report
+POLL_JITTER = 0.2
+
+
+def _retry_after(response):
+    """
+    Return the number of seconds the server asked to wait before the next request in the ``Retry-After`` header, if any.
+    """
+
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        retry_at = parsedate_tz(value)
+        if retry_at is None:
+            return None
+        return max(0.0, mktime_tz(retry_at) - time())
+
+
+class _UrlCache(object):
+    """
+    Cache of API responses on disk, with one gzip compressed JSON file per entry.
+
+    Entries are only ever read one by one, and each entry records when it was stored,
+    so that the caller can decide on the validity of each entry separately.
+    The cache is only an optimization, failing to write to it is a warning.
+    Entries older than `max_age` seconds are removed when the cache is first written to.
+    """
+
+    def __init__(self, path, namespace, max_age, display):
+        self.path = path
+        self.namespace = namespace
+        self.max_age = max_age
+        self.display = display
+        self.pruned = False
+
+    def _entry_file(self, key):
+        digest = hashlib.sha1(to_bytes('%s\n%s' % (self.namespace, key))).hexdigest()
+        return os.path.join(self.path, '%s.json.gz' % digest)
+
+    def load(self, key):
+        """Return the time the entry for `key` was stored at and its data, or `None` if there is no such entry."""
+
+        try:
+            with gzip.open(self._entry_file(key), 'rb') as entry_file:
+                entry = json.loads(to_text(entry_file.read()))
+        except (IOError, OSError, ValueError, EOFError):
+            return None
+        if not isinstance(entry, MutableMapping) or entry.get('namespace') != self.namespace or entry.get('key') != key:
+            return None
+        return entry.get('stored_at', 0), entry.get('data')
+
+    def store(self, key, data):
+        entry = {'namespace': self.namespace, 'key': key, 'stored_at': time(), 'data': data}
+        try:
+            try:
+                os.makedirs(self.path, 0o700)
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+            if not self.pruned:
+                self.pruned = True
+                self.prune()
+            # the entry is written to a temporary file first, so concurrent readers never see a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=self.path, prefix='.entry-')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    with gzip.GzipFile(fileobj=tmp_file, mode='wb') as entry_file:
+                        entry_file.write(to_bytes(json.dumps(entry)))
+                os.rename(tmp_name, self._entry_file(key))
+            except Exception:
+                os.unlink(tmp_name)
+                raise
+        except (IOError, OSError) as err:
+            self.display.warning("Could not write to the url cache in %s: %s" % (self.path, to_native(err)))
+
+    def invalidate(self, key):
+        try:
+            os.unlink(self._entry_file(key))
+        except OSError as err:
+            if err.errno != errno.ENOENT:
+                self.display.warning("Could not remove an outdated entry from the url cache in %s: %s" % (self.path, to_native(err)))
+
+    def prune(self):
+        """Remove the entries (and leftover temporary files) not modified for more than `max_age` seconds."""
+
+        expired = time() - self.max_age
+        for name in os.listdir(self.path):
+            if not (name.endswith('.json.gz') or name.startswith('.entry-')):
+                continue
+            entry_file = os.path.join(self.path, name)
+            try:
+                if os.path.getmtime(entry_file) < expired:
+                    os.unlink(entry_file)
+            except OSError:
+                # removed by a concurrent run
+                pass
+
+
+def _url_cache_key(url, params=None):
+    if not params:
+        return url
+    return '%s?%s' % (url, json.dumps(params, sort_keys=True))
+
+
+# number of fact values per request when fetching the facts of all hosts at once
+FACT_VALUES_PER_PAGE = 10000
+
+
+def _facts_search(patterns):
+    """
+    Return a fact_values search matching the facts named by `patterns`.
+    Only patterns without wildcards can be searched for, otherwise the facts have to be filtered after fetching them.
+    """
+
+    if not patterns or any(set('*?[') & set(pattern) for pattern in patterns):
+        return None
+    return 'fact ^ (%s)' % ','.join('"%s"' % pattern for pattern in patterns)
+
+
+# a reference to a variable, like foo, foo.bar or foo['bar'][0]
+_VARIABLE_NAME = r'[A-Za-z_][A-Za-z0-9_]*'
+_VARIABLE_ACCESS = r'\.(%s)|\[\s*(?:\'([^\'\\]*)\'|"([^"\\]*)"|([0-9]+))\s*\]' % _VARIABLE_NAME
+_VARIABLE_REFERENCE = re.compile(r'^\s*(%s)((?:%s)*)\s*$' % (_VARIABLE_NAME, _VARIABLE_ACCESS))
+_VARIABLE_ACCESS_PART = re.compile(_VARIABLE_ACCESS)
+
+# markers of strings that have to be templated
+_TEMPLATE_MARKERS = ('{{', '{%', '{#')
+
+# returned when an expression cannot be evaluated without templating it
+_NEEDS_TEMPLATING = object()
+
+# number of variable values whose check for templates is remembered
+TEMPLATE_CHECKS_MEMO_SIZE = 1000
+
+
+def _compile_expression(expression):
+    """
+    Parse an expression referring to a variable into the name of the variable followed by the attributes and items to access.
+    Each access is a tuple of whether it is an attribute and the key.
+    Returns `None` for any other expression, which has to be templated.
+    """
+
+    match = _VARIABLE_REFERENCE.match(expression)
+    if not match or match.group(1) in ('true', 'false', 'none', 'True', 'False', 'None'):
+        return None
+    path = [match.group(1)]
+    for access in _VARIABLE_ACCESS_PART.finditer(match.group(2)):
+        attribute, single_quoted, double_quoted, index = access.groups()
+        if attribute is not None:
+            path.append((True, attribute))
+        elif index is not None:
+            path.append((False, int(index)))
+        else:
+            path.append((False, single_quoted if single_quoted is not None else double_quoted))
+    return tuple(path)
+
+
+def _contains_template(value):
+    if isinstance(value, string_types):
+        return any(marker in value for marker in _TEMPLATE_MARKERS)
+    if isinstance(value, Mapping):
+        return any(_contains_template(k) or _contains_template(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_template(v) for v in value)
+    return False
+
+
+def _is_plain_string(value):
+    # templating turns strings looking like lists, dicts or booleans into these
+    return isinstance(value, string_types) and not value.startswith(('{', '[')) and value not in ('True', 'False')
+
+
+# fields of the host listing needed to build the inventory
+HOST_REQUIRED_FIELDS = ('id', 'name', 'hostgroup_title', 'hostgroup_name', 'updated_at')
+
+# seconds the entries of the url cache are valid for, by kind of entry
+URL_CACHE_DEFAULT_TTL = {'hosts': 300, 'host': 300, 'facts': 3600, 'report': 300, 'other': 300}
+
+# inventory cache entry describing the cached inventory report
+REPORT_INFO_KEY = 'report_info'
+
+# inventory cache entry holding the hosts of the last incremental run
+INCREMENTAL_SNAPSHOT_KEY = 'incremental_snapshot'
+
+# number of host ids per search when fetching hosts missing from the incremental snapshot
+INCREMENTAL_IDS_PER_SEARCH = 100
+
+
 class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
     ''' Host inventory parser for ansible using foreman as source. '''
 
@@ -225,6 +593,12 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
         self.session = None
         self.cache_key = None
         self.use_cache = None
+        self.url_cache = None
+        self.use_url_cache = None
+        self._group_names = {}
+        self._group_chains = {}
+        self._compiled_expressions = {}
+        self._template_checks = {}
 
         if not HAS_REQUESTS:
             raise AnsibleError('This script requires python-requests 1.1 as a minimum version')
@@ -244,99 +618,326 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             self.session = requests.session()
             self.session.auth = HTTPBasicAuth(self.get_option('user'), to_bytes(self.get_option('password')))
             self.session.verify = self.get_option('validate_certs')
+            pool_size = max(self.get_option('max_workers'), self.get_option('parallel_pages'))
+            if pool_size > DEFAULT_POOLSIZE:
+                # keep one connection per concurrent request
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                self.session.mount('http://', adapter)
+                self.session.mount('https://', adapter)
         return self.session
 
-    def _get_json(self, url, ignore_errors=None, params=None):
+    def _get_json(self, url, ignore_errors=None, params=None, fields=None, per_page=None):
+
+        if self.url_cache is not None:
+            return self._get_json_from_url_cache(url, ignore_errors, params, fields, per_page)
 
-        if not self.use_cache or url not in self._cache.get(self.cache_key, {}):
+        # results of other searches or restricted to some fields are kept apart from the full ones
+        key = _url_cache_key(url, params)
+        if fields:
+            key = '%s#%s' % (key, ','.join(sorted(fields)))
+
+        if not self.use_cache or key not in self._cache.get(self.cache_key, {}):
 
             if self.cache_key not in self._cache:
-                self._cache[self.cache_key] = {url: ''}
-
-            results = []
-            s = self._get_session()
-            if params is None:
-                params = {}
-            params['page'] = 1
-            params['per_page'] = self.get_option('batch_size')
-            while True:
-                # workaround to address the follwing issues where 'verify' is overridden in Requests:
-                #   - https://github.com/psf/requests/issues/3829
-                #   - https://github.com/psf/requests/issues/5209
-                ret = s.get(url, params=params, verify=self.get_option('validate_certs'))
-
-                if ignore_errors and ret.status_code in ignore_errors:
+                self._cache[self.cache_key] = {key: ''}
+
+            self._cache[self.cache_key][key] = self._fetch_json(url, ignore_errors, params, fields, per_page)
+
+        return self._cache[self.cache_key][key]
+
+    def _get_json_from_url_cache(self, url, ignore_errors=None, params=None, fields=None, per_page=None):
+        key_params = dict(params or {})
+        if fields:
+            key_params['#fields'] = sorted(fields)
+        key = _url_cache_key(url, key_params)
+        if self.use_url_cache:
+            entry = self.url_cache.load(key)
+            if entry is not None and 0 <= time() - entry[0] < self._url_cache_ttl(url):
+                return entry[1]
+        results = self._fetch_json(url, ignore_errors, dict(params or {}), fields, per_page)
+        self.url_cache.store(key, results)
+        return results
+
+    def _url_cache_ttl(self, url):
+        path = url[len(self.foreman_url):]
+        if re.match(r'^/api/v2/hosts/[^/]+/facts$', path):
+            kind = 'facts'
+        elif re.match(r'^/api/v2/hosts/[^/]+$', path):
+            kind = 'host'
+        elif path == '/api/v2/hosts':
+            kind = 'hosts'
+        elif path.startswith('/ansible/api/v2/ansible_inventories'):
+            kind = 'report'
+        else:
+            kind = 'other'
+        return self._url_cache_ttls()[kind]
+
+    def _url_cache_ttls(self):
+        return dict(URL_CACHE_DEFAULT_TTL, **(self.get_option('url_cache_ttl') or {}))
+
+    def _fetch_json(self, url, ignore_errors=None, params=None, fields=None, per_page=None):
+        """
+        Fetch all pages of an API endpoint, bypassing the inventory cache.
+        If `fields` is given, only these fields of paginated list results are kept, as soon as each page arrives.
+        """
+
+        def select(page_results):
+            if not fields:
+                return page_results
+            return [dict((k, v) for k, v in result.items() if k in fields) if result else result for result in page_results]
+
+        results = []
+        s = self._get_session()
+        if params is None:
+            params = {}
+        params['page'] = 1
+        params['per_page'] = per_page or self.get_option('batch_size')
+        while True:
+            # workaround to address the follwing issues where 'verify' is overridden in Requests:
+            #   - https://github.com/psf/requests/issues/3829
+            #   - https://github.com/psf/requests/issues/5209
+            ret = s.get(url, params=params, verify=self.get_option('validate_certs'))
+
+            if ignore_errors and ret.status_code in ignore_errors:
+                break
+            ret.raise_for_status()
+            json = ret.json()
+
+            # process results
+            # FIXME: This assumes 'return type' matches a specific query,
+            #        it will break if we expand the queries and they dont have different types
+            if 'results' not in json:  # pylint: disable=no-else-break
+                # /hosts/:id dos not have a 'results' key
+                results = json
+                break
+            elif isinstance(json['results'], MutableMapping):
+                # /facts are returned as dict in 'results'
+                if not isinstance(results, MutableMapping):
+                    results = {}
+
+                # check for end of paging
+                if len(json['results']) == 0:
                     break
-                ret.raise_for_status()
-                json = ret.json()
-
-                # process results
-                # FIXME: This assumes 'return type' matches a specific query,
-                #        it will break if we expand the queries and they dont have different types
-                if 'results' not in json:  # pylint: disable=no-else-break
-                    # /hosts/:id dos not have a 'results' key
-                    results = json
+
+                for host, facts in json['results'].items():
+                    if host not in results:
+                        results[host] = {}
+                    results[host].update(facts)
+
+                # get next page
+                params['page'] += 1
+            else:
+                # /hosts 's 'results' is a list of all hosts, returned is paginated
+                results.extend(select(json['results']))
+
+                # check for end of paging
+                if len(results) >= json['subtotal']:
+                    break
+                if len(json['results']) == 0:
+                    self.display.warning("Did not make any progress during loop. expected %d got %d" % (json['subtotal'], len(results)))
                     break
-                elif isinstance(json['results'], MutableMapping):
-                    # /facts are returned as dict in 'results'
-                    if not isinstance(results, MutableMapping):
-                        results = {}
 
-                    # check for end of paging
-                    if len(json['results']) == 0:
+                if self.get_option('parallel_pages') > 1 and params['page'] == 1:
+                    # the number of pages is known now, fetch the remaining ones concurrently
+                    last_page = -(-json['subtotal'] // params['per_page'])
+                    pages = self._get_pages(url, params, range(2, last_page + 1))
+                    for page in pages:
+                        results.extend(select(page['results']))
+                    # hosts added in the meantime are on further pages, which are fetched one by one
+                    if not pages or len(results) >= pages[-1]['subtotal'] or len(pages[-1]['results']) < params['per_page']:
                         break
+                    params['page'] = last_page
 
-                    for host, facts in json['results'].items():
-                        if host not in results:
-                            results[host] = {}
-                        results[host].update(facts)
+                # get next page
+                params['page'] += 1
 
-                    # get next page
-                    params['page'] += 1
-                else:
-                    # /hosts 's 'results' is a list of all hosts, returned is paginated
-                    results = results + json['results']
+        return results
 
-                    # check for end of paging
-                    if len(results) >= json['subtotal']:
-                        break
-                    if len(json['results']) == 0:
-                        self.display.warning("Did not make any progress during loop. expected %d got %d" % (json['subtotal'], len(results)))
-                        break
+    def _get_pages(self, url, params, page_numbers):
+        """
+        Fetch the given pages of a paginated API endpoint concurrently and return their JSON in order.
+        """
 
-                    # get next page
-                    params['page'] += 1
+        s = self._get_session()
 
-            self._cache[self.cache_key][url] = results
+        def fetch(page_number):
+            page_params = params.copy()
+            page_params['page'] = page_number
+            ret = s.get(url, params=page_params, verify=self.get_option('validate_certs'))
+            ret.raise_for_status()
+            return ret.json()
 
-        return self._cache[self.cache_key][url]
+        with ThreadPoolExecutor(max_workers=self.get_option('parallel_pages')) as executor:
+            return list(executor.map(fetch, page_numbers))
 
     def _get_hosts(self):
         url = "%s/api/v2/hosts" % self.foreman_url
         params = {}
         if self.get_option('host_filters'):
             params['search'] = self.get_option('host_filters')
-        return self._get_json(url, params=params)
+        if self.get_option('incremental'):
+            return self._get_hosts_incremental(url, params)
+        return self._get_json(url, params=params, fields=self._get_host_fields())
+
+    def _get_host_fields(self):
+        """Return the fields of the host listing to keep, or `None` to keep all of them"""
+
+        if not self.get_option('host_fields'):
+            return None
+        return set(self.get_option('host_fields')).union(HOST_REQUIRED_FIELDS)
+
+    def _get_hosts_incremental(self, url, params):
+        """
+        Update the hosts stored in the inventory cache by a previous run with the hosts that changed since then.
+
+        Only hosts with a newer ``updated_at`` or missing from the snapshot are fetched in full,
+        deleted hosts are detected using a thin listing of all hosts.
+        Without a previous snapshot (or when the cache is being refreshed), all hosts are fetched.
+        """
+
+        # work on a copy, so that the cache notices the changes and stores them
+        cached = dict(self._cache.get(self.cache_key) or {})
+        snapshot = cached.get(INCREMENTAL_SNAPSHOT_KEY) if self.use_cache else None
+
+        if snapshot:
+            hosts_by_id = dict((host['id'], host) for host in snapshot['hosts'])
+
+            search = 'updated_at >= "%s"' % snapshot['updated_at']
+            if params.get('search'):
+                search = '(%s) and %s' % (params['search'], search)
+            changed_hosts = self._fetch_json(url, params=dict(params, search=search), fields=self._get_host_fields())
+            current_ids = [host['id'] for host in self._fetch_json(url, params=dict(params, thin=True))]
+
+            # hosts created or starting to match the filters after the search for changed ones are fetched by id
+            changed_ids = set(host['id'] for host in changed_hosts)
+            missing_ids = [hid for hid in current_ids if hid not in hosts_by_id and hid not in changed_ids]
+            for start in range(0, len(missing_ids), INCREMENTAL_IDS_PER_SEARCH):
+                search = 'id ^ (%s)' % ','.join(str(hid) for hid in missing_ids[start:start + INCREMENTAL_IDS_PER_SEARCH])
+                changed_hosts.extend(self._fetch_json(url, params=dict(params, search=search), fields=self._get_host_fields()))
+
+            outdated_ids = set(hosts_by_id) - set(current_ids)
+            for host in changed_hosts:
+                hosts_by_id[host['id']] = host
+                outdated_ids.add(host['id'])
+            # the cached details of changed and deleted hosts are outdated as well
+            facts_params = self._get_facts_params()
+            outdated_urls = []
+            for hid in outdated_ids:
+                outdated_urls.append(("%s/%s" % (url, hid), None))
+                outdated_urls.append(("%s/%s/facts" % (url, hid), facts_params))
+            if outdated_ids:
+                outdated_urls.append(("%s/api/v2/fact_values" % self.foreman_url, facts_params))
+            for detail_url, detail_params in outdated_urls:
+                cached.pop(_url_cache_key(detail_url, detail_params), None)
+                if self.url_cache is not None:
+                    self.url_cache.invalidate(_url_cache_key(detail_url, detail_params))
+
+            # hosts deleted between the listings are not in the inventory
+            hosts = [hosts_by_id[hid] for hid in current_ids if hid in hosts_by_id]
+            updated_at = snapshot['updated_at']
+        else:
+            hosts = self._fetch_json(url, params=dict(params), fields=self._get_host_fields())
+            updated_at = None
+
+        timestamps = [host['updated_at'] for host in hosts if host.get('updated_at')]
+        if updated_at:
+            timestamps.append(updated_at)
+        if timestamps:
+            cached[INCREMENTAL_SNAPSHOT_KEY] = {'updated_at': max(timestamps), 'hosts': hosts}
+        else:
+            cached.pop(INCREMENTAL_SNAPSHOT_KEY, None)
+        self._cache[self.cache_key] = cached
 
-    def _get_all_params_by_id(self, hid):
-        url = "%s/api/v2/hosts/%s" % (self.foreman_url, hid)
-        ret = self._get_json(url, [404])
-        if not ret or not isinstance(ret, MutableMapping) or not ret.get('all_parameters', False):
+        return hosts
+
+    def _get_all_params(self, host_data):
+        if not host_data.get('all_parameters', False):
             return {}
-        return ret.get('all_parameters')
+        return host_data.get('all_parameters')
 
     def _get_facts_by_id(self, hid):
         url = "%s/api/v2/hosts/%s/facts" % (self.foreman_url, hid)
-        return self._get_json(url)
+        return self._get_json(url, params=self._get_facts_params())
+
+    def _get_all_facts(self):
+        """
+        Fetch the facts of all hosts from the fact_values API, in a few large pages instead of one request per host.
+        Returns the facts by host name.
+        """
+
+        url = "%s/api/v2/fact_values" % self.foreman_url
+        ret = self._get_json(url, params=self._get_facts_params(), per_page=FACT_VALUES_PER_PAGE)
+        if not isinstance(ret, MutableMapping):
+            return {}
+        return ret
+
+    def _use_bulk_facts(self):
+        """Return whether to fetch the facts of all hosts at once, which is not done for inventories filtering the hosts"""
+
+        return self.get_option('bulk_facts') and not self.get_option('host_filters')
+
+    def _get_facts_params(self):
+        """Return the params searching only for the facts selected by ``facts_filter``, if this can be done by Foreman"""
+
+        search = _facts_search(self.get_option('facts_filter'))
+        if not search:
+            return None
+        return {'search': search}
+
+    def _filter_facts(self, facts):
+        patterns = self.get_option('facts_filter')
+        if not patterns or not facts:
+            return facts
+        return dict((name, value) for name, value in facts.items() if any(fnmatchcase(name, pattern) for pattern in patterns))
 
     def _get_host_data_by_id(self, hid):
-        url = "%s/api/v2/hosts/%s" % (self.foreman_url, hid)
-        return self._get_json(url)
+        """
+        Fetch the details of the host, which include its parameters and host collections.
+        A missing host is only an error when its host collections are wanted, as when these were fetched on their own.
+        """
 
-    def _get_facts(self, host):
+        url = "%s/api/v2/hosts/%s" % (self.foreman_url, hid)
+        ret = self._get_json(url, None if self.get_option('want_hostcollections') else [404])
+        if not ret or not isinstance(ret, MutableMapping):
+            return {}
+        return ret
+
+    def _prefetch_host_details(self, hosts):
+        """
+        Fetch the per host resources needed to populate the inventory with `max_workers` concurrent requests.
+        Returns the results (or errors) of the requests, to be collected with :func:`_get_host_detail`.
+        """
+
+        prefetched = {}
+        if self.get_option('max_workers') <= 1:
+            return prefetched
+
+        getters = []
+        if self.get_option('want_params') or self.get_option('want_hostcollections'):
+            getters.append(self._get_host_data_by_id)
+        if self.get_option('want_facts') and not self._use_bulk_facts():
+            getters.append(self._get_facts_by_id)
+        if not getters:
+            return prefetched
+
+        with ThreadPoolExecutor(max_workers=self.get_option('max_workers')) as executor:
+            for host in hosts:
+                if not host:
+                    continue
+                for getter in getters:
+                    prefetched[(getter.__name__, host['id'])] = executor.submit(getter, host['id'])
+        return prefetched
+
+    def _get_host_detail(self, prefetched, getter, hid):
+        future = prefetched.pop((getter.__name__, hid), None)
+        if future is None:
+            return getter(hid)
+        return future.result()
+
+    def _get_facts(self, host, prefetched=None):
         """Fetch all host facts of the host"""
 
-        ret = self._get_facts_by_id(host['id'])
+        ret = self._get_host_detail(prefetched or {}, self._get_facts_by_id, host['id'])
         if len(ret.values()) == 0:
             facts = {}
         elif len(ret.values()) == 1:
@@ -345,6 +946,13 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             raise ValueError("More than one set of facts returned for '%s'" % host)
         return facts
 
+    def _get_internal_host_fields(self):
+        """Return the fields kept in the host listing to build the inventory only, which are not imported as host variables"""
+
+        if not self.get_option('host_fields'):
+            return ()
+        return tuple(field for field in HOST_REQUIRED_FIELDS if field not in self.get_option('host_fields'))
+
     def _get_hostvars(self, host, vars_prefix='', omitted_vars=()):
         hostvars = {}
         for k, v in host.items():
@@ -406,11 +1014,25 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
         url = "%s/ansible/api/v2/ansible_inventories/schedule" % self.foreman_url
         params = {'input_values': self._fetch_params()}
 
-        if self.use_cache and url in self._cache.get(self.cache_key, {}):
-            return self._cache[self.cache_key][url]
+        input_values_digest = hashlib.sha1(to_bytes(json.dumps(params, sort_keys=True))).hexdigest()
 
-        if self.cache_key not in self._cache:
-            self._cache[self.cache_key] = {}
+        if self.url_cache is not None:
+            report_key = _url_cache_key(url, {'input_values': input_values_digest})
+            entry = self.url_cache.load(report_key)
+            # a recent enough report is reused even when the inventory is being refreshed
+            ttl = max(self._url_cache_ttl(url) if self.use_url_cache else 0, self.get_option('report_reuse_ttl') or 0)
+            if entry is not None and 0 <= time() - entry[0] < ttl:
+                return entry[1]
+        else:
+            if self.use_cache and url in self._cache.get(self.cache_key, {}):
+                return self._cache[self.cache_key][url]
+
+            if self.cache_key not in self._cache:
+                self._cache[self.cache_key] = {}
+
+            reused_report = self._get_reusable_report(url, input_values_digest)
+            if reused_report is not None:
+                return reused_report
 
         session = self._get_session()
         self.poll_interval = self.get_option('poll_interval')
@@ -421,28 +1043,56 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             self.max_timeout = int(self.get_option('report').get('max_timeout'))
         except Exception:
             pass
-        max_polls = self.max_timeout / self.poll_interval
+        deadline = time() + self.max_timeout
+        delay = self.poll_interval
         ret = session.post(url, json=params)
         if not ret:
             raise Exception("Error scheduling inventory report on foreman. Please check foreman logs!")
         data_url = "{0}/{1}".format(self.foreman_url, ret.json().get('data_url'))
-        polls = 0
         response = session.get(data_url)
-        while response:
-            if response.status_code != 204 or polls > max_polls:
-                break
-            sleep(self.poll_interval)
-            polls += 1
+        while response.status_code == 204 or (response.status_code in (429, 503) and _retry_after(response) is not None):
+            remaining = deadline - time()
+            if remaining <= 0:
+                raise Exception("Timeout receiving inventory report from foreman. Check foreman server and max_timeout in foreman.yml")
+            wait = _retry_after(response)
+            if wait is None:
+                # spread the polls of concurrent inventory runs
+                wait = delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+                delay = min(delay * self.get_option('poll_backoff'), max(self.get_option('max_poll_interval'), self.poll_interval))
+            sleep(max(0, min(wait, remaining)))
             response = session.get(data_url)
         if not response:
             raise Exception("Error receiving inventory report from foreman. Please check foreman logs!")
-        elif (response.status_code == 204 and polls > max_polls):
-            raise Exception("Timeout receiving inventory report from foreman. Check foreman server and max_timeout in foreman.yml")
         else:
-            self._cache[self.cache_key][url] = json.loads(response.json())
-            return self._cache[self.cache_key][url]
+            # the report is a JSON document encoded as a string, it is only decoded (host by host) while populating
+            report = response.json()
+            if self.url_cache is not None:
+                self.url_cache.store(report_key, report)
+            else:
+                self._cache[self.cache_key][url] = report
+                self._cache[self.cache_key][REPORT_INFO_KEY] = {'input_values': input_values_digest, 'completed_at': time()}
+            return report
+
+    def _get_reusable_report(self, url, input_values_digest):
+        """
+        Return the report stored in the inventory cache if it was generated for the same input values
+        less than `report_reuse_ttl` seconds ago, even if the cache is being refreshed.
+        """
+
+        reuse_ttl = self.get_option('report_reuse_ttl')
+        cached = self._cache.get(self.cache_key) or {}
+        report_info = cached.get(REPORT_INFO_KEY) or {}
+        if reuse_ttl and reuse_ttl > 0 and url in cached and report_info.get('input_values') == input_values_digest:
+            if 0 <= time() - report_info.get('completed_at', 0) < reuse_ttl:
+                self.display.vvv("Reusing inventory report generated %d seconds ago" % (time() - report_info['completed_at']))
+                return cached[url]
+        return None
 
     def _populate(self):
+        self._group_names = {}
+        self._group_chains = {}
+        self._compiled_expressions = {}
+        self._template_checks = {}
         if self._use_inventory_report():
             self._populate_report_api()
         else:
@@ -471,12 +1121,136 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             )
         )
 
+    def _add_group(self, name):
+        """
+        Add the group named `name` after making it a safe group name, and return the name of the added group.
+        Many hosts share the same groups, so the result is memoized by the raw name.
+        """
+
+        try:
+            return self._group_names[name]
+        except KeyError:
+            group = self.inventory.add_group(to_safe_group_name(name))
+            self._group_names[name] = group
+            return group
+
+    def _add_group_chain(self, path):
+        """
+        Add a group for each prefix of the ``/`` separated `path`, each a child of the previous one, and return the innermost group.
+        The chain is only built once for each distinct path.
+        """
+
+        try:
+            return self._group_chains[path]
+        except KeyError:
+            parent_name = None
+            group_label_parts = []
+            for part in path.split('/'):
+                group_label_parts.append(part.lower().replace(" ", ""))
+                result_gname = self._add_group('%s%s' % (self.get_option('group_prefix'), '/'.join(group_label_parts)))
+                if parent_name:
+                    self.inventory.add_child(parent_name, result_gname)
+                parent_name = result_gname
+            self._group_chains[path] = result_gname
+            return result_gname
+
+    def _lookup_variable(self, expression, variables):
+        """
+        Look up the value `expression` refers to in `variables`, without templating.
+        Returns the value and whether it was nested in another variable,
+        or ``_NEEDS_TEMPLATING`` if the expression or the value has to be templated.
+        """
+
+        if not self.get_option('optimize_constructed') or self.get_option('use_extra_vars') or not isinstance(expression, string_types):
+            return _NEEDS_TEMPLATING
+        try:
+            path = self._compiled_expressions[expression]
+        except KeyError:
+            path = self._compiled_expressions[expression] = _compile_expression(expression)
+        if path is None or path[0] not in variables:
+            return _NEEDS_TEMPLATING
+
+        value = variables[path[0]]
+        # the variable is templated as a whole when being accessed
+        if self._contains_template(value):
+            return _NEEDS_TEMPLATING
+        for is_attribute, key in path[1:]:
+            if isinstance(value, Mapping):
+                # attributes (like items) take precedence over the items of a mapping
+                if (is_attribute and hasattr(value, key)) or key not in value:
+                    return _NEEDS_TEMPLATING
+            elif isinstance(value, (list, tuple)):
+                if not isinstance(key, int) or key >= len(value):
+                    return _NEEDS_TEMPLATING
+            else:
+                return _NEEDS_TEMPLATING
+            value = value[key]
+        return value, len(path) > 1
+
+    def _contains_template(self, value):
+        """
+        Return whether `value` contains anything to template.
+        The result for mappings and lists is memoized, as the same host variable is looked up by many expressions.
+        """
+
+        if not isinstance(value, (Mapping, list, tuple)):
+            return _contains_template(value)
+        try:
+            # the value is kept in the memo, so its id is not reused
+            return self._template_checks[id(value)][1]
+        except KeyError:
+            if len(self._template_checks) >= TEMPLATE_CHECKS_MEMO_SIZE:
+                self._template_checks.clear()
+            contains_template = _contains_template(value)
+            self._template_checks[id(value)] = (value, contains_template)
+            return contains_template
+
+    def _compose(self, template, variables, disable_lookups=True):
+        result = self._lookup_variable(template, variables)
+        if result is not _NEEDS_TEMPLATING:
+            value, nested = result
+            # only return values templating would return unchanged
+            if _is_plain_string(value) or isinstance(value, bool):
+                composed = value
+            elif isinstance(value, (int, float)):
+                # nested values are turned into strings, top level variables are returned as they are
+                composed = to_text(value) if nested else value
+            elif value is None:
+                composed = '' if nested else None
+            elif isinstance(value, list) and all(isinstance(v, string_types) for v in value):
+                composed = list(value)
+            else:
+                composed = _NEEDS_TEMPLATING
+            if composed is not _NEEDS_TEMPLATING:
+                # keep the variables of the host available, as keyed_groups templates the parent_group with them
+                self.templar.available_variables = variables
+                return composed
+        return super(InventoryModule, self)._compose(template, variables, disable_lookups=disable_lookups)
+
+    def _add_host_to_composed_groups(self, groups, variables, host, strict=False, fetch_hostvars=True):
+        if not self.get_option('optimize_constructed') or not groups or not isinstance(groups, dict):
+            return super(InventoryModule, self)._add_host_to_composed_groups(groups, variables, host, strict=strict, fetch_hostvars=fetch_hostvars)
+
+        if fetch_hostvars:
+            variables = combine_vars(variables, self.inventory.get_host(host).get_vars())
+        templated_groups = {}
+        for group_name, conditional in groups.items():
+            result = self._lookup_variable(conditional, variables)
+            if result is _NEEDS_TEMPLATING:
+                templated_groups[group_name] = conditional
+            elif result[0]:
+                self.inventory.add_child(self._add_group(group_name), host)
+        if templated_groups:
+            super(InventoryModule, self)._add_host_to_composed_groups(templated_groups, variables, host, strict=strict, fetch_hostvars=False)
+
     def _populate_report_api(self):
         self.groups = dict()
         self.hosts = dict()
         try:
-            # We need a deep copy of the data, as we modify it below and this would also modify the cache
-            host_data = copy.deepcopy(self._post_request())
+            report = self._post_request()
+            # hosts are decoded while populating the inventory, so errors have to be found before it is touched
+            _validate_report(report)
+            host_data = _iter_report_hosts(report)
         except Exception as exc:
             self.display.warning("Failed to use Reports API, falling back to Hosts API: {0}".format(exc))
             self._populate_host_api()
@@ -499,12 +1273,11 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
 
             group_name = host.get('hostgroup_title', host.get('hostgroup_name'))
             if group_name:
-                group_name = to_safe_group_name('%s%s' % (self.get_option('group_prefix'), group_name.lower().replace(" ", "")))
-                group_name = self.inventory.add_group(group_name)
+                group_name = self._add_group('%s%s' % (self.get_option('group_prefix'), group_name.lower().replace(" ", "")))
                 self.inventory.add_child(group_name, host_name)
 
             host_params = host.pop('host_parameters', {})
-            fact_list = host.pop('facts', {})
+            fact_list = self._filter_facts(host.pop('facts', {}))
 
             if self.get_option('legacy_hostvars'):
                 hostvars = self._get_hostvars(host)
@@ -527,38 +1300,27 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             group = 'host_group'
             group_name = host.get(group)
             if group_name:
-                parent_name = None
-                group_label_parts = []
-                for part in group_name.split('/'):
-                    group_label_parts.append(part.lower().replace(" ", ""))
-                    gname = to_safe_group_name('%s%s' % (self.get_option('group_prefix'), '/'.join(group_label_parts)))
-                    result_gname = self.inventory.add_group(gname)
-                    if parent_name:
-                        self.inventory.add_child(parent_name, result_gname)
-                    parent_name = result_gname
-                self.inventory.add_child(result_gname, host_name)
+                self.inventory.add_child(self._add_group_chain(group_name), host_name)
 
             # Create ansible groups for environment, location and organization
             for group in ['environment', 'location', 'organization']:
                 val = host.get('%s' % group)
                 if val:
-                    safe_key = to_safe_group_name('%s%s_%s' % (
+                    env_lo_org = self._add_group('%s%s_%s' % (
                         to_text(self.group_prefix),
                         group,
                         to_text(val).lower()
                     ))
-                    env_lo_org = self.inventory.add_group(safe_key)
                     self.inventory.add_child(env_lo_org, host_name)
 
             for group in ['lifecycle_environment', 'content_view']:
                 val = content_facet_attributes.get('%s_name' % group)
                 if val:
-                    safe_key = to_safe_group_name('%s%s_%s' % (
+                    le_cv_group = self._add_group('%s%s_%s' % (
                         to_text(self.group_prefix),
                         group,
                         to_text(val).lower()
                     ))
-                    le_cv_group = self.inventory.add_group(safe_key)
                     self.inventory.add_child(le_cv_group, host_name)
             params = host_params
 
@@ -569,11 +1331,10 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
                     # Create Ansible groups for host collections
                     for hostcollection in hostcollections:
                         try:
-                            host_collection_group_name = to_safe_group_name('%shostcollection_%s' % (
+                            hostcollection_group = self._add_group('%shostcollection_%s' % (
                                 to_text(self.group_prefix),
                                 to_text(hostcollection).lower()
                             ))
-                            hostcollection_group = self.inventory.add_group(host_collection_group_name)
                             self.inventory.add_child(hostcollection_group, host_name)
                         except ValueError as e:
                             self.display.warning("Could not create groups for host collections for %s, skipping: %s" % (host_name, to_text(e)))
@@ -597,7 +1358,13 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
     def _populate_host_api(self):
         hostnames = self.get_option('hostnames')
         strict = self.get_option('strict')
-        for host in self._get_hosts():
+        internal_fields = self._get_internal_host_fields()
+        hosts = self._get_hosts()
+        prefetched = self._prefetch_host_details(hosts)
+        all_facts = None
+        if self.get_option('want_facts') and self._use_bulk_facts():
+            all_facts = self._get_all_facts()
+        for host in hosts:
             if not host:
                 continue
 
@@ -611,22 +1378,13 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             # create directly mapped groups
             group_name = host.get('hostgroup_title', host.get('hostgroup_name'))
             if group_name:
-                parent_name = None
-                group_label_parts = []
-                for part in group_name.split('/'):
-                    group_label_parts.append(part.lower().replace(" ", ""))
-                    gname = to_safe_group_name('%s%s' % (self.get_option('group_prefix'), '/'.join(group_label_parts)))
-                    result_gname = self.inventory.add_group(gname)
-                    if parent_name:
-                        self.inventory.add_child(parent_name, result_gname)
-                    parent_name = result_gname
-                self.inventory.add_child(result_gname, host_name)
+                self.inventory.add_child(self._add_group_chain(group_name), host_name)
 
             if self.get_option('legacy_hostvars'):
-                hostvars = self._get_hostvars(host)
+                hostvars = self._get_hostvars(host, omitted_vars=internal_fields)
                 self.inventory.set_variable(host_name, 'foreman', hostvars)
             else:
-                omitted_vars = ('name', 'hostgroup_title', 'hostgroup_name')
+                omitted_vars = ('name', 'hostgroup_title', 'hostgroup_name') + internal_fields
                 hostvars = self._get_hostvars(host, self.get_option('vars_prefix'), omitted_vars)
 
                 for k, v in hostvars.items():
@@ -635,9 +1393,14 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
                     except ValueError as e:
                         self.display.warning("Could not set host info hostvar for %s, skipping %s: %s" % (host, k, to_text(e)))
 
+            # params and host collections are both part of the host details, only fetch them once
+            host_data = {}
+            if self.get_option('want_params') or self.get_option('want_hostcollections'):
+                host_data = self._get_host_detail(prefetched, self._get_host_data_by_id, host['id'])
+
             # set host vars from params
             if self.get_option('want_params'):
-                params = self._get_all_params_by_id(host['id'])
+                params = self._get_all_params(host_data)
                 filtered_params = {}
                 for p in params:
                     if 'name' in p and 'value' in p:
@@ -655,19 +1418,21 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
 
             # set host vars from facts
             if self.get_option('want_facts'):
-                self.inventory.set_variable(host_name, 'foreman_facts', self._get_facts(host))
+                if all_facts is not None:
+                    facts = all_facts.get(host['name'], {})
+                else:
+                    facts = self._get_facts(host, prefetched)
+                self.inventory.set_variable(host_name, 'foreman_facts', self._filter_facts(facts))
 
             # create group for host collections
             if self.get_option('want_hostcollections'):
-                host_data = self._get_host_data_by_id(host['id'])
                 hostcollections = host_data.get('host_collections')
                 if hostcollections:
                     # Create Ansible groups for host collections
                     for hostcollection in hostcollections:
                         try:
-                            hostcollection_group = to_safe_group_name('%shostcollection_%s' % (self.get_option('group_prefix'),
-                                                                      hostcollection['name'].lower().replace(" ", "")))
-                            hostcollection_group = self.inventory.add_group(hostcollection_group)
+                            hostcollection_group = self._add_group('%shostcollection_%s' % (self.get_option('group_prefix'),
+                                                                   hostcollection['name'].lower().replace(" ", "")))
                             self.inventory.add_child(hostcollection_group, host_name)
                         except ValueError as e:
                             self.display.warning("Could not create groups for host collections for %s, skipping: %s" % (host_name, to_text(e)))
@@ -688,6 +1453,10 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
         self.foreman_url = self.get_option('url')
         self.cache_key = self.get_cache_key(path)
         self.use_cache = cache and self.get_option('cache')
+        self.use_url_cache = cache
+        if self.get_option('url_cache_dir'):
+            max_age = max(list(self._url_cache_ttls().values()) + [self.get_option('report_reuse_ttl') or 0])
+            self.url_cache = _UrlCache(self.get_option('url_cache_dir'), '%s %s' % (self.cache_key, self.get_option('user')), max_age, self.display)
 
         # actually populate inventory
         self._populate()
@@ -8,18 +8,23 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import errno
+import glob
 import hashlib
 import json
 import os
 import operator
 import re
+import shutil
+import tempfile
 import time
 import traceback
 
 from contextlib import contextmanager
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from functools import wraps
+from itertools import islice
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib, env_fallback
 from ansible.module_utils._text import to_bytes, to_native
@@ -43,6 +48,16 @@ except ImportError:
     HAS_APYPIE = False
     APYPIE_IMP_ERR = traceback.format_exc()
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 try:
     import yaml
     HAS_PYYAML = True
@@ -84,6 +99,18 @@ ENTITY_KEYS = dict(
 
 PER_PAGE = 2 << 31
 
+# maximal number of task ids in one foreman_tasks search, to keep the request URL short
+TASK_SEARCH_BATCH_SIZE = 100
+
+# stored next to the cached apidoc, must not end in the apidoc cache extension (.json)
+STATUS_CACHE_FILE = 'status.cache'
+
+# files of the split apidoc cache and the lock of the apidoc cache directory
+APIDOC_SPLIT_CACHE_INDEX = 'index.json'
+APIDOC_SPLIT_CACHE_RESOURCES = 'resources'
+APIDOC_CACHE_LOCK_FILE = 'apidoc.lock'
+APIDOC_CACHE_LOCK_POLL_INTERVAL = 0.1
+
 
 class NoEntity(object):
     pass
@@ -135,6 +162,461 @@ def _check_patch_needed(introduced_version=None, fixed_version=None, plugins=Non
     return decor
 
 
+class LazyApidocIndex(object):
+    """
+    Index of an apidoc stored in a split cache.
+
+    Only the list of resources is known upfront, the description of a resource is read
+    from its own cache file the first time the resource is accessed.
+
+    :param resources_dir: directory containing one JSON file per resource
+    :param resource_names: names of all resources of the apidoc
+    :param fallback: callable returning the description of a resource, used when its cache file can't be read
+    """
+
+    def __init__(self, resources_dir, resource_names, fallback=None):
+        self.resources_dir = resources_dir
+        self.fallback = fallback
+        self._resource_names = frozenset(resource_names)
+        self.loaded_resources = {}
+        self._methods = {}
+
+    def __contains__(self, name):
+        return name in self._resource_names
+
+    def __iter__(self):
+        return iter(self._resource_names)
+
+    def __len__(self):
+        return len(self._resource_names)
+
+    def keys(self):
+        """
+        Names of all resources of the apidoc.
+        """
+
+        return list(self._resource_names)
+
+    def __getitem__(self, name):
+        if name not in self._methods:
+            if name not in self._resource_names:
+                raise KeyError(name)
+            try:
+                with open(os.path.join(self.resources_dir, '{0}.json'.format(name)), 'r') as resource_file:
+                    resource = json.load(resource_file)
+            except (IOError, ValueError):
+                # the split cache was removed or replaced by another process
+                if self.fallback is None:
+                    raise
+                resource = self.fallback(name)
+            methods = {}
+            for method in resource['methods']:
+                methods.setdefault(method['name'], method)
+            self.loaded_resources[name] = resource
+            self._methods[name] = methods
+        return self._methods[name]
+
+
+class ForemanApiRoute(apypie.Route):
+    """
+    :class:`apypie.Route` computing the params in its path only once.
+    """
+
+    def __init__(self, path, method, description=""):
+        super(ForemanApiRoute, self).__init__(path, method, description)
+        self._params_in_path = [part[1:] for part in self.path.split('/') if part.startswith(':')]
+
+    @property
+    def params_in_path(self):
+        return self._params_in_path
+
+
+class ForemanApiAction(apypie.Action):
+    """
+    :class:`apypie.Action` looking itself up in the apidoc index of :class:`ForemanApi`
+    and reusing its pre-built routes and params.
+    """
+
+    @property
+    def apidoc(self):
+        return self.api.apidoc_index[self.resource][self.name]
+
+    @property
+    def routes(self):
+        return self.api.compiled_action(self.resource, self.name)['routes']
+
+    @property
+    def params(self):
+        return self.api.compiled_action(self.resource, self.name)['params']
+
+    def find_route(self, params=None):
+        param_keys = set(self.filter_empty_params(params).keys())
+        sorted_routes = self.api.compiled_action(self.resource, self.name)['sorted_routes']
+        for route in sorted_routes:
+            if set(route.params_in_path) <= param_keys:
+                return route
+        return sorted_routes[-1]
+
+
+class ForemanApiResource(apypie.Resource):
+    """
+    :class:`apypie.Resource` looking up its actions in the apidoc index of :class:`ForemanApi`.
+    """
+
+    @property
+    def actions(self):
+        return sorted(self.api.apidoc_index[self.name].keys())
+
+    def action(self, name):
+        if self.has_action(name):
+            return ForemanApiAction(name, self.name, self.api)
+        return super(ForemanApiResource, self).action(name)
+
+    def has_action(self, name):
+        return name in self.api.apidoc_index[self.name]
+
+
+class ForemanApi(apypie.Api):
+    """
+    :class:`apypie.Api` with an indexed apidoc, a split apidoc cache and a cache that can be shared
+    by parallel processes.
+
+    The apidoc is indexed by resource and action, and the :class:`apypie.Route` and :class:`apypie.Param`
+    objects of an action are only built once.
+    Next to the full cache file, the apidoc is stored as one file per resource, and only the resources
+    that are actually used are read from it.
+    Updates of the cache are done while holding a lock on the cache directory, and files are written atomically.
+
+    Accepts all parameters of :class:`apypie.Api`, and
+
+    :param apidoc_cache_lock_timeout: how long to wait for other processes updating the cache, in seconds. Defaults to `300`.
+    """
+
+    def __init__(self, **kwargs):
+        super(ForemanApi, self).__init__(**kwargs)
+        self._apidoc_cache_name_given = 'apidoc_cache_name' in kwargs
+        self.apidoc_cache_lock_timeout = kwargs.get('apidoc_cache_lock_timeout', 300)
+        self._cache_lock_depth = 0
+        self._apidoc_index = None
+        self._compiled_actions = {}
+        # called after validate_cache switched to the apidoc of a different server version
+        self.cache_changed_callback = None
+
+    @property
+    def apidoc(self):
+        if self._apidoc is None:
+            apidoc = self._load_apidoc()
+            if isinstance(self._apidoc_index, LazyApidocIndex):
+                # keep using the resources that were already loaded (and maybe modified) through the index
+                apidoc['docs']['resources'].update(self._apidoc_index.loaded_resources)
+            self._apidoc = apidoc
+        return self._apidoc
+
+    @property
+    def apidoc_index(self):
+        """
+        The apidoc indexed by resource and action name.
+
+        The index is built once from the full apidoc and references the same method
+        descriptions, so looking up an action does not require scanning the apidoc.
+        If a valid split cache is present, the full apidoc is not loaded at all and
+        only the resources that are actually accessed are read from the cache.
+
+        :returns: The index.
+        """
+
+        if self._apidoc_index is None and self._apidoc is None:
+            self._apidoc_index = self._load_split_cache()
+        if self._apidoc_index is None:
+            apidoc_index = {}
+            for resource_name, resource in self.apidoc['docs']['resources'].items():
+                methods = apidoc_index[resource_name] = {}
+                for method in resource['methods']:
+                    methods.setdefault(method['name'], method)
+            self._apidoc_index = apidoc_index
+        return self._apidoc_index
+
+    def compiled_action(self, resource_name, action_name):
+        """
+        The pre-built :class:`apypie.Route` and :class:`apypie.Param` objects of an action.
+
+        The objects are built on first access and reused for the lifetime of the loaded apidoc.
+
+        :param resource_name: name of the resource
+        :param action_name: name of the action
+
+        :returns: A dict with the ``routes``, ``sorted_routes`` and ``params`` of the action.
+        """
+
+        key = (resource_name, action_name)
+        if key not in self._compiled_actions:
+            method = self.apidoc_index[resource_name][action_name]
+            routes = [ForemanApiRoute(route['api_url'], route['http_method'], route['short_description']) for route in method['apis']]
+            self._compiled_actions[key] = {
+                'routes': routes,
+                'sorted_routes': sorted(routes, key=lambda route: [-1 * len(route.params_in_path), route.path]),
+                'params': [apypie.Param(**param) for param in method['params']],
+            }
+        return self._compiled_actions[key]
+
+    def reset_compiled_actions(self):
+        """
+        Drop the pre-built objects of all actions.
+
+        This needs to be called after the apidoc has been modified in place.
+        """
+
+        self._compiled_actions = {}
+
+    @property
+    def apidoc_split_cache_dir(self):
+        """
+        Full local path to the cached apidoc, split into one file per resource.
+        """
+
+        return '{0}.d'.format(self.apidoc_cache_file)
+
+    def _split_cache_dir_contents(self):
+        return glob.iglob(os.path.join(self.apidoc_cache_dir, '*{0}.d'.format(self.cache_extension)))
+
+    def validate_cache(self, cache_name=None):
+        if cache_name is not None and cache_name != self.apidoc_cache_name:
+            cache_name = os.path.basename(os.path.normpath(cache_name))
+            self._forget_apidoc()
+            # another process might already have retrieved the apidoc with the new name, keep it
+            with self._cache_lock():
+                self._remove_cache_files(keep=cache_name)
+            self.apidoc_cache_name = cache_name
+            if self.cache_changed_callback is not None:
+                self.cache_changed_callback()
+
+    def clean_cache(self):
+        self._forget_apidoc()
+        with self._cache_lock():
+            self._remove_cache_files()
+
+    def _forget_apidoc(self):
+        self._apidoc = None
+        self._apidoc_index = None
+        self.reset_compiled_actions()
+
+    def _remove_cache_files(self, keep=None):
+        kept_file = None
+        if keep is not None:
+            kept_file = os.path.join(self.apidoc_cache_dir, '{0}{1}'.format(keep, self.cache_extension))
+        for filename in self._cache_dir_contents():
+            if filename != kept_file:
+                try:
+                    os.unlink(filename)
+                except OSError as err:
+                    if err.errno != errno.ENOENT:
+                        raise
+        for dirname in self._split_cache_dir_contents():
+            if dirname != '{0}.d'.format(kept_file):
+                shutil.rmtree(dirname, ignore_errors=True)
+
+    def _ensure_cache_dir(self):
+        try:
+            os.makedirs(self.apidoc_cache_dir)
+        except OSError as err:
+            if err.errno != errno.EEXIST or not os.path.isdir(self.apidoc_cache_dir):
+                raise
+
+    @contextmanager
+    def _cache_lock(self):
+        """
+        Hold an exclusive lock on the cache directory, shared by all processes using the same directory.
+
+        The lock is reentrant within one :class:`ForemanApi` instance.
+        If the lock can't be acquired within `apidoc_cache_lock_timeout` seconds, or locking is not
+        supported on this platform, continue without it.
+        """
+
+        if self._cache_lock_depth:
+            self._cache_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._cache_lock_depth -= 1
+            return
+
+        lock_file = None
+        if fcntl is not None:
+            try:
+                self._ensure_cache_dir()
+                lock_file = open(os.path.join(self.apidoc_cache_dir, APIDOC_CACHE_LOCK_FILE), 'a')
+            except (IOError, OSError):
+                lock_file = None
+        if lock_file is not None:
+            deadline = time.time() + self.apidoc_cache_lock_timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except (IOError, OSError) as err:
+                    if err.errno not in (errno.EAGAIN, errno.EACCES) or time.time() >= deadline:
+                        lock_file.close()
+                        lock_file = None
+                        break
+                    time.sleep(APIDOC_CACHE_LOCK_POLL_INTERVAL)
+        self._cache_lock_depth = 1
+        try:
+            yield
+        finally:
+            self._cache_lock_depth = 0
+            if lock_file is not None:
+                # closing the file releases the lock
+                lock_file.close()
+
+    def _atomic_write(self, path, content):
+        """
+        Write a file by renaming a temporary file, so readers never see partially written content.
+        """
+
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'w') as tmp_file:
+                tmp_file.write(content)
+            getattr(os, 'replace', os.rename)(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    @property
+    def resources(self):
+        return sorted(self.apidoc_index.keys())
+
+    def has_resource(self, name):
+        """
+        Check whether the API has a given resource.
+
+        :param name: The name of the resource.
+        """
+
+        return name in self.apidoc_index
+
+    def resource(self, name):
+        if self.has_resource(name):
+            return ForemanApiResource(self, name)
+        return super(ForemanApi, self).resource(name)
+
+    def call(self, resource_name, action_name, params=None, headers=None, options=None, data=None, files=None):  # pylint: disable=too-many-arguments
+        if options is None:
+            options = {}
+        if params is None:
+            params = {}
+
+        action = ForemanApiResource(self, resource_name).action(action_name)
+        if not options.get('skip_validation', False):
+            action.validate(params, data, files)
+
+        return self._call_action(action, params, headers, data, files)
+
+    def _load_apidoc(self):
+        api_doc = super(ForemanApi, self)._load_apidoc()
+        if self._read_split_cache_index() is None:
+            with self._cache_lock():
+                if self._read_split_cache_index() is None:
+                    self._write_split_cache(api_doc)
+        return api_doc
+
+    def _cache_file_signature(self):
+        try:
+            stat = os.stat(self.apidoc_cache_file)
+        except OSError:
+            return None
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def _read_split_cache_index(self):
+        signature = self._cache_file_signature()
+        if signature is None:
+            return None
+        try:
+            with open(os.path.join(self.apidoc_split_cache_dir, APIDOC_SPLIT_CACHE_INDEX), 'r') as index_file:
+                index = json.load(index_file)
+        except (IOError, ValueError):
+            return None
+        if index.get('source') != signature:
+            return None
+        return index
+
+    def _load_split_cache(self):
+        index = self._read_split_cache_index()
+        if index is None:
+            return None
+        return LazyApidocIndex(os.path.join(self.apidoc_split_cache_dir, APIDOC_SPLIT_CACHE_RESOURCES), index['resources'],
+                               fallback=lambda name: self.apidoc['docs']['resources'][name])
+
+    def _write_split_cache(self, apidoc):
+        """
+        Store the apidoc as one compact file per resource, next to the full cache file.
+
+        The split cache is built in a temporary directory and moved into place once complete,
+        so other processes never see a partially written split cache.
+        The split cache is an optimization only, failing to write it is not an error.
+        Callers are expected to hold the cache lock.
+        """
+
+        signature = self._cache_file_signature()
+        if signature is None:
+            return
+        split_cache_dir = self.apidoc_split_cache_dir
+        resources = apidoc['docs']['resources']
+        tmp_dir = None
+        try:
+            tmp_dir = tempfile.mkdtemp(dir=self.apidoc_cache_dir, prefix='.')
+            resources_dir = os.path.join(tmp_dir, APIDOC_SPLIT_CACHE_RESOURCES)
+            os.makedirs(resources_dir)
+            for resource_name, resource in resources.items():
+                with open(os.path.join(resources_dir, '{0}.json'.format(resource_name)), 'w') as resource_file:
+                    resource_file.write(json.dumps(resource, separators=(',', ':')))
+            with open(os.path.join(tmp_dir, APIDOC_SPLIT_CACHE_INDEX), 'w') as index_file:
+                index_file.write(json.dumps({'source': signature, 'resources': sorted(resources.keys())}))
+            if os.path.exists(split_cache_dir):
+                # directories can't be replaced atomically, so move the old one out of the way first
+                old_dir = tempfile.mkdtemp(dir=self.apidoc_cache_dir, prefix='.')
+                os.rename(split_cache_dir, os.path.join(old_dir, 'old'))
+                shutil.rmtree(old_dir, ignore_errors=True)
+            os.rename(tmp_dir, split_cache_dir)
+        except (IOError, OSError):
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _retrieve_apidoc(self):
+        self._ensure_cache_dir()
+        with self._cache_lock():
+            # another process might have retrieved the apidoc while we were waiting for the lock,
+            # possibly storing it under the name the server told it
+            if not self._apidoc_cache_name_given and not os.path.exists(self.apidoc_cache_file):
+                self.apidoc_cache_name = self._find_cache_name(self.apidoc_cache_name)
+            try:
+                with open(self.apidoc_cache_file, 'r') as apidoc_file:
+                    return json.load(apidoc_file)
+            except (IOError, ValueError):
+                pass
+            response = self._download_apidoc()
+            self._atomic_write(self.apidoc_cache_file, json.dumps(response))
+            self._write_split_cache(response)
+        return response
+
+    def _download_apidoc(self):
+        response = None
+        if self.language:
+            response = self._retrieve_apidoc_call('/apidoc/v{0}.{1}.json'.format(self.api_version, self.language), safe=True)
+            language_family = self.language.split('_')[0]
+            if not response and language_family != self.language:
+                response = self._retrieve_apidoc_call('/apidoc/v{0}.{1}.json'.format(self.api_version, language_family), safe=True)
+        if not response:
+            try:
+                response = self._retrieve_apidoc_call('/apidoc/v{0}.json'.format(self.api_version))
+            except Exception as exc:
+                raise apypie.DocLoadingError("""Could not load data from {0}: {1}
+                  - is your server down?""".format(self.uri, exc))
+        if not response:
+            raise apypie.DocLoadingError("""Could not load data from {0}""".format(self.uri))
+        return response
+
+
 class KatelloMixin():
     """
     Katello Mixin to extend a :class:`ForemanAnsibleModule` (or any subclass) to work with Katello entities.
@@ -369,6 +851,10 @@ class ForemanAnsibleModule(AnsibleModule):
             username=dict(required=True, fallback=(env_fallback, ['FOREMAN_USERNAME', 'FOREMAN_USER'])),
             password=dict(required=True, no_log=True, fallback=(env_fallback, ['FOREMAN_PASSWORD'])),
             validate_certs=dict(type='bool', default=True, fallback=(env_fallback, ['FOREMAN_VALIDATE_CERTS'])),
+            status_cache_ttl=dict(type='int', default=0, fallback=(env_fallback, ['FOREMAN_STATUS_CACHE_TTL'])),
+            task_poll_min=dict(type='float', default=0.5, fallback=(env_fallback, ['FOREMAN_TASK_POLL_MIN'])),
+            task_poll_max=dict(type='float', default=30, fallback=(env_fallback, ['FOREMAN_TASK_POLL_MAX'])),
+            task_poll_backoff=dict(type='float', default=1.5, fallback=(env_fallback, ['FOREMAN_TASK_POLL_BACKOFF'])),
         )
         argument_spec.update(gen_args)
         argument_spec.update(kwargs.pop('argument_spec', {}))
@@ -387,14 +873,23 @@ class ForemanAnsibleModule(AnsibleModule):
         self._foremanapi_username = self.foreman_params.pop('username')
         self._foremanapi_password = self.foreman_params.pop('password')
         self._foremanapi_validate_certs = self.foreman_params.pop('validate_certs')
+        self._status_cache_ttl = self.foreman_params.pop('status_cache_ttl')
+        self.task_poll_min = self.foreman_params.pop('task_poll_min')
+        self.task_poll_max = self.foreman_params.pop('task_poll_max')
+        self.task_poll_backoff = self.foreman_params.pop('task_poll_backoff')
 
         if self._foremanapi_server_url.lower().startswith('http://'):
             self.warn("You have configured a plain HTTP server URL. All communication will happen unencrypted.")
         elif not self._foremanapi_server_url.lower().startswith('https://'):
             self.fail_json(msg="The server URL needs to be either HTTPS or HTTP!")
 
+        if self.task_poll_min <= 0 or self.task_poll_max < self.task_poll_min:
+            self.fail_json(msg="task_poll_min needs to be positive and not bigger than task_poll_max!")
+        if self.task_poll_backoff < 1:
+            self.fail_json(msg="task_poll_backoff needs to be at least 1!")
+
         self.task_timeout = 60
-        self.task_poll = 4
+        self.per_page = PER_PAGE
 
         self._thin_default = False
         self.state = 'undefined'
@@ -419,9 +914,7 @@ class ForemanAnsibleModule(AnsibleModule):
         self._changed = True
 
     def _patch_host_update(self):
-        _host_methods = self.foremanapi.apidoc['docs']['resources']['hosts']['methods']
-
-        _host_update = next(x for x in _host_methods if x['name'] == 'update')
+        _host_update = self.foremanapi.apidoc_index['hosts']['update']
         for param in ['location_id', 'organization_id']:
             _host_update_taxonomy_param = next((x for x in _host_update['params'] if x['name'] == param), None)
             if _host_update_taxonomy_param is not None:
@@ -447,13 +940,13 @@ class ForemanAnsibleModule(AnsibleModule):
             u'metadata': None,
             u'validator': u'',
         }
-        _subnet_methods = self.foremanapi.apidoc['docs']['resources']['subnets']['methods']
+        _subnet_methods = self.foremanapi.apidoc_index['subnets']
 
-        _subnet_create = next(x for x in _subnet_methods if x['name'] == 'create')
+        _subnet_create = _subnet_methods['create']
         _subnet_create_params_subnet = next(x for x in _subnet_create['params'] if x['name'] == 'subnet')
         _subnet_create_params_subnet['params'].append(_subnet_rex_proxies_parameter)
 
-        _subnet_update = next(x for x in _subnet_methods if x['name'] == 'update')
+        _subnet_update = _subnet_methods['update']
         _subnet_update_params_subnet = next(x for x in _subnet_update['params'] if x['name'] == 'subnet')
         _subnet_update_params_subnet['params'].append(_subnet_rex_proxies_parameter)
 
@@ -477,13 +970,13 @@ class ForemanAnsibleModule(AnsibleModule):
             u'metadata': None,
             u'validator': u'',
         }
-        _subnet_methods = self.foremanapi.apidoc['docs']['resources']['subnets']['methods']
+        _subnet_methods = self.foremanapi.apidoc_index['subnets']
 
-        _subnet_create = next(x for x in _subnet_methods if x['name'] == 'create')
+        _subnet_create = _subnet_methods['create']
         _subnet_create_params_subnet = next(x for x in _subnet_create['params'] if x['name'] == 'subnet')
         _subnet_create_params_subnet['params'].append(_subnet_externalipam_group_parameter)
 
-        _subnet_update = next(x for x in _subnet_methods if x['name'] == 'update')
+        _subnet_update = _subnet_methods['update']
         _subnet_update_params_subnet = next(x for x in _subnet_update['params'] if x['name'] == 'subnet')
         _subnet_update_params_subnet['params'].append(_subnet_externalipam_group_parameter)
 
@@ -494,9 +987,7 @@ class ForemanAnsibleModule(AnsibleModule):
         See https://projects.theforeman.org/issues/27538
         """
 
-        _organization_methods = self.foremanapi.apidoc['docs']['resources']['organizations']['methods']
-
-        _organization_update = next(x for x in _organization_methods if x['name'] == 'update')
+        _organization_update = self.foremanapi.apidoc_index['organizations']['update']
         _organization_update_params_organization = next(x for x in _organization_update['params'] if x['name'] == 'organization')
         _organization_update_params_organization['required'] = False
 
@@ -507,10 +998,10 @@ class ForemanAnsibleModule(AnsibleModule):
         See https://projects.theforeman.org/issues/30908
         """
 
-        _content_view_filter_rule_methods = self.foremanapi.apidoc['docs']['resources']['content_view_filter_rules']['methods']
+        _content_view_filter_rule_methods = self.foremanapi.apidoc_index['content_view_filter_rules']
 
-        _content_view_filter_rule_create = next(x for x in _content_view_filter_rule_methods if x['name'] == 'create')
-        _content_view_filter_rule_update = next(x for x in _content_view_filter_rule_methods if x['name'] == 'update')
+        _content_view_filter_rule_create = _content_view_filter_rule_methods['create']
+        _content_view_filter_rule_update = _content_view_filter_rule_methods['update']
 
         for param_name in ['uuid', 'errata_ids', 'date_type', 'module_stream_ids']:
             create_param = next((x for x in _content_view_filter_rule_create['params'] if x['name'] == param_name), None)
@@ -539,9 +1030,7 @@ class ForemanAnsibleModule(AnsibleModule):
             "validations": []
         }
 
-        _ak_methods = self.foremanapi.apidoc['docs']['resources']['activation_keys']['methods']
-
-        _ak_product_content = next(x for x in _ak_methods if x['name'] == 'product_content')
+        _ak_product_content = self.foremanapi.apidoc_index['activation_keys']['product_content']
 
         if next((x for x in _ak_product_content['params'] if x['name'] == 'per_page'), None) is None:
             _ak_product_content['params'].append(_per_page_param)
@@ -567,10 +1056,10 @@ class ForemanAnsibleModule(AnsibleModule):
             "validations": []
         }
 
-        _organization_methods = self.foremanapi.apidoc['docs']['resources']['organizations']['methods']
+        _organization_methods = self.foremanapi.apidoc_index['organizations']
 
-        _organization_create = next(x for x in _organization_methods if x['name'] == 'create')
-        _organization_update = next(x for x in _organization_methods if x['name'] == 'update')
+        _organization_create = _organization_methods['create']
+        _organization_update = _organization_methods['update']
         if next((x for x in _organization_create['params'] if x['name'] == 'ignore_types'), None) is None:
             _organization_create['params'].append(_ignore_types_param)
             _organization_update['params'].append(_ignore_types_param)
@@ -583,9 +1072,9 @@ class ForemanAnsibleModule(AnsibleModule):
         """
 
         for resource in ['products', 'repositories']:
-            methods = self.foremanapi.apidoc['docs']['resources'][resource]['methods']
+            methods = self.foremanapi.apidoc_index[resource]
             for action in ['create', 'update']:
-                resource_action = next(x for x in methods if x['name'] == action)
+                resource_action = methods[action]
                 for param in ['gpg_key_id', 'ssl_ca_cert_id', 'ssl_client_cert_id', 'ssl_client_key_id']:
                     resource_param = next(x for x in resource_action['params'] if x['name'] == param)
                     resource_param['allow_nil'] = True
@@ -599,13 +1088,16 @@ class ForemanAnsibleModule(AnsibleModule):
         """
         Connect to the Foreman API.
 
-        This will create a new ``apypie.Api`` instance using the provided server information,
+        This will create a new :class:`ForemanApi` instance using the provided server information,
         check that the API is actually reachable (by calling :func:`status`),
         apply any required patches to the apidoc and ensure the server has all the plugins installed
         that are required by the module.
+
+        If ``status_cache_ttl`` is set, a recent enough status response of the same server is
+        taken from the local status cache instead (see :func:`cached_status`).
         """
 
-        self.foremanapi = apypie.Api(
+        self.foremanapi = ForemanApi(
             uri=self._foremanapi_server_url,
             username=to_bytes(self._foremanapi_username),
             password=to_bytes(self._foremanapi_password),
@@ -613,7 +1105,7 @@ class ForemanAnsibleModule(AnsibleModule):
             verify_ssl=self._foremanapi_validate_certs,
         )
 
-        _status = self.status()
+        _status = self.cached_status()
         self.foreman_version = LooseVersion(_status.get('version', '0.0.0'))
         self.apply_apidoc_patches()
         self.check_required_plugins()
@@ -637,6 +1129,9 @@ class ForemanAnsibleModule(AnsibleModule):
         self._patch_organization_ignore_types_api()
         self._patch_products_repositories_allow_nil_credential()
 
+        # the patches modify the apidoc in place, so anything built from it before is outdated now
+        self.foremanapi.reset_compiled_actions()
+
     @_exception2fail_json(msg="Failed to connect to Foreman server: {0}")
     def status(self):
         """
@@ -648,8 +1143,57 @@ class ForemanAnsibleModule(AnsibleModule):
 
         return self.foremanapi.resource('home').call('status')
 
+    def cached_status(self):
+        """
+        Return the response of the ``status`` API endpoint, using the local status cache if possible.
+
+        Cached responses are keyed on the server URL and the name of the cached apidoc
+        (which is the ``Apipie-Checksum`` of the server once it has been validated)
+        and are used for at most ``status_cache_ttl`` seconds.
+
+        :return: The full API response
+        :rtype: dict
+        """
+
+        if self._status_cache_ttl <= 0:
+            return self.status()
+
+        cache_file = os.path.join(self.foremanapi.apidoc_cache_dir, STATUS_CACHE_FILE)
+        _status = _read_status_cache(cache_file, self._status_cache_key(), self._status_cache_ttl)
+        if _status is None:
+            _status = self.status()
+            # the status call validated the apidoc, so the cache key might have changed
+            _write_status_cache(cache_file, self._status_cache_key(), _status)
+        else:
+            # without the status call, the apidoc is only validated by the first real call
+            self.foremanapi.cache_changed_callback = self._refresh_cached_status
+        return _status
+
+    def _refresh_cached_status(self):
+        """
+        Query the status again after the apidoc of the server changed while a cached status was used.
+
+        The server was upgraded since the status was cached, so the cached status is outdated
+        and the apidoc patches have to be applied to the new apidoc.
+        """
+
+        self.foremanapi.cache_changed_callback = None
+        cache_file = os.path.join(self.foremanapi.apidoc_cache_dir, STATUS_CACHE_FILE)
+        try:
+            os.unlink(cache_file)
+        except OSError:
+            pass
+        _status = self.status()
+        _write_status_cache(cache_file, self._status_cache_key(), _status)
+        self.foreman_version = LooseVersion(_status.get('version', '0.0.0'))
+        self.apply_apidoc_patches()
+        self.check_required_plugins()
+
+    def _status_cache_key(self):
+        return {'server_url': self._foremanapi_server_url, 'apidoc': self.foremanapi.apidoc_cache_name}
+
     def _resource(self, resource):
-        if resource not in self.foremanapi.resources:
+        if not self.foremanapi.has_resource(resource):
             raise Exception("The server doesn't know about {0}, is the right plugin installed?".format(resource))
         return self.foremanapi.resource(resource)
 
@@ -685,7 +1229,7 @@ class ForemanAnsibleModule(AnsibleModule):
         return self._resource_call(resource, 'show', params)
 
     @_exception2fail_json(msg='Failed to list resource: {0}')
-    def list_resource(self, resource, search=None, params=None):
+    def list_resource(self, resource, search=None, params=None, per_page=None, parallel_pages=None, limit=None):
         """
         Execute the ``index`` action on an resource.
 
@@ -695,8 +1239,62 @@ class ForemanAnsibleModule(AnsibleModule):
         :type search: str, optional
         :param params: Lookup parameters (i.e. parent_id for nested entities)
         :type params: Union[dict,None], optional
+        :param per_page: Number of results to fetch per request, defaults to :attr:`per_page`
+        :type per_page: int, optional
+        :param parallel_pages: Number of pages to fetch concurrently once the total number of results is known
+        :type parallel_pages: int, optional
+        :param limit: Maximal number of results to return, further pages are not fetched
+        :type limit: int, optional
+        """
+
+        results = []
+        for page in self._list_resource_pages(resource, search, params, per_page, parallel_pages):
+            if not isinstance(page['results'], list):
+                # some endpoints (i.e. puppetclasses) return their results grouped in a dict
+                return page['results']
+            results.extend(page['results'])
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def iter_resource(self, resource, search=None, params=None, per_page=None, parallel_pages=None):
+        """
+        Execute the ``index`` action on an resource and yield the results one by one.
+
+        Unlike :func:`list_resource`, the next page is only fetched once all results of the
+        previous one have been consumed, so callers that stop early don't fetch all results.
+
+        :param resource: Plural name of the api resource to show
+        :type resource: str
+        :param search: Search string as accepted by the API to limit the results
+        :type search: str, optional
+        :param params: Lookup parameters (i.e. parent_id for nested entities)
+        :type params: Union[dict,None], optional
+        :param per_page: Number of results to fetch per request, defaults to :attr:`per_page`
+        :type per_page: int, optional
+        :param parallel_pages: Number of pages to fetch concurrently once the total number of results is known
+        :type parallel_pages: int, optional
         """
 
+        pages = self._list_resource_pages(resource, search, params, per_page, parallel_pages)
+        while True:
+            try:
+                page = self._next_page(pages)
+            except StopIteration:
+                return
+            if not isinstance(page['results'], list):
+                # some endpoints (i.e. puppetclasses) return their results grouped in a dict,
+                # which is yielded as a whole, like list_resource returns it
+                yield page['results']
+                return
+            for result in page['results']:
+                yield result
+
+    @_exception2fail_json(msg='Failed to list resource: {0}')
+    def _next_page(self, pages):
+        return next(pages)
+
+    def _list_resource_pages(self, resource, search=None, params=None, per_page=None, parallel_pages=None):
         if params is None:
             params = {}
         else:
@@ -704,11 +1302,65 @@ class ForemanAnsibleModule(AnsibleModule):
 
         if search is not None:
             params['search'] = search
-        params['per_page'] = PER_PAGE
+        if per_page is None:
+            per_page = self.per_page
+        params['per_page'] = per_page
 
         params = self._resource_prepare_params(resource, 'index', params)
+        # without paging support in the apidoc, all results are returned at once
+        index_params = [param.name for param in self._resource(resource).action('index').params]
+        paged = 'page' in index_params and 'per_page' in params
+
+        page_number = 1
+        fetched = 0
+        while True:
+            page = self._resource_call(resource, 'index', params)
+            yield page
+            results = page['results']
+            if not paged or not isinstance(results, list) or not results:
+                return
+            fetched += len(results)
+            subtotal = page.get('subtotal')
+            if isinstance(subtotal, int):
+                if fetched >= subtotal:
+                    return
+                if parallel_pages and parallel_pages > 1 and ThreadPoolExecutor is not None:
+                    # the number of pages is known now, fetch the remaining ones concurrently
+                    last_page = -(-subtotal // per_page)
+                    for page in self._fetch_pages(resource, params, range(page_number + 1, last_page + 1), parallel_pages):
+                        yield page
+                    return
+            elif len(results) < per_page:
+                return
+            page_number += 1
+            params['page'] = page_number
 
-        return self._resource_call(resource, 'index', params)['results']
+    def _fetch_pages(self, resource, params, page_numbers, workers):
+        """
+        Fetch the given pages of the ``index`` action with a pool of `workers` threads and yield them in order.
+        At most `workers` pages are requested ahead of the one currently consumed.
+        """
+
+        def fetch(page_number):
+            page_params = params.copy()
+            page_params['page'] = page_number
+            return self._resource_call(resource, 'index', page_params)
+
+        pending = deque()
+        page_numbers = iter(page_numbers)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for page_number in islice(page_numbers, workers):
+                pending.append(executor.submit(fetch, page_number))
+            while pending:
+                page = pending.popleft().result()
+                for page_number in islice(page_numbers, 1):
+                    pending.append(executor.submit(fetch, page_number))
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def find_resource(self, resource, search, params=None, failsafe=False, thin=None):
         list_params = {}
@@ -1183,7 +1835,7 @@ class ForemanAnsibleModule(AnsibleModule):
         return None
 
     def resource_action(self, resource, action, params, options=None, data=None, files=None,
-                        ignore_check_mode=False, record_change=True, ignore_task_errors=False):
+                        ignore_check_mode=False, record_change=True, ignore_task_errors=False, wait_for_task=True):
         resource_payload = self._resource_prepare_params(resource, action, params)
         if options is None:
             options = {}
@@ -1192,7 +1844,7 @@ class ForemanAnsibleModule(AnsibleModule):
             if ignore_check_mode or not self.check_mode:
                 result = self._resource_call(resource, action, resource_payload, options=options, data=data, files=files)
                 is_foreman_task = isinstance(result, dict) and 'action' in result and 'state' in result and 'started_at' in result
-                if is_foreman_task:
+                if is_foreman_task and wait_for_task:
                     result = self.wait_for_task(result, ignore_errors=ignore_task_errors)
         except Exception as e:
             msg = 'Error while performing {0} on {1}: {2}'.format(
@@ -1204,12 +1856,39 @@ class ForemanAnsibleModule(AnsibleModule):
         return result
 
     def wait_for_task(self, task, ignore_errors=False):
-        duration = self.task_timeout
+        """
+        Wait for a task to finish, failing the module if it doesn't within :attr:`task_timeout` seconds.
+
+        The task is checked again after :attr:`task_poll_min` seconds, the delay between checks then
+        grows by :attr:`task_poll_backoff` up to :attr:`task_poll_max` seconds.
+        Once the task reports progress, the delay is shortened to the estimated remaining time.
+
+        :param task: The task as returned by the API
+        :type task: dict
+        :param ignore_errors: Don't fail the module if the task did not succeed
+        :type ignore_errors: bool, optional
+        :return: The finished task
+        :rtype: dict
+        """
+
+        deadline = time.time() + self.task_timeout
+        delay = self.task_poll_min
+        first_progress = None
         while task['state'] not in ['paused', 'stopped']:
-            duration -= self.task_poll
-            if duration <= 0:
+            now = time.time()
+            if now >= deadline:
                 self.fail_json(msg="Timeout waiting for Task {0}".format(task['id']))
-            time.sleep(self.task_poll)
+
+            poll_delay = delay
+            progress = task.get('progress')
+            if isinstance(progress, (int, float)):
+                if first_progress is None:
+                    first_progress = (now, progress)
+                elif progress > first_progress[1]:
+                    remaining = (1 - progress) * (now - first_progress[0]) / (progress - first_progress[1])
+                    poll_delay = min(poll_delay, max(remaining, self.task_poll_min))
+            time.sleep(min(poll_delay, deadline - now))
+            delay = min(delay * self.task_poll_backoff, self.task_poll_max)
 
             resource_payload = self._resource_prepare_params('foreman_tasks', 'show', {'id': task['id']})
             task = self._resource_call('foreman_tasks', 'show', resource_payload)
@@ -1217,6 +1896,63 @@ class ForemanAnsibleModule(AnsibleModule):
             self.fail_json(msg='Task {0}({1}) did not succeed. Task information: {2}'.format(task['action'], task['id'], task['humanized']['errors']))
         return task
 
+    def wait_for_tasks(self, tasks, ignore_errors=False):
+        """
+        Wait for multiple tasks to finish, failing the module if they don't within :attr:`task_timeout` seconds.
+
+        The state of all pending tasks is checked with one ``foreman_tasks`` search per :data:`TASK_SEARCH_BATCH_SIZE` tasks,
+        with the same delays between checks as :func:`wait_for_task`.
+        Tasks without a known ``state`` are checked right away.
+
+        :param tasks: The tasks as returned by the API, at least their ``id``
+        :type tasks: list
+        :param ignore_errors: Don't fail the module if a task did not succeed
+        :type ignore_errors: bool, optional
+        :return: The finished tasks, in the same order as passed
+        :rtype: list
+        """
+
+        finished = {}
+        pending = []
+        for task in tasks:
+            if task.get('state') in ['paused', 'stopped']:
+                finished[task['id']] = task
+            elif task['id'] not in pending:
+                pending.append(task['id'])
+
+        deadline = time.time() + self.task_timeout
+        delay = self.task_poll_min
+        check_now = any('state' not in task for task in tasks)
+        while pending:
+            now = time.time()
+            if not check_now:
+                if now >= deadline:
+                    self.fail_json(msg="Timeout waiting for Tasks {0}".format(', '.join(pending)))
+                time.sleep(min(delay, deadline - now))
+                delay = min(delay * self.task_poll_backoff, self.task_poll_max)
+            check_now = False
+
+            found = {}
+            for start in range(0, len(pending), TASK_SEARCH_BATCH_SIZE):
+                search = 'id ^ ({0})'.format(','.join('"{0}"'.format(task_id) for task_id in pending[start:start + TASK_SEARCH_BATCH_SIZE]))
+                for task in self.list_resource('foreman_tasks', search):
+                    found[task['id']] = task
+            missing = [task_id for task_id in pending if task_id not in found]
+            if missing:
+                self.fail_json(msg="Could not find Tasks {0}".format(', '.join(missing)))
+            for task_id in pending:
+                if found[task_id]['state'] in ['paused', 'stopped']:
+                    finished[task_id] = found[task_id]
+            pending = [task_id for task_id in pending if task_id not in finished]
+
+        tasks = [finished[task['id']] for task in tasks]
+        failed = [task for task in tasks if task['result'] != 'success']
+        if not ignore_errors and failed:
+            self.fail_json(msg='Tasks did not succeed: {0}'.format('; '.join(
+                'Task {0}({1}) did not succeed. Task information: {2}'.format(task['action'], task['id'], task.get('humanized', {}).get('errors'))
+                for task in failed)), tasks=tasks)
+        return tasks
+
     def fail_from_exception(self, exc, msg):
         fail = {'msg': msg}
         if isinstance(exc, requests.exceptions.HTTPError):
@@ -1244,7 +1980,7 @@ class ForemanAnsibleModule(AnsibleModule):
             resource_name = _PLUGIN_RESOURCES[plugin_name]
         except KeyError:
             raise Exception("Unknown plugin: {0}".format(plugin_name))
-        return resource_name in self.foremanapi.resources
+        return self.foremanapi.has_resource(resource_name)
 
     def check_required_plugins(self):
         missing_plugins = []
@@ -1777,6 +2513,42 @@ def _recursive_dict_without_none(a_dict, exclude=None):
     return result
 
 
+def _read_status_cache(cache_file, key, ttl):
+    """
+    Read a status response from the status cache.
+    Returns `None` if there is no usable entry for `key` that is younger than `ttl` seconds.
+    """
+    try:
+        with open(cache_file) as cache:
+            cached = json.load(cache)
+        age = time.time() - cached['timestamp']
+        if cached['key'] == key and 0 <= age < ttl and isinstance(cached['status'], dict):
+            return cached['status']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_status_cache(cache_file, key, status):
+    """
+    Store a status response in the status cache.
+    The file is replaced atomically, failures to write it are ignored.
+    """
+    cached = {'key': key, 'timestamp': time.time(), 'status': status}
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix='.status-')
+        try:
+            with os.fdopen(fd, 'w') as cache:
+                json.dump(cached, cache)
+            os.rename(tmp_name, cache_file)
+        except Exception:
+            os.unlink(tmp_name)
+            raise
+    except (IOError, OSError, TypeError, ValueError):
+        pass
+
+
 def _is_resolved(spec, what):
     if spec.get('type') not in ('entity', 'entity_list'):
         return True
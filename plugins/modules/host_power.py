@@ -112,7 +112,7 @@ def main():
         # power_status endpoint was only added in foreman 1.22.0 per https://projects.theforeman.org/issues/25436
         # Delete this piece when versions below 1.22 are off common use
         # begin delete
-        if 'power_status' not in module.foremanapi.resource('hosts').actions:
+        if not module.foremanapi.resource('hosts').has_action('power_status'):
             params = {'id': module_params['name'], 'power_action': 'status'}
             power_state = module.resource_action('hosts', 'power', params=params, ignore_check_mode=True)
             power_state['state'] = 'on' if power_state['power'] == 'running' else 'off'
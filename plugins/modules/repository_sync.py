@@ -40,6 +40,14 @@ options:
       Name of the repository to sync
       If omitted, all repositories in I(product) are synched.
     type: str
+  wait:
+    description:
+      - Wait for the sync task to finish.
+      - When set to C(false), the started task is returned right away and can be waited for
+        later, for example with M(theforeman.foreman.wait_for_task).
+    type: bool
+    default: true
+    version_added: 4.3.0
 extends_documentation_fragment:
   - theforeman.foreman.foreman
   - theforeman.foreman.foreman.organization
@@ -55,9 +63,35 @@ EXAMPLES = '''
     repository: "My repository"
     product: "My Product"
     organization: "Default Organization"
+
+- name: "Start the sync of multiple products"
+  theforeman.foreman.repository_sync:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    product: "{{ item }}"
+    organization: "Default Organization"
+    wait: false
+  loop:
+    - "My Product"
+    - "My other Product"
+  register: syncs
+
+- name: "Wait for all syncs to finish"
+  theforeman.foreman.wait_for_task:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    tasks: "{{ syncs.results | map(attribute='task') | map(attribute='id') | list }}"
+    timeout: 43200
 '''
 
-RETURN = ''' # '''
+RETURN = '''
+task:
+  description: The sync task, finished unless I(wait=false)
+  returned: success
+  type: dict
+'''
 
 from ansible_collections.theforeman.foreman.plugins.module_utils.foreman_helper import KatelloAnsibleModule
 
@@ -68,6 +102,9 @@ def main():
             product=dict(type='entity', scope=['organization'], required=True),
             repository=dict(type='entity', scope=['product']),
         ),
+        argument_spec=dict(
+            wait=dict(type='bool', default=True),
+        ),
     )
 
     module.task_timeout = 12 * 60 * 60
@@ -75,10 +112,11 @@ def main():
     with module.api_connection():
         product = module.lookup_entity('product')
         repository = module.lookup_entity('repository')
+        wait = module.params['wait']
         if repository:
-            task = module.resource_action('repositories', 'sync', {'id': repository['id']})
+            task = module.resource_action('repositories', 'sync', {'id': repository['id']}, wait_for_task=wait)
         else:
-            task = module.resource_action('products', 'sync', {'id': product['id']})
+            task = module.resource_action('products', 'sync', {'id': product['id']}, wait_for_task=wait)
 
         module.exit_json(task=task)
 
@@ -55,6 +55,25 @@ options:
     type: bool
     default: false
     aliases: [ info ]
+  limit:
+    description:
+      - Maximum number of resources to return
+      - If not specified, all found resources are returned
+    type: int
+    version_added: 4.3.0
+  per_page:
+    description:
+      - Number of resources to fetch from the server per request
+      - If not specified, I(limit) resources are fetched at once, or all found resources if I(limit) is not specified either
+    type: int
+    version_added: 4.3.0
+  parallel_pages:
+    description:
+      - Number of pages of I(per_page) resources to fetch from the server concurrently
+      - The first page is always fetched alone, to learn the total number of resources
+      - If not specified, the pages are fetched one after another
+    type: int
+    version_added: 4.3.0
 notes:
   - Some resources don't support scoping and will return errors when you pass I(organization) or unknown data in I(params).
 extends_documentation_fragment:
@@ -117,6 +136,31 @@ EXAMPLES = '''
   register: result
 - debug:
     var: result
+
+- name: Get the first 100 packages of organization ACME, 50 at a time
+  theforeman.foreman.resource_info:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    resource: packages
+    organization: ACME
+    limit: 100
+    per_page: 50
+  register: result
+- debug:
+    var: result
+
+- name: Get all errata, fetching 4 pages of 500 errata at a time
+  theforeman.foreman.resource_info:
+    username: "admin"
+    password: "changeme"
+    server_url: "https://foreman.example.com"
+    resource: errata
+    per_page: 500
+    parallel_pages: 4
+  register: result
+- debug:
+    var: result
 '''
 
 RETURN = '''
@@ -138,6 +182,9 @@ def main():
             full_details=dict(type='bool', aliases=['info'], default='false'),
             params=dict(type='dict'),
             organization=dict(),
+            limit=dict(type='int'),
+            per_page=dict(type='int'),
+            parallel_pages=dict(type='int'),
         ),
     )
 
@@ -146,15 +193,22 @@ def main():
     search = module_params.get('search')
     params = module_params.get('params', {})
 
+    for option in ('limit', 'per_page', 'parallel_pages'):
+        if module_params.get(option, 1) < 1:
+            module.fail_json(msg="{0} must be a positive number".format(option))
+
     with module.api_connection():
-        if resource not in module.foremanapi.resources:
+        if not module.foremanapi.has_resource(resource):
             msg = "Resource '{0}' does not exist in the API. Existing resources: {1}".format(resource, ', '.join(sorted(module.foremanapi.resources)))
             module.fail_json(msg=msg)
         if 'organization' in module_params:
             params['organization_id'] = module.find_resource_by_name('organizations', module_params['organization'], thin=True)['id']
 
         if 'id' not in params:
-            response = module.list_resource(resource, search, params)
+            limit = module_params.get('limit')
+            per_page = module_params.get('per_page', limit)
+            parallel_pages = module_params.get('parallel_pages')
+            response = module.list_resource(resource, search, params, per_page=per_page, parallel_pages=parallel_pages, limit=limit)
 
             if module_params['full_details']:
                 resources = []
@@ -60,8 +60,8 @@ def main():
     with module.api_connection():
         status = module.status()
 
-        if 'ping' in module.foremanapi.resources:
-            if 'ping' in module.foremanapi.resource('ping').actions:
+        if module.foremanapi.has_resource('ping'):
+            if module.foremanapi.resource('ping').has_action('ping'):
                 ping_action = 'ping'
             else:
                 ping_action = 'index'
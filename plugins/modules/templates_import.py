@@ -169,7 +169,7 @@ def main():
         template_report = []
 
         template_types = ['provisioning_templates', 'report_templates', 'ptables']
-        if 'job_templates' in module.foremanapi.resources:
+        if module.foremanapi.has_resource('job_templates'):
             template_types.append('job_templates')
 
         for template_type in template_types:
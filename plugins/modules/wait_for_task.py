@@ -31,8 +31,18 @@ options:
   task:
     description:
       - Task id to wait for.
-    required: true
+      - Mutually exclusive with I(tasks).
+    required: false
     type: str
+  tasks:
+    description:
+      - List of task ids to wait for.
+      - The state of all tasks is checked with a single search request.
+      - Mutually exclusive with I(task).
+    required: false
+    type: list
+    elements: str
+    version_added: 4.3.0
   timeout:
     description:
       - How much time the task should take to be finished
@@ -67,16 +77,20 @@ EXAMPLES = '''
     server_url: "https://foreman.example.com"
     password: changeme
     username: admin
-    task: "{{ item }}"
+    tasks: "{{ tasks.resources | map(attribute='id') | list }}"
     timeout: 900
-  loop: "{{ tasks.resources | map(attribute='id') | list }}"
 '''
 
 RETURN = '''
 task:
   description: The finished task
-  returned: success
+  returned: success and I(task) was given
   type: dict
+tasks:
+  description: The finished tasks
+  returned: success and I(tasks) was given
+  type: list
+  elements: dict
 '''
 
 
@@ -90,13 +104,20 @@ class ForemanWaitForTask(ForemanAnsibleModule):
 def main():
     module = ForemanWaitForTask(
         argument_spec=dict(
-            task=dict(type="str", required=True),
+            task=dict(type="str", required=False),
+            tasks=dict(type="list", elements="str", required=False),
             timeout=dict(type="int", required=False, default=60),
-        )
+        ),
+        mutually_exclusive=[['task', 'tasks']],
+        required_one_of=[['task', 'tasks']],
     )
     module.task_timeout = module.foreman_params["timeout"]
     with module.api_connection():
 
+        if 'tasks' in module.foreman_params:
+            tasks = module.wait_for_tasks([{'id': task_id} for task_id in module.foreman_params["tasks"]])
+            module.exit_json(tasks=tasks)
+
         task = module.wait_for_task(module.show_resource(
             'foreman_tasks', module.foreman_params["task"]))
         module.exit_json(task=task, task_id=task['id'])
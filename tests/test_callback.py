@@ -1,16 +1,30 @@
+import gzip
 import os
 import re
 import json
+from functools import partial
+
+import pytest
+import requests
+import yaml
 
 try:
     from ansible.module_utils.compat.version import LooseVersion
 except ImportError:
     from distutils.version import LooseVersion
 
+from ansible import constants as C
+from ansible.executor.stats import AggregateStats
+from ansible.parsing.vault import VaultLib, VaultSecret
+from ansible.parsing.yaml.objects import AnsibleVaultEncryptedUnicode
+from ansible.utils.unsafe_proxy import wrap_var
+
+from plugins.callback import foreman as foreman_callback
+
 from .conftest import run_playbook, get_ansible_version
 
 
-def run_playbook_callback(tmpdir, report_type):
+def run_playbook_callback(tmpdir, report_type, spool_dir=''):
     extra_env = {}
     ansible_version = get_ansible_version()
     if LooseVersion(ansible_version) < LooseVersion('2.11'):
@@ -26,6 +40,7 @@ def run_playbook_callback(tmpdir, report_type):
     extra_env['FOREMAN_SSL_CERT'] = "/dev/zero"
     extra_env['FOREMAN_SSL_KEY'] = "/dev/zero"
     extra_env['FOREMAN_DIR_STORE'] = tmpdir.strpath
+    extra_env['FOREMAN_CALLBACK_SPOOL_DIR'] = spool_dir
     extra_env['ANSIBLE_VAULT_PASSWORD_FILE'] = os.path.join(os.getcwd(), 'tests', 'callback', 'vault-pass')
     playbook = os.path.join('..', 'callback', 'three_hosts')
     inventory = os.path.join(os.getcwd(), 'tests', 'callback', 'three_hosts')
@@ -55,8 +70,8 @@ def drop_incompatible_items(d):
     return dd
 
 
-def run_callback(tmpdir, report_type, vcrmode):
-    run = run_playbook_callback(tmpdir, report_type)
+def run_callback(tmpdir, report_type, vcrmode, spool_dir=''):
+    run = run_playbook_callback(tmpdir, report_type, spool_dir)
     assert run.rc == 0
     assert len(tmpdir.listdir()) > 0, "Directory with results is empty"
     for real_file in tmpdir.listdir(sort=True):
@@ -99,3 +114,278 @@ def test_callback_foreman(tmpdir, vcrmode):
 
 def test_callback_proxy(tmpdir, vcrmode):
     run_callback(tmpdir, "proxy", vcrmode)
+
+
+def test_callback_foreman_spooled(tmpdir, tmpdir_factory):
+    spool_dir = tmpdir_factory.mktemp('spool')
+    run_callback(tmpdir, "foreman", "replay", spool_dir.strpath)
+    assert spool_dir.listdir() == [], "The journal was not removed"
+    # the spooled results are reported exactly like the ones kept in memory
+    in_memory = tmpdir_factory.mktemp('in_memory')
+    run_callback(in_memory, "foreman", "replay")
+    assert [path.basename for path in tmpdir.listdir(sort=True)] == [path.basename for path in in_memory.listdir(sort=True)]
+
+
+def test_callback_proxy_spooled(tmpdir, tmpdir_factory):
+    spool_dir = tmpdir_factory.mktemp('spool')
+    run_callback(tmpdir, "proxy", "replay", spool_dir.strpath)
+    assert spool_dir.listdir() == [], "The journal was not removed"
+
+
+class FakeResponse(object):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError('{0} Error'.format(self.status_code))
+
+
+class FakeSession(object):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = []
+
+    def post(self, url, data, headers):
+        self.posts.append((url, data, headers))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return FakeResponse(response)
+
+
+def sender(responses, retries=0, compress=False):
+    callback = foreman_callback.CallbackModule()
+    callback.foreman_url = 'http://localhost'
+    callback.session = FakeSession(responses)
+    callback.compress = compress
+    callback.retries = retries
+    callback.retry_backoff = 0
+    callback.warnings = []
+    callback._display = type('Display', (object,), {'warning': lambda self, msg: callback.warnings.append(msg)})()
+    return callback
+
+
+def test_post_data_retries(monkeypatch):
+    monkeypatch.setattr(foreman_callback.time, 'sleep', lambda delay: None)
+    callback = sender([requests.exceptions.ConnectionError('refused'), 503, 201], retries=2)
+    callback._post_data('http://localhost/api/v2/config_reports', 'testhost', '{"a":1}')
+    assert len(callback.session.posts) == 3
+    assert callback.warnings == []
+
+
+def test_post_data_gives_up(monkeypatch):
+    monkeypatch.setattr(foreman_callback.time, 'sleep', lambda delay: None)
+    callback = sender([503, 503], retries=1)
+    callback._post_data('http://localhost/api/v2/config_reports', 'testhost', '{"a":1}')
+    assert len(callback.session.posts) == 2
+    assert len(callback.warnings) == 1
+
+
+def test_post_data_does_not_retry_client_errors():
+    callback = sender([422], retries=2)
+    callback._post_data('http://localhost/api/v2/config_reports', 'testhost', '{"a":1}')
+    assert len(callback.session.posts) == 1
+    assert len(callback.warnings) == 1
+
+
+def test_post_data_compressed():
+    callback = sender([201], compress=True)
+    callback._post_data('http://localhost/api/v2/config_reports', 'testhost', '{"a":1}')
+    _url, data, headers = callback.session.posts[0]
+    assert headers['content-encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(data).decode('utf-8')) == {'a': 1}
+
+
+def test_drop_nones():
+    result = {'changed': False, 'stdout': '', 'rc': None, 'invocation': {'module_args': {'a': None, 'b': [{}]}},
+              'results': [{'item': 1, 'msg': None}, None, {}], 'empty': {}}
+    assert foreman_callback.drop_nones(result) == {
+        'changed': False, 'stdout': '', 'invocation': {'module_args': {}}, 'results': [{'item': 1}, None, {}],
+    }
+
+
+class FakeTask(object):
+    check_mode = False
+
+    def __init__(self, name):
+        self.name = name
+
+    def serialize(self):
+        return {'name': self.name, 'action': 'command'}
+
+
+class FakeHost(object):
+    def __init__(self, name):
+        self.name = name
+
+    def get_name(self):
+        return self.name
+
+
+class FakeResult(object):
+    def __init__(self, host, task, result):
+        self._host = FakeHost(host)
+        self._task = FakeTask(task)
+        self._result = result
+
+
+class FakeStats(object):
+    def __init__(self, summaries):
+        self.processed = dict.fromkeys(summaries, 1)
+        self.summaries = summaries
+
+    def summarize(self, host):
+        return dict(self.summaries[host])
+
+
+def test_flush_tasks():
+    callback = foreman_callback.CallbackModule()
+    callback.report_type = 'foreman'
+    callback.spool_dir = ''
+    callback.dir_store = ''
+    callback.max_workers = 1
+    callback.flush_tasks = 2
+    callback.flush_interval = 0
+    sent = []
+    callback._send_data = lambda data_type, report_type, host, data, on_sent=None: sent.append((data_type, host, data))
+
+    callback.v2_playbook_on_task_start(FakeTask('one'), False)
+    callback.v2_runner_on_ok(FakeResult('testhost', 'one', {'changed': True, 'ansible_facts': {'a': 1}}))
+    callback.v2_playbook_on_task_start(FakeTask('two'), False)
+    callback.v2_runner_on_failed(FakeResult('testhost', 'two', {'failed': True}))
+    assert sent == []
+
+    callback.v2_playbook_on_task_start(FakeTask('three'), False)
+    assert [(data_type, host) for data_type, host, _data in sent] == [('facts', 'testhost'), ('report', 'testhost')]
+    report = sent[1][2]['config_report']
+    assert report['status'] == {'applied': 1, 'failed': 1, 'skipped': 0}
+    assert [log['log']['sources']['source'] for log in report['logs']] == ['one', 'two']
+
+    del sent[:]
+    callback.v2_runner_on_skipped(FakeResult('testhost', 'three', {'skipped': True}))
+    callback.v2_playbook_on_stats(FakeStats({'testhost': {'ok': 1, 'changed': 1, 'failures': 1, 'skipped': 1, 'unreachable': 0,
+                                                          'rescued': 0, 'ignored': 0}}))
+    assert [(data_type, host) for data_type, host, _data in sent] == [('report', 'testhost')]
+    report = sent[0][2]['config_report']
+    assert report['status'] == {'applied': 0, 'failed': 0, 'skipped': 1}
+    assert report['logs'] == []
+
+    # nothing is left to report
+    del sent[:]
+    callback.v2_playbook_on_stats(FakeStats({'testhost': {'ok': 1, 'changed': 1, 'failures': 1, 'skipped': 1, 'unreachable': 0,
+                                                          'rescued': 0, 'ignored': 0}}))
+    assert sent == []
+
+
+def run_facts(dir_store, digest_dir, facts):
+    callback = foreman_callback.CallbackModule()
+    callback.report_type = 'foreman'
+    callback.foreman_url = 'http://localhost'
+    callback.dir_store = dir_store.strpath
+    callback.fact_digests = foreman_callback.FactDigests(digest_dir.strpath, callback.foreman_url, ['ansible_date_time'], 0)
+    callback.facts['testhost'].update(facts)
+    callback.unsent_facts.add('testhost')
+    callback.send_facts()
+    callback.fact_digests.save()
+    sent = [f.basename for f in dir_store.listdir()]
+    for f in dir_store.listdir():
+        f.remove()
+    return sent
+
+
+def test_fact_digests(tmpdir):
+    dir_store = tmpdir.mkdir('dir_store')
+    digest_dir = tmpdir.mkdir('digests')
+    facts = {'ansible_hostname': 'testhost', 'ansible_date_time': {'epoch': '1'}}
+    assert run_facts(dir_store, digest_dir, facts) == ['testhost-facts.json']
+    assert sorted(f.basename for f in digest_dir.listdir()) == [foreman_callback.FACT_DIGESTS_FILE, foreman_callback.FACT_DIGESTS_LOCK_FILE]
+    assert run_facts(dir_store, digest_dir, facts) == []
+    assert run_facts(dir_store, digest_dir, dict(facts, ansible_date_time={'epoch': '2'})) == []
+    assert run_facts(dir_store, digest_dir, dict(facts, ansible_hostname='renamed')) == ['testhost-facts.json']
+
+
+def test_fact_digests_merge(tmpdir):
+    digests = foreman_callback.FactDigests(tmpdir.strpath, 'http://localhost', [], 0)
+    other = foreman_callback.FactDigests(tmpdir.strpath, 'http://localhost', [], 0)
+    digests.sent('one', 'digest one')
+    other.sent('two', 'digest two')
+    digests.save()
+    other.save()
+    with open(digests.path) as f:
+        stored = json.load(f)['http://localhost']
+    assert sorted(stored) == ['one', 'two']
+    assert [f.basename for f in tmpdir.listdir() if f.basename.startswith('.foreman-fact-digests-')] == []
+
+
+def test_fact_digests_save_failure(monkeypatch, tmpdir):
+    callback = configured_callback(monkeypatch, fact_digest_dir=tmpdir.join('missing').strpath)
+    callback.fact_digests.sent('testhost', 'digest')
+    callback.v2_playbook_on_stats(AggregateStats())
+    assert len(callback.warnings) == 1
+    assert 'Could not store the digests of the facts' in callback.warnings[0]
+
+
+def test_bulk_store(tmpdir):
+    callback = foreman_callback.CallbackModule()
+    callback.report_type = 'foreman'
+    callback.foreman_url = 'http://localhost'
+    callback.dir_store = tmpdir.strpath
+    callback.bulk_store = foreman_callback.BulkStore(tmpdir.strpath, compress=True, max_size=150, sync_records=1)
+    for host in ('one', 'two', 'three'):
+        callback.facts[host].update({'ansible_hostname': host, 'ansible_virtualization_role': None})
+        callback.unsent_facts.add(host)
+    callback.send_facts()
+    callback.bulk_store.close()
+
+    paths = sorted(tmpdir.listdir())
+    assert len(paths) > 1
+    assert all(path.basename.endswith('.ndjson.gz') for path in paths)
+    records = []
+    for path in paths:
+        with gzip.open(path.strpath, 'rt') as f:
+            records.extend(json.loads(line) for line in f)
+    assert [(record['type'], record['report_type'], record['host']) for record in records] == [
+        ('facts', 'foreman', 'one'), ('facts', 'foreman', 'two'), ('facts', 'foreman', 'three')]
+    assert records[0]['data']['facts']['ansible_facts'] == {'ansible_hostname': 'one', 'ansible_virtualization_role': None}
+
+
+def test_result_journal(tmpdir):
+    vault = VaultLib([('default', VaultSecret(b'changeme'))])
+    crypt = AnsibleVaultEncryptedUnicode.from_plaintext('admin', vault, VaultSecret(b'changeme'))
+    result = {'ansible_facts': {'geheim': 'admin', 'crypt': crypt, 'unsafe': wrap_var('THIS IS {{ crypt }}')}, 'changed': False}
+    values = [{'result': result, 'task': {'name': 'Vault fact'}, 'failed': False}, {'rc': None}]
+    journal = foreman_callback.ResultJournal(tmpdir.strpath)
+    for value in values:
+        journal.append('testhost', value)
+    spooled = journal.pop('testhost')
+    journal.close()
+    assert tmpdir.listdir() == []
+
+    # vault values are kept encrypted in the journal, and neither decrypted nor redacted
+    spooled_crypt = spooled[0]['result']['ansible_facts']['crypt']
+    assert isinstance(spooled_crypt, AnsibleVaultEncryptedUnicode)
+    assert spooled_crypt._ciphertext == crypt._ciphertext
+    assert spooled[0]['result']['ansible_facts']['unsafe'] == 'THIS IS {{ crypt }}'
+    dump_json = partial(json.dumps, sort_keys=True, cls=foreman_callback.AnsibleNoVaultJSONEncoder)
+    assert dump_json(spooled[0]) == dump_json(values[0])
+    assert spooled[1] == {'rc': None}
+
+
+def configured_callback(monkeypatch, **options):
+    C.config.initialize_plugin_configuration_definitions('callback', 'theforeman.foreman.foreman',
+                                                         yaml.safe_load(foreman_callback.DOCUMENTATION)['options'])
+    callback = foreman_callback.CallbackModule()
+    callback._load_name = 'theforeman.foreman.foreman'
+    callback.warnings = []
+    monkeypatch.setattr(callback._display, 'warning', callback.warnings.append)
+    callback.set_options(direct=dict(url='http://localhost', **options))
+    return callback
+
+
+@pytest.mark.parametrize('max_workers', [0, -2])
+def test_invalid_max_workers(monkeypatch, max_workers):
+    callback = configured_callback(monkeypatch, max_workers=max_workers)
+    assert callback.max_workers == 1
+    assert 'max_workers must be at least 1' in callback.warnings[0]
+    callback.get_executor().shutdown()
@@ -0,0 +1,105 @@
+import json
+import multiprocessing
+import time
+
+import py.path
+import pytest
+
+from plugins.module_utils.foreman_helper import ForemanApi, LazyApidocIndex
+
+
+APIDOC_FIXTURE = py.path.local(__file__).realpath() / '..' / 'fixtures' / 'apidoc' / 'domain.json'
+
+
+@pytest.fixture
+def api(tmpdir):
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=tmpdir.strpath)
+    with open(APIDOC_FIXTURE.strpath) as apidoc_file:
+        api._apidoc = json.load(apidoc_file)
+    return api
+
+
+def test_apidoc_index(api):
+    assert api.has_resource('domains')
+    assert not api.has_resource('not_a_resource')
+    assert api.resources == sorted(api.apidoc['docs']['resources'].keys())
+    assert api.resource('domains').actions == sorted(method['name'] for method in api.apidoc['docs']['resources']['domains']['methods'])
+
+
+def test_compiled_action_is_reused(api):
+    action = api.resource('domains').action('show')
+    assert action.params is api.resource('domains').action('show').params
+    assert action.find_route({'id': 1}).path == '/api/domains/:id'
+
+
+def test_reset_compiled_actions(api):
+    params = api.resource('domains').action('show').params
+    api.reset_compiled_actions()
+    assert api.resource('domains').action('show').params is not params
+
+
+@pytest.fixture
+def cached_api(tmpdir):
+    APIDOC_FIXTURE.copy(tmpdir.join('default.json'))
+    return ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=tmpdir.strpath)
+
+
+def test_split_cache_written_from_full_cache(cached_api, tmpdir):
+    assert isinstance(cached_api.apidoc_index, dict)
+    assert tmpdir.join('default.json.d', 'index.json').check()
+    assert tmpdir.join('default.json.d', 'resources', 'domains.json').check()
+
+
+def test_split_cache_loads_resources_lazily(cached_api):
+    cached_api.apidoc_index
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=cached_api.apidoc_cache_dir)
+    assert isinstance(api.apidoc_index, LazyApidocIndex)
+    assert api.has_resource('domains')
+    assert api.resource('domains').action('show').find_route({'id': 1}).path == '/api/domains/:id'
+    assert list(api.apidoc_index.loaded_resources.keys()) == ['domains']
+    assert api.apidoc['docs']['resources']['domains'] is api.apidoc_index.loaded_resources['domains']
+
+
+def test_split_cache_ignored_when_outdated(cached_api, tmpdir):
+    cached_api.apidoc_index
+    tmpdir.join('default.json').write('{"docs": {"resources": {}}}')
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=cached_api.apidoc_cache_dir)
+    assert api.resources == []
+
+
+def test_clean_cache_removes_split_cache(cached_api, tmpdir):
+    cached_api.apidoc_index
+    cached_api.clean_cache()
+    assert [path.basename for path in tmpdir.listdir()] == ['apidoc.lock']
+
+
+def test_retrieve_apidoc_reuses_cache_of_other_process(tmpdir, monkeypatch):
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=tmpdir.strpath)
+    # written by another process while we were waiting for the lock, using the name the server told it
+    APIDOC_FIXTURE.copy(tmpdir.join('apidoc-1234.json'))
+    monkeypatch.setattr(api, '_download_apidoc', lambda: pytest.fail('apidoc was downloaded again'))
+    assert api.has_resource('domains')
+    assert api.apidoc_cache_name == 'apidoc-1234'
+
+
+def _load_apidoc_in_process(cache_dir):
+    def download():
+        with open('{0}/downloads'.format(cache_dir), 'a') as downloads:
+            downloads.write('x')
+        time.sleep(0.5)
+        with open(APIDOC_FIXTURE.strpath) as apidoc_file:
+            return json.load(apidoc_file)
+
+    api = ForemanApi(uri='https://foreman.example.test', api_version=2, apidoc_cache_dir=cache_dir)
+    api._download_apidoc = download
+    assert api.has_resource('domains')
+
+
+def test_cold_cache_is_downloaded_once(tmpdir):
+    processes = [multiprocessing.Process(target=_load_apidoc_in_process, args=(tmpdir.strpath,)) for _ in range(5)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 5
+    assert tmpdir.join('downloads').read() == 'x'
@@ -0,0 +1,83 @@
+import json
+import os
+
+import py.path
+
+from plugins.module_utils.foreman_helper import ForemanAnsibleModule, ForemanApi, _read_status_cache, _write_status_cache, STATUS_CACHE_FILE
+
+APIDOC_FIXTURE = py.path.local(__file__).realpath() / '..' / 'fixtures' / 'apidoc' / 'domain.json'
+
+KEY = {'server_url': 'https://foreman.example.com', 'apidoc': 'abcdef'}
+STATUS = {'result': 'ok', 'status': 200, 'version': '3.9.0', 'api_version': 2}
+
+
+def test_status_cache_roundtrip(tmpdir):
+    cache_file = os.path.join(str(tmpdir), STATUS_CACHE_FILE)
+    assert _read_status_cache(cache_file, KEY, 60) is None
+    _write_status_cache(cache_file, KEY, STATUS)
+    assert _read_status_cache(cache_file, KEY, 60) == STATUS
+    assert os.listdir(str(tmpdir)) == [STATUS_CACHE_FILE]
+
+
+def test_status_cache_key_mismatch(tmpdir):
+    cache_file = os.path.join(str(tmpdir), STATUS_CACHE_FILE)
+    _write_status_cache(cache_file, KEY, STATUS)
+    assert _read_status_cache(cache_file, dict(KEY, apidoc='123456'), 60) is None
+    assert _read_status_cache(cache_file, dict(KEY, server_url='https://other.example.com'), 60) is None
+
+
+def test_status_cache_expired(tmpdir):
+    cache_file = os.path.join(str(tmpdir), STATUS_CACHE_FILE)
+    with open(cache_file, 'w') as cache:
+        json.dump({'key': KEY, 'timestamp': 0, 'status': STATUS}, cache)
+    assert _read_status_cache(cache_file, KEY, 60) is None
+
+
+def test_status_cache_broken(tmpdir):
+    cache_file = os.path.join(str(tmpdir), STATUS_CACHE_FILE)
+    with open(cache_file, 'w') as cache:
+        cache.write('{"key": ')
+    assert _read_status_cache(cache_file, KEY, 60) is None
+
+
+def test_status_cache_unwritable(tmpdir):
+    cache_file = os.path.join(str(tmpdir), 'missing', STATUS_CACHE_FILE)
+    _write_status_cache(cache_file, KEY, STATUS)
+    assert _read_status_cache(cache_file, KEY, 60) is None
+
+
+def test_cached_status_refreshed_after_upgrade(tmpdir):
+    APIDOC_FIXTURE.copy(tmpdir.join('oldchecksum.json'))
+    APIDOC_FIXTURE.copy(tmpdir.join('newchecksum.json'))
+    module = ForemanAnsibleModule.__new__(ForemanAnsibleModule)
+    module._foremanapi_server_url = KEY['server_url']
+    module._status_cache_ttl = 60
+    module.required_plugins = []
+    module.foremanapi = ForemanApi(uri=KEY['server_url'], api_version=2, apidoc_cache_dir=tmpdir.strpath, apidoc_cache_name='oldchecksum')
+    cache_file = os.path.join(str(tmpdir), STATUS_CACHE_FILE)
+    _write_status_cache(cache_file, module._status_cache_key(), STATUS)
+
+    status_calls = []
+    module.status = lambda: status_calls.append(1) or dict(STATUS, version='3.10.0')
+
+    def apply_apidoc_patches():
+        domain_create = module.foremanapi.apidoc_index['domains']['create']
+        domain_create['params'].append({'name': 'patched', 'full_name': 'patched', 'description': '', 'expected_type': 'string'})
+        module.foremanapi.reset_compiled_actions()
+    module.apply_apidoc_patches = apply_apidoc_patches
+
+    assert module.cached_status() == STATUS
+    assert status_calls == []
+    apply_apidoc_patches()
+
+    # the first real call tells about the upgraded server
+    module.foremanapi.validate_cache('newchecksum')
+    assert status_calls == [1]
+    assert str(module.foreman_version) == '3.10.0'
+    assert 'patched' in [param.name for param in module.foremanapi.resource('domains').action('create').params]
+    assert _read_status_cache(cache_file, KEY, 60) is None
+    assert _read_status_cache(cache_file, dict(KEY, apidoc='newchecksum'), 60) == dict(STATUS, version='3.10.0')
+
+    # only the first change after using the cached status needs a refresh
+    module.foremanapi.validate_cache('otherchecksum')
+    assert status_calls == [1]